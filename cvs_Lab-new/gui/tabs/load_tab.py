@@ -7,13 +7,14 @@ from tkinter import ttk, messagebox, filedialog, scrolledtext
 import os
 import sys
 import re
-import pandas as pd
 
 parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 from modules.data_loader import DataLoader
+from modules.background_loader import BackgroundExcelLoader
+from modules.header_validator import InvalidWorkbookError, format_verdict
 
 
 class LoadTab:
@@ -28,6 +29,8 @@ class LoadTab:
         self.app = app_reference
         self.frame = ttk.Frame(parent, padding="20")
         self._setup_ui()
+        # Φόρτωση Excel εκτός main thread
+        self.background_loader = BackgroundExcelLoader(self.frame)
 
     def _setup_ui(self):
         """Δημιουργία UI"""
@@ -42,13 +45,22 @@ class LoadTab:
         self.protocol_entry = ttk.Entry(file_frame, width=30, font=("Consolas", 10))
         self.protocol_entry.grid(row=0, column=1, padx=10, pady=5)
 
-        ttk.Button(file_frame, text="📥 Φόρτωση", command=self.load_file).grid(
-            row=0, column=2, padx=5
-        )
+        self.load_btn = ttk.Button(file_frame, text="📥 Φόρτωση", command=self.load_file)
+        self.load_btn.grid(row=0, column=2, padx=5)
 
-        ttk.Button(file_frame, text="🔍 Αναζήτηση", command=self.browse_file).grid(
-            row=0, column=3, padx=5
-        )
+        self.browse_btn = ttk.Button(file_frame, text="🔍 Αναζήτηση", command=self.browse_file)
+        self.browse_btn.grid(row=0, column=3, padx=5)
+
+        # Πρόοδος φόρτωσης
+        self.progress = ttk.Progressbar(file_frame, mode='determinate', maximum=100)
+        self.progress.grid(row=1, column=0, columnspan=2, sticky=tk.EW, pady=(10, 0))
+
+        self.cancel_btn = ttk.Button(file_frame, text="✖ Ακύρωση", command=self.cancel_load,
+                                     state=tk.DISABLED)
+        self.cancel_btn.grid(row=1, column=2, padx=5, pady=(10, 0))
+
+        self.progress_label = ttk.Label(file_frame, text="", font=("Segoe UI", 9))
+        self.progress_label.grid(row=2, column=0, columnspan=4, sticky=tk.W)
 
         # File info
         info_frame = ttk.LabelFrame(self.frame, text="Πληροφορίες Αρχείου", padding="10")
@@ -68,16 +80,10 @@ class LoadTab:
 
         try:
             loader = DataLoader()
-            try:
-                excel_file = os.path.join(loader.base_path, f"{protocol}.xls")
-                if not os.path.exists(excel_file):
-                    messagebox.showinfo("Σφάλμα", f"Το αρχείο δεν είναι .xls: {excel_file}")
-                    excel_file = os.path.join(loader.base_path, f"{protocol}.xlsx")
-                    if not os.path.exists(excel_file):
-                        messagebox.showerror("Σφάλμα", f"Το αρχείο δεν βρέθηκε .xls: {excel_file}")
-                        return
-            except Exception as e:
-                print(f'Exception : {e} (try to open find excel_file)')
+            excel_file = loader.find_protocol_file(protocol)
+            if excel_file is None:
+                messagebox.showerror("Σφάλμα", f"Το αρχείο δεν βρέθηκε: {protocol}")
+                return
 
             self.app.protocol_number = protocol.strip()
 
@@ -88,31 +94,94 @@ class LoadTab:
                 messagebox.showerror("Σφάλμα", "Μη έγκυρος αριθμός πρωτοκόλλου")
                 return
 
-            # Load data
-            self.app.excel_df = pd.read_excel(excel_file)
-            self.app.csv_first_4 = protocol[:4]
-            self.app.dash_part = result.group()
+            # Load data (στο background· το UI ενημερώνεται στο _on_loaded).
+            # Ο γρήγορος έλεγχος header γίνεται κι αυτός στο worker thread,
+            # πριν το πλήρες parsing
+            self._set_loading(True, f"⏳ Φόρτωση {os.path.basename(excel_file)}...")
+            self.background_loader.start(
+                excel_file,
+                on_done=lambda df: self._on_loaded(df, protocol, result.group()),
+                on_error=self._on_load_error,
+                on_progress=self._on_progress,
+                on_cancel=self._on_cancel,
+                on_verdict=self._on_verdict,
+                validate=True
+            )
+
+        except Exception as e:
+            self._on_load_error(e)
+
+    def _on_loaded(self, df, protocol, dash_part):
+        """Η φόρτωση ολοκληρώθηκε (main thread)"""
+        self._set_loading(False, f"✅ {len(df)} γραμμές")
+        self.progress.config(value=100)
+
+        self.app.excel_df = df
+        self.app.csv_first_4 = protocol[:4]
+        self.app.dash_part = dash_part
 
-            # Display info
-            info = f"""
+        # Display info
+        info = f"""
 Αρχείο: {protocol}.xls
 Γραμμές: {len(self.app.excel_df)}
 Στήλες: {', '.join(self.app.excel_df.columns.tolist())}
             """
 
-            self.file_info_text.config(state=tk.NORMAL)
-            self.file_info_text.delete(1.0, tk.END)
-            self.file_info_text.insert(1.0, info)
-            self.file_info_text.config(state=tk.DISABLED)
+        self.file_info_text.config(state=tk.NORMAL)
+        self.file_info_text.delete(1.0, tk.END)
+        self.file_info_text.insert(1.0, info)
+        self.file_info_text.config(state=tk.DISABLED)
+
+        #LOGS
+        self.app.logger.info(f"✅ Φορτώθηκε: {protocol}.xls ({len(self.app.excel_df)} γραμμές)")
+        messagebox.showinfo("Επιτυχία", f"Φορτώθηκε: {len(self.app.excel_df)} γραμμές")
 
-            #LOGS
-            self.app.logger.info(f"✅ Φορτώθηκε: {protocol}.xls ({len(self.app.excel_df)} γραμμές)")
-            messagebox.showinfo("Επιτυχία", f"Φορτώθηκε: {len(self.app.excel_df)} γραμμές")
+    def _on_verdict(self, verdict):
+        for warning in verdict['warnings']:
+            self.app.logger.info(f"⚠️ {warning}")
 
-        except Exception as e:
-            messagebox.showerror("Σφάλμα", str(e))
-            self.app.logger.error(f"❌ {str(e)}")
-            self.app.telemetry.record_error(str(e))
+    def _on_load_error(self, error):
+        if isinstance(error, InvalidWorkbookError):
+            self._set_loading(False, "❌ Μη έγκυρο αρχείο")
+            messagebox.showerror("Μη έγκυρο αρχείο", format_verdict(error.verdict))
+            self.app.logger.error(f"❌ Μη έγκυρο αρχείο: {error}")
+            return
+        self._set_loading(False, "❌ Σφάλμα φόρτωσης")
+        messagebox.showerror("Σφάλμα", str(error))
+        self.app.logger.error(f"❌ {str(error)}")
+        self.app.telemetry.record_error(str(error))
+
+    def _on_cancel(self):
+        self._set_loading(False, "✖ Ακυρώθηκε")
+        self.app.logger.info("✖ Η φόρτωση ακυρώθηκε")
+
+    def _on_progress(self, done, total):
+        if total:
+            if str(self.progress.cget('mode')) != 'determinate':
+                self.progress.stop()
+                self.progress.config(mode='determinate')
+            self.progress.config(value=min(100.0, 100.0 * done / total))
+            self.progress_label.config(text=f"⏳ {done}/{total} γραμμές")
+        else:
+            # Άγνωστο σύνολο γραμμών (π.χ. xlsx χωρίς διαστάσεις φύλλου)
+            if str(self.progress.cget('mode')) != 'indeterminate':
+                self.progress.config(mode='indeterminate')
+                self.progress.start()
+            self.progress_label.config(text=f"⏳ {done} γραμμές")
+
+    def _set_loading(self, loading, status):
+        """Ενεργοποίηση/απενεργοποίηση κουμπιών κατά τη φόρτωση"""
+        state = tk.DISABLED if loading else tk.NORMAL
+        self.load_btn.config(state=state)
+        self.browse_btn.config(state=state)
+        self.cancel_btn.config(state=tk.NORMAL if loading else tk.DISABLED)
+        self.progress.stop()
+        self.progress.config(mode='determinate', value=0)
+        self.progress_label.config(text=status)
+
+    def cancel_load(self):
+        """Ακύρωση της φόρτωσης σε εξέλιξη"""
+        self.background_loader.cancel()
 
     def browse_file(self):
         """Αναζήτηση αρχείου"""
@@ -128,6 +197,7 @@ class LoadTab:
 
     def reset(self):
         """Reset tab"""
+        self.background_loader.cancel()
         self.protocol_entry.delete(0, tk.END)
         self.file_info_text.config(state=tk.NORMAL)
         self.file_info_text.delete(1.0, tk.END)
@@ -0,0 +1,73 @@
+"""
+Headless μαζική επεξεργασία όλων των Excel αρχείων του BASE_PATH
+Windows Version
+"""
+import sys
+import os
+import argparse
+
+# Προσθήκη του parent directory στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.batch_processor import run_batch
+from modules.folder_watcher import watch_folder
+
+
+def main():
+    """Κύρια συνάρτηση εκτέλεσης"""
+    parser = argparse.ArgumentParser(
+        description="Μαζική επεξεργασία αρχείων Excel εργαστηρίου χωρίς GUI/input()"
+    )
+    parser.add_argument("--base-path", help="Φάκελος με τα Excel (προεπιλογή: config.BASE_PATH)")
+    parser.add_argument("--output", help="Φάκελος εξόδου (ένας υποφάκελος ανά πρωτόκολλο)")
+    parser.add_argument("--jobs", help="CSV/JSON με jobs (protocol,date,time σε DD-MM/HH:MM και προαιρετικά "
+                             "file,product,rep,instrument,drop_zero,stream,validate,output_dir)")
+    parser.add_argument("--time", help="Αρχική ώρα HH:MM για όσα jobs δεν ορίζουν δική τους")
+    parser.add_argument("--workers", type=int, help="Πλήθος διεργασιών (προεπιλογή: πυρήνες CPU)")
+    parser.add_argument("--keep-zero-rows", action="store_true",
+                        help="Να ΜΗΝ αφαιρούνται γραμμές με Fat=Protein=Lactose=0")
+    parser.add_argument("--stream", action="store_true",
+                        help="Streaming ανάγνωση/εγγραφή ανά chunk για πολύ μεγάλα αρχεία")
+    parser.add_argument("--validate-only", action="store_true",
+                        help="Μόνο γρήγορος έλεγχος header των αρχείων, χωρίς επεξεργασία")
+    parser.add_argument("--no-validate", action="store_true",
+                        help="Χωρίς έλεγχο header πριν το πλήρες parsing")
+    parser.add_argument("--watch", action="store_true",
+                        help="Συνεχής παρακολούθηση του φακέλου: κάθε νέο αρχείο επεξεργάζεται αυτόματα")
+    parser.add_argument("--poll", type=float, help="Διάστημα ελέγχου σε δευτερόλεπτα (--watch)")
+    parser.add_argument("--settle", type=float,
+                        help="Δευτερόλεπτα χωρίς αλλαγή size/mtime πριν την επεξεργασία (--watch)")
+    parser.add_argument("--keep-inputs", action="store_true",
+                        help="Τα επιτυχημένα αρχεία μένουν στη θέση τους αντί για done/ (--watch)")
+    args = parser.parse_args()
+
+    if args.watch:
+        watch_folder(
+            base_path=args.base_path,
+            output_root=args.output,
+            max_workers=args.workers,
+            initial_time=args.time,
+            drop_zero_nutrients=False if args.keep_zero_rows else None,
+            stream=args.stream,
+            poll_seconds=args.poll,
+            settle_seconds=args.settle,
+            move_done=not args.keep_inputs
+        )
+        return None
+
+    summary_path = run_batch(
+        base_path=args.base_path,
+        output_root=args.output,
+        job_list=args.jobs,
+        max_workers=args.workers,
+        initial_time=args.time,
+        drop_zero_nutrients=False if args.keep_zero_rows else None,
+        stream=args.stream,
+        validate=False if args.no_validate else None,
+        validate_only=args.validate_only
+    )
+    return summary_path
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark των reader engines (xls/xlsx/csv): ο ταχύτερος για κάθε μορφή
+αποθηκεύεται στο config.READER_ENGINES_PATH και χρησιμοποιείται από το DataLoader
+"""
+import sys
+import os
+import argparse
+
+# Προσθήκη του parent directory στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.data_loader import DataLoader, READER_ENGINES
+
+
+def main():
+    """Κύρια συνάρτηση εκτέλεσης"""
+    parser = argparse.ArgumentParser(description="Μέτρηση και επιλογή ταχύτερου reader engine")
+    parser.add_argument("files", nargs="*", help="Αρχεία για μέτρηση (προεπιλογή: τα μεγαλύτερα του BASE_PATH)")
+    parser.add_argument("--base-path", help="Φάκελος με τα Excel (προεπιλογή: config.BASE_PATH)")
+    parser.add_argument("--repeats", type=int, default=3, help="Επαναλήψεις ανά αρχείο")
+    args = parser.parse_args()
+
+    print("🔧 Διαθέσιμοι engines:")
+    for fmt, engines in READER_ENGINES.items():
+        print(f"  {fmt}: {', '.join(engines)}")
+
+    loader = DataLoader(args.base_path, use_cache=False)
+    results = loader.benchmark_engines(args.files or None, repeats=args.repeats)
+
+    if not results:
+        print("❌ Δεν βρέθηκαν αρχεία για μέτρηση.")
+        return
+
+    print("\n⏱️ Αποτελέσματα:")
+    for fmt, result in results.items():
+        timings = ", ".join(
+            f"{name}={'—' if t is None else f'{t * 1000:.1f}ms'}"
+            for name, t in result['timings'].items()
+        )
+        print(f"  {fmt} ({result['files']} αρχεία): {timings} → ✅ {result['engine']}")
+
+
+if __name__ == "__main__":
+    main()
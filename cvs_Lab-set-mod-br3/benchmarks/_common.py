@@ -0,0 +1,105 @@
+"""
+Κοινά helpers των benchmarks: χρονομέτρηση, σίγαση stdout και συνθετικά δεδομένα
+
+Τα benchmarks προσθέτουν τη ρίζα του project στο sys.path πριν κάνουν
+import αυτό το module.
+"""
+import os
+import time
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+from modules.data_processor import DataProcessor, format_decimal_strings
+from modules.time_handler import TimeHandler, MetadataGenerator, Schedule
+
+
+def best_of(func, repeats: int) -> float:
+    """Ο καλύτερος χρόνος (δευτερόλεπτα) από repeats εκτελέσεις του func"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@contextlib.contextmanager
+def quiet():
+    """Κρύβει τα μηνύματα (print) του κώδικα που μετριέται"""
+    with open(os.devnull, "w", encoding="utf-8") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        yield
+
+
+# ---------- ΣΥΝΘΕΤΙΚΑ ΔΕΔΟΜΕΝΑ ----------
+
+def decimal_column(rows: int, seed: int = 0) -> pd.Series:
+    """Τιμές με 3 δεκαδικά (όπως από τον αναλυτή) και ~1% NaN"""
+    rng = np.random.default_rng(seed)
+    values = np.round(rng.uniform(0, 8, rows), 3)
+    values[rng.random(rows) < 0.01] = np.nan
+    return pd.Series(values, name="Fat")
+
+
+def formatted_strings_frame(rows: int, columns, seed: int = 0) -> pd.DataFrame:
+    """Στήλες μορφοποιημένες με 2 δεκαδικά, ~1% NaN και ~0.1% τιμές με 5 δεκαδικά"""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for col in columns:
+        values = np.round(rng.uniform(0, 8, rows), 3)
+        values[rng.random(rows) < 0.01] = np.nan
+        column = format_decimal_strings(pd.Series(values), 2).astype(object)
+        bad = rng.random(rows) < 0.001
+        column[bad] = [f"{v:.5f}" for v in rng.uniform(0, 8, bad.sum())]
+        data[col] = column
+    return pd.DataFrame(data)
+
+
+def raw_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Στήλες όπως ενός Excel του αναλυτή, με ~1% διπλές γραμμές και ~0.5% κενό a/a"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "PH": np.round(rng.uniform(0, 1, rows), 2),
+        "fat": np.round(rng.uniform(0, 8, rows), 3),
+        "proteine": np.round(rng.uniform(0, 5, rows), 3),
+        "lactose": np.round(rng.uniform(0, 6, rows), 3),
+        "syal": rng.integers(0, 2, rows),
+        "freeze point": np.round(rng.uniform(-0.6, 0, rows), 5),
+        "a/a": np.arange(1, rows + 1, dtype="float64"),
+        "Unnamed: 7": np.full(rows, np.nan),
+    })
+    dup = np.flatnonzero(rng.random(rows) < 0.01)
+    df.iloc[dup[1:]] = df.iloc[dup[:-1]].to_numpy()
+    df.loc[rng.random(rows) < 0.005, "a/a"] = np.nan
+    return df
+
+
+def fixed_point_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Fat/Protein/Lactose όπως μετά το format_decimals (fixed-point, ~1% κενά)"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        col: np.where(rng.random(rows) < 0.01, np.nan, np.round(rng.uniform(0, 8, rows), 2))
+        for col in ["Fat", "Protein", "Lactose"]
+    })
+    processor = DataProcessor(df, verbose=False)
+    processor.format_decimals()
+    return processor.df
+
+
+def processed_frame(rows: int) -> pd.DataFrame:
+    """Fat/Protein/Lactose + FPD + TS/SNF όπως μετά το process_data"""
+    df = fixed_point_frame(rows)
+    df['FPD'] = pd.array(np.full(rows, 5200), dtype="Int64")
+    df.attrs['fixed_point']['FPD'] = (4, 3)
+    return DataProcessor(df, verbose=False).calculate_derived_values()
+
+
+def lazy_metadata(samples: int, schedule: Schedule) -> dict:
+    """Τα metadata του generate_time_metadata (lazy στήλες) για samples δείγματα"""
+    with quiet():
+        metadata = MetadataGenerator.generate_metadata(samples, "16/05/2025")
+        metadata['sample_ids'] = TimeHandler(samples).generate_sample_ids("1605", "-7")
+    metadata['sample_times'] = schedule.samples
+    return metadata
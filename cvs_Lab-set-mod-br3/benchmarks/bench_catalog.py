@@ -0,0 +1,95 @@
+"""
+Benchmark: αναζήτηση πρωτοκόλλου με os.listdir (παλιό) vs ProtocolCatalog
+
+Δημιουργεί δύο φακέλους με κοινά και διαφορετικά πρωτόκολλα που
+μοιράζονται την ίδια βάση SQLite, ελέγχει ότι κάθε φάκελος βλέπει μόνο
+τα δικά του αρχεία (refresh, lookup, search, count, find_protocol_file)
+και τυπώνει τους χρόνους αναζήτησης.
+
+    python benchmarks/bench_catalog.py
+    python benchmarks/bench_catalog.py --files 5000 --repeats 5
+"""
+import sys
+import os
+import argparse
+import tempfile
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from _common import best_of
+from modules.data_loader import DataLoader
+from modules.protocol_catalog import ProtocolCatalog
+
+
+def old_lookup(base_path: str, protocol: str):
+    """Η παλιά αναζήτηση: σάρωση του φακέλου"""
+    for name in os.listdir(base_path):
+        if os.path.splitext(name)[0] == protocol and name.lower().endswith(('.xls', '.xlsx')):
+            return os.path.join(base_path, name)
+    return None
+
+
+def make_folder(path: str, protocols):
+    os.makedirs(path)
+    for protocol in protocols:
+        # Το quick refresh δεν διαβάζει τα αρχεία, αρκεί να υπάρχουν
+        with open(os.path.join(path, f"{protocol}.xls"), "wb"):
+            pass
+
+
+def check_folders(folder_a: str, folder_b: str, db_path: str, files: int):
+    """Δύο φάκελοι στην ίδια βάση: κανένας δεν βλέπει ή σβήνει τα αρχεία του άλλου"""
+    with ProtocolCatalog(folder_a, db_path) as catalog_a, \
+            ProtocolCatalog(folder_b, db_path) as catalog_b:
+        assert catalog_a.refresh(with_summaries=False)['added'] == files
+        assert catalog_b.refresh(with_summaries=False)['added'] == files
+        assert catalog_a.refresh(with_summaries=False)['removed'] == 0, "Σβήστηκαν αρχεία του B"
+        assert catalog_a.count() == catalog_b.count() == files
+
+        # Κοινό πρωτόκολλο: ο καθένας το δικό του αρχείο
+        assert os.path.dirname(catalog_a.lookup("shared-0")) == os.path.abspath(folder_a)
+        assert os.path.dirname(catalog_b.lookup("shared-0")) == os.path.abspath(folder_b)
+        assert catalog_a.lookup("only-b-0") is None
+        assert catalog_a.summary("only-b-0") is None
+        assert all(e['path'].startswith(os.path.abspath(folder_a))
+                   for e in catalog_a.search("", limit=files * 2))
+
+    # Το DataLoader χρησιμοποιεί τον κατάλογο του config
+    config.CATALOG_PATH = db_path
+    loader = DataLoader(folder_a, use_cache=False)
+    assert loader.find_protocol_file("only-b-0") is None, "Βρέθηκε αρχείο άλλου φακέλου"
+    assert os.path.dirname(loader.find_protocol_file("shared-0")) == os.path.abspath(folder_a)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark καταλόγου πρωτοκόλλων")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    half = args.files // 2
+    with tempfile.TemporaryDirectory() as work_dir:
+        folder_a = os.path.join(work_dir, "A")
+        folder_b = os.path.join(work_dir, "B")
+        shared = [f"shared-{i}" for i in range(half)]
+        make_folder(folder_a, shared + [f"only-a-{i}" for i in range(args.files - half)])
+        make_folder(folder_b, shared + [f"only-b-{i}" for i in range(args.files - half)])
+        db_path = os.path.join(work_dir, "catalog.sqlite")
+
+        check_folders(folder_a, folder_b, db_path, args.files)
+
+        protocols = [f"shared-{i}" for i in range(0, half, max(1, half // 100))]
+        with ProtocolCatalog(folder_a, db_path) as catalog:
+            t_old = best_of(lambda: [old_lookup(folder_a, p) for p in protocols], args.repeats)
+            t_new = best_of(lambda: [catalog.lookup(p) for p in protocols], args.repeats)
+
+    print(f"{'files':>8} {'listdir':>12} {'catalog':>12} {'speedup':>8}")
+    print(f"{args.files:>8} {t_old / len(protocols) * 1e6:>10.0f}us "
+          f"{t_new / len(protocols) * 1e6:>10.0f}us {t_old / t_new:>7.1f}x")
+    print("✅ Κάθε φάκελος βλέπει μόνο τα δικά του αρχεία")
+
+
+if __name__ == "__main__":
+    main()
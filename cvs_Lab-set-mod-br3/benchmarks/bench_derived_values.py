@@ -0,0 +1,77 @@
+"""
+Benchmark: παράγωγες στήλες με μία πράξη Int64 ανά όρο (παλιό) vs DerivedFormula
+
+Το παλιό calculate_derived_values μετέτρεπε κάθε στήλη πηγής σε Series
+εκατοστών και υπολογίζε το TS και το SNF με ξεχωριστές πράξεις pandas. Με
+το config.DERIVED_COLUMNS οι στήλες πηγής μετατρέπονται μία φορά σε κοινά
+buffers NumPy. Μετρά TS + SNF και TS + SNF + --extra επιπλέον εκφράσεις,
+και ελέγχει ότι TS/SNF είναι ίδια.
+
+    python benchmarks/bench_derived_values.py
+    python benchmarks/bench_derived_values.py --rows 100000 --extra 8
+"""
+import sys
+import os
+import argparse
+
+import pandas as pd
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _common import best_of, fixed_point_frame
+from modules.data_processor import DataProcessor, compile_derived_formulas, rescale_fixed_point
+
+BASE = {
+    'TS': ('Fat + Protein + Lactose', 2),
+    'SNF': ('Protein + Lactose + 0.70', 2),
+}
+
+
+def old_derived(df: pd.DataFrame) -> pd.DataFrame:
+    """Το παλιό calculate_derived_values (μία Series ανά όρο)"""
+    df = df.copy()
+    fixed_point = df.attrs['fixed_point']
+    fat, protein, lactose = (rescale_fixed_point(df[col], fixed_point[col][0], 2)
+                             for col in ("Fat", "Protein", "Lactose"))
+    df['TS'] = fat + protein + lactose
+    df['SNF'] = protein + lactose + 70
+    return df
+
+
+def new_derived(df: pd.DataFrame, formulas) -> pd.DataFrame:
+    processor = DataProcessor(df, verbose=False)
+    return processor.calculate_derived_values(formulas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark παράγωγων στηλών")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--extra", type=int, default=4, help="Επιπλέον εκφράσεις")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    df = fixed_point_frame(args.rows)
+    base = compile_derived_formulas(BASE)
+    extra = dict(BASE)
+    for i in range(args.extra):
+        extra[f"X{i}"] = (f"Fat - Protein + {i}", 2) if i % 2 else (f"Protein / Lactose * {i + 1}", 4)
+    extended = compile_derived_formulas(extra)
+
+    expected = old_derived(df)
+    result = new_derived(df, base)
+    for col in BASE:
+        pd.testing.assert_series_equal(expected[col], result[col])
+
+    t_old = best_of(lambda: old_derived(df), args.repeats)
+    t_new = best_of(lambda: new_derived(df, base), args.repeats)
+    t_ext = best_of(lambda: new_derived(df, extended), args.repeats)
+    print(f"{args.rows} γραμμές")
+    print(f"  παλιό (TS, SNF):              {t_old * 1000:>7.1f} ms")
+    print(f"  DerivedFormula (TS, SNF):     {t_new * 1000:>7.1f} ms")
+    print(f"  DerivedFormula (+{args.extra} εκφράσεις): {t_ext * 1000:>7.1f} ms")
+    print("✅ Ίδια TS/SNF")
+
+
+if __name__ == "__main__":
+    main()
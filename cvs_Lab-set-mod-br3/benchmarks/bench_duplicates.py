@@ -0,0 +1,58 @@
+"""
+Benchmark: drop_duplicates + dropna (παλιό) vs DuplicateDetector (hash ανά γραμμή + έλεγχος a/a)
+
+Για 100k/1M/4M γραμμές με ~1% διπλές γραμμές, ~0.5% κενό a/a και μερικά
+διπλά a/a ελέγχει ότι μένουν οι ίδιες γραμμές και τυπώνει τους χρόνους
+(και ανά γραμμή) και το μέγεθος της αναφοράς.
+
+    python benchmarks/bench_duplicates.py
+    python benchmarks/bench_duplicates.py --rows 100000 1000000 --repeats 5
+"""
+import sys
+import os
+import argparse
+
+import numpy as np
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _common import best_of, raw_frame
+from modules.data_processor import DuplicateDetector
+
+
+def old_rows(df) -> np.ndarray:
+    """Οι γραμμές που κρατούσε το initial_filtering (θέσεις)"""
+    kept = df.drop_duplicates().dropna(subset=["a/a"])
+    return df.index.get_indexer(kept.index)
+
+
+def new_rows(df):
+    return DuplicateDetector().check(df, list(df.columns), "a/a", log=lambda *args: None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark εντοπισμού duplicates")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 4_000_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'report':>7} {'old':>10} {'hash':>10} {'ns/row':>7}")
+    for rows in args.rows:
+        df = raw_frame(rows)
+        # Μερικά διπλά a/a με διαφορετικές τιμές
+        df.loc[df.index[5::1000], "a/a"] = df["a/a"].to_numpy()[4::1000][:len(df.index[5::1000])]
+
+        kept, report = new_rows(df)
+        assert np.array_equal(kept, old_rows(df)), "Διαφορετικές γραμμές"
+
+        t_old = best_of(lambda: old_rows(df), args.repeats)
+        t_new = best_of(lambda: new_rows(df), args.repeats)
+        print(f"{rows:>10} {len(report):>7} {t_old * 1000:>8.1f}ms {t_new * 1000:>8.1f}ms "
+              f"{t_new / rows * 1e9:>7.0f}")
+
+    print("✅ Ίδιες γραμμές σε όλες τις μετρήσεις")
+
+
+if __name__ == "__main__":
+    main()
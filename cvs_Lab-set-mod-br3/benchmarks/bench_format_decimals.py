@@ -0,0 +1,49 @@
+"""
+Benchmark: DataProcessor.format_decimals (per-cell apply) vs format_decimal_strings (vectorised)
+
+Για 10k/100k/1M γραμμές με τιμές σαν του εργαστηρίου (και λίγα NaN) ελέγχει
+ότι τα δύο αποτελέσματα είναι ίδια και τυπώνει τους χρόνους.
+
+    python benchmarks/bench_format_decimals.py
+    python benchmarks/bench_format_decimals.py --rows 10000 100000 --repeats 5
+"""
+import sys
+import os
+import argparse
+
+import pandas as pd
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _common import best_of, decimal_column
+from modules.data_processor import DataProcessor, format_decimal_strings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark μορφοποίησης δεκαδικών")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'dec':>4} {'apply':>10} {'vectorised':>11} {'speedup':>8}")
+    for rows in args.rows:
+        column = decimal_column(rows)
+        for decimals in (2, 4):
+            expected = column.apply(lambda x: DataProcessor._smart_format(x, decimals))
+            result = format_decimal_strings(column, decimals)
+            pd.testing.assert_series_equal(expected, result, check_exact=True)
+
+            t_apply = best_of(
+                lambda: column.apply(lambda x: DataProcessor._smart_format(x, decimals)),
+                args.repeats
+            )
+            t_vec = best_of(lambda: format_decimal_strings(column, decimals), args.repeats)
+            print(f"{rows:>10} {decimals:>4} {t_apply * 1000:>8.1f}ms {t_vec * 1000:>9.1f}ms "
+                  f"{t_apply / t_vec:>7.1f}x")
+
+    print("✅ Ίδια αποτελέσματα σε όλες τις μετρήσεις")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: metadata ως λίστες + np.column_stack (παλιό) vs lazy στήλες (ConstantColumn/SampleIds)
+
+Για 100k/1M δείγματα φτιάχνει το filled DataFrame και με τους δύο τρόπους,
+ελέγχει ότι το CSV είναι ίδιο και τυπώνει χρόνο, αιχμή μνήμης (tracemalloc)
+και μνήμη του DataFrame.
+
+    python benchmarks/bench_metadata.py
+    python benchmarks/bench_metadata.py --samples 10000 1000000
+"""
+import sys
+import os
+import time
+import argparse
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from _common import processed_frame, lazy_metadata
+from modules.data_processor import output_column
+from modules.time_handler import Schedule
+from modules.output_generator import OutputGenerator
+
+
+def old_filled(df: pd.DataFrame, csv_first_4: str, dash_part: str, date: str, times) -> pd.DataFrame:
+    """Το παλιό create_filled_dataframe με τα παλιά generate_sample_ids/generate_metadata"""
+    n = len(df)
+    return pd.DataFrame(
+        np.column_stack([
+            [f"{csv_first_4}{dash_part} {i+1}" for i in range(n)],
+            [config.DEFAULT_REP] * n,
+            [config.DEFAULT_PRODUCT] * n,
+            *(output_column(df, col) for col in ('Fat', 'Protein', 'Lactose', 'FPD', 'TS', 'SNF')),
+            [date] * n,
+            times[:],
+            [""] * n,
+        ]),
+        columns=config.TARGET_COLUMN_ORDER
+    )
+
+
+def new_filled(df: pd.DataFrame, metadata: dict) -> pd.DataFrame:
+    return OutputGenerator(df, metadata, verbose=False).create_filled_dataframe()
+
+
+def measure(func):
+    """(δευτερόλεπτα, αιχμή MB, αποτέλεσμα)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark στηλών metadata")
+    parser.add_argument("--samples", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'samples':>10} {'old':>9} {'lazy':>9} {'old peak':>9} {'lazy peak':>10} "
+          f"{'old df':>8} {'lazy df':>8}")
+    for samples in args.samples:
+        df = processed_frame(samples)
+        schedule = Schedule("11:00", samples)
+
+        # Και οι δύο μετρήσεις περιλαμβάνουν την κατασκευή των metadata
+        t_old, peak_old, old = measure(
+            lambda: old_filled(df, "1605", "-7", "16/05/2025", schedule.samples))
+        t_new, peak_new, new = measure(lambda: new_filled(df, lazy_metadata(samples, schedule)))
+        assert old.to_csv(index=False) == new.to_csv(index=False), "Διαφορετικό CSV"
+
+        mem_old = old.memory_usage(deep=True).sum() / 2**20
+        mem_new = new.memory_usage(deep=True).sum() / 2**20
+        print(f"{samples:>10} {t_old * 1000:>7.0f}ms {t_new * 1000:>7.0f}ms {peak_old:>7.0f}MB "
+              f"{peak_new:>8.0f}MB {mem_old:>6.0f}MB {mem_new:>6.0f}MB")
+
+    print("✅ Ίδιο CSV σε όλες τις μετρήσεις")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: part files + FinalOutputAssembler (παλιό) vs FinalCsvWriter σε ένα πέρασμα
+
+Για 10k/100k/1M δείγματα γράφει το FINAL_OUTPUT.csv και με τους δύο
+τρόπους (από το ίδιο filled DataFrame), ελέγχει ότι τα αρχεία είναι ίδια
+και τυπώνει χρόνους και bytes που γράφτηκαν/διαβάστηκαν στο δίσκο.
+
+    python benchmarks/bench_output_writer.py
+    python benchmarks/bench_output_writer.py --samples 100000
+"""
+import sys
+import os
+import filecmp
+import argparse
+import tempfile
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _common import best_of, quiet, processed_frame, lazy_metadata
+from modules.time_handler import Schedule
+from modules.zero_manager import prepare_zero_data
+from modules.output_generator import (
+    OutputGenerator, FinalOutputAssembler, FinalCsvWriter, zero_block_text
+)
+
+
+def old_write(generator: OutputGenerator, zero_blocks, work_dir: str) -> str:
+    """save_parts_to_csv + assemble_final_csv + διαγραφή των parts (όπως το cleanup_parts)"""
+    parts_path = os.path.join(work_dir, "parts")
+    output_path = os.path.join(work_dir, "old.csv")
+    generator.parts_path = parts_path
+    generator.save_parts_to_csv()
+    FinalOutputAssembler(parts_path, output_path).assemble_final_csv(zero_blocks)
+    for name in os.listdir(parts_path):
+        os.remove(os.path.join(parts_path, name))
+    return output_path
+
+
+def new_write(generator: OutputGenerator, zero_blocks, work_dir: str) -> str:
+    output_path = os.path.join(work_dir, "new.csv")
+
+    def zero_block(index):
+        return zero_block_text(zero_blocks[index]) if index < len(zero_blocks) else None
+
+    with FinalCsvWriter(output_path, zero_block) as writer:
+        writer.write_rows(generator.get_filled_dataframe())
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark εγγραφής τελικού CSV")
+    parser.add_argument("--samples", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    date = "16/05/2025"
+    print(f"{'samples':>10} {'parts':>10} {'one pass':>10} {'speedup':>8} "
+          f"{'parts I/O':>10} {'one pass I/O':>13}")
+    for samples in args.samples:
+        df = processed_frame(samples)
+        schedule = Schedule("11:00", samples)
+        generator = OutputGenerator(df, lazy_metadata(samples, schedule), verbose=False)
+        generator.create_filled_dataframe()
+
+        with tempfile.TemporaryDirectory() as work_dir, quiet():
+            zero_blocks = prepare_zero_data(samples, date, schedule.zeros, output_dir=work_dir)
+            old_path = old_write(generator, zero_blocks, work_dir)
+            new_path = new_write(generator, zero_blocks, work_dir)
+            assert filecmp.cmp(old_path, new_path, shallow=False), "Διαφορετικό FINAL_OUTPUT.csv"
+
+            # Παλιό: parts γράφονται + διαβάζονται + τελικό (και μία ανάγνωση για _count_lines)
+            size = os.path.getsize(new_path)
+            t_old = best_of(lambda: old_write(generator, zero_blocks, work_dir), args.repeats)
+            t_new = best_of(lambda: new_write(generator, zero_blocks, work_dir), args.repeats)
+
+        print(f"{samples:>10} {t_old * 1000:>8.0f}ms {t_new * 1000:>8.0f}ms {t_old / t_new:>7.1f}x "
+              f"{size * 4 / 2**20:>8.0f}MB {size / 2**20:>11.0f}MB")
+
+    print("✅ Ίδιο FINAL_OUTPUT.csv σε όλες τις μετρήσεις")
+
+
+if __name__ == "__main__":
+    main()
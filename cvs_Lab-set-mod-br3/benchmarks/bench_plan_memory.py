@@ -0,0 +1,98 @@
+"""
+Benchmark: αιχμή μνήμης του process_data, αλυσίδα με αντίγραφα (παλιό) vs ProcessingPlan
+
+Η παλιά επεξεργασία έκανε df.copy() και μετά drop → drop_duplicates →
+dropna → reset_index → rename (ένα νέο DataFrame σε κάθε βήμα)· το plan
+φιλτράρει με ένα take χωρίς αντίγραφο της εισόδου. Μετρά με tracemalloc
+την αιχμή (πάνω από ό,τι υπήρχε πριν) και τον χρόνο για ένα φύλλο 500k
+γραμμών και ελέγχει ότι τα αποτελέσματα είναι ίδια. Χωρίς --file φτιάχνεται
+DataFrame με τη μορφή που επιστρέφει το load_excel (χωρίς projection)· με
+--file οι γραμμές ενός πραγματικού Excel επαναλαμβάνονται μέχρι --rows.
+
+    python benchmarks/bench_plan_memory.py
+    python benchmarks/bench_plan_memory.py --rows 200000 --file 16052024-7.xlsx
+"""
+import sys
+import os
+import time
+import argparse
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from _common import quiet, raw_frame
+from modules.data_loader import DataLoader
+from modules.data_processor import DataProcessor, process_data
+
+
+def frame_from_file(path: str, rows: int) -> pd.DataFrame:
+    """Οι γραμμές του αρχείου επαναλαμβάνονται (με νέο a/a) μέχρι rows"""
+    df = DataLoader().load_excel(path, project_columns=False)
+    df = pd.concat([df] * (rows // len(df) + 1), ignore_index=True).iloc[:rows]
+    if "a/a" in df.columns:
+        df["a/a"] = np.where(df["a/a"].isna(), np.nan, np.arange(1, len(df) + 1))
+    return df.reset_index(drop=True)
+
+
+def old_process(excel_df: pd.DataFrame) -> pd.DataFrame:
+    """Το παλιό process_data: αντίγραφο και ένα νέο DataFrame ανά βήμα φιλτραρίσματος"""
+    processor = DataProcessor(excel_df, verbose=False)  # df.copy()
+    processor._remove_column_after_aa()
+    df = processor.df
+    df.columns = df.columns.str.strip()
+    df = df.drop(columns=[c for c in config.COLS_TO_DELETE if c in df.columns])
+    df = df.drop_duplicates()
+    df = df.dropna(subset=["a/a"])
+    df = df.reset_index(drop=True)
+    df["a/a"] = df["a/a"].astype(int)
+    processor.df = df.rename(columns=config.COLUMN_RENAMES)
+
+    processor.format_decimals()
+    processor.calculate_derived_values()
+    return processor.get_processed_data()
+
+
+def measure(func, df: pd.DataFrame):
+    """(αποτέλεσμα, αιχμή MB, δευτερόλεπτα) του func(df)"""
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    with quiet():
+        result = func(df)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - before
+    return result, peak / 1024 ** 2, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark μνήμης του process_data")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--file", help="Excel για πραγματικά δεδομένα (αλλιώς συνθετικά)")
+    args = parser.parse_args()
+
+    source = frame_from_file(args.file, args.rows) if args.file else raw_frame(args.rows)
+    input_mb = source.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f"Είσοδος: {len(source)} γραμμές, {input_mb:.1f} MB")
+
+    tracemalloc.start()
+    results = {}
+    for label, func in (("copy chain", old_process), ("plan", process_data)):
+        df = source.copy()
+        result, peak, elapsed = measure(func, df)
+        pd.testing.assert_frame_equal(df, source)  # Η είσοδος δεν αλλάζει
+        del df
+        results[label] = result
+        print(f"{label:>10}: αιχμή {peak:>7.1f} MB, {elapsed * 1000:>7.0f} ms")
+    tracemalloc.stop()
+
+    pd.testing.assert_frame_equal(results["copy chain"], results["plan"], check_exact=True)
+    print("✅ Ίδιο αποτέλεσμα")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: generate_sample_times με timedelta/strftime ανά γραμμή (παλιό) vs vectorised
+
+Ο παλιός βρόχος αναπαράγεται εδώ για σύγκριση. Για 10k/100k/1M δείγματα
+ελέγχει ότι οι λίστες είναι ίδιες (και για αρχική ώρα κοντά στα
+μεσάνυχτα) και τυπώνει τους χρόνους.
+
+    python benchmarks/bench_schedule.py
+    python benchmarks/bench_schedule.py --samples 1000 100000 --time 23:50
+"""
+import sys
+import os
+import argparse
+import datetime
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from _common import best_of, quiet
+from modules.time_handler import TimeHandler
+
+
+def loop_times(num_samples: int, initial_time: str):
+    """Ο παλιός βρόχος του TimeHandler.generate_sample_times"""
+    current_time = datetime.datetime.strptime(initial_time, "%H:%M").replace(year=2000, month=1, day=1)
+    sample_times, zero_times = [], []
+
+    for _ in range(num_samples // config.BATCH_SIZE):
+        for _ in range(config.BATCH_SIZE):
+            current_time += datetime.timedelta(seconds=config.T_SAMPLE_INCREMENT)
+            sample_times.append(current_time.strftime("%H:%M"))
+        for _ in range(config.ZERO_BLOCK_ROWS):
+            current_time += datetime.timedelta(seconds=config.T_ZERO_INCREMENT)
+            zero_times.append(current_time.strftime("%H:%M"))
+
+    for _ in range(num_samples % config.BATCH_SIZE):
+        current_time += datetime.timedelta(seconds=config.T_SAMPLE_INCREMENT)
+        sample_times.append(current_time.strftime("%H:%M"))
+    return sample_times, zero_times
+
+
+def vectorised_times(num_samples: int, initial_time: str):
+    with quiet():
+        return TimeHandler(num_samples).generate_sample_times(initial_time)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark χρονοδιαγράμματος δειγμάτων")
+    parser.add_argument("--samples", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--time", default="11:00", help="Αρχική ώρα HH:MM")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'samples':>10} {'loop':>10} {'vectorised':>11} {'speedup':>8}")
+    for samples in args.samples:
+        for initial_time in (args.time, "23:50"):
+            assert loop_times(samples, initial_time) == vectorised_times(samples, initial_time), \
+                f"Διαφορετικοί χρόνοι ({initial_time})"
+
+        t_loop = best_of(lambda: loop_times(samples, args.time), args.repeats)
+        t_vec = best_of(lambda: vectorised_times(samples, args.time), args.repeats)
+        print(f"{samples:>10} {t_loop * 1000:>8.1f}ms {t_vec * 1000:>9.1f}ms {t_loop / t_vec:>7.1f}x")
+
+    print("✅ Ίδιοι χρόνοι σε όλες τις μετρήσεις")
+
+
+if __name__ == "__main__":
+    main()
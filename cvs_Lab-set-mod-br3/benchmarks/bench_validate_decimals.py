@@ -0,0 +1,58 @@
+"""
+Benchmark: έλεγχος δεκαδικών ανά κελί (παλιός βρόχος) vs find_decimal_errors (vectorised)
+
+Για 10k/100k/1M γραμμές μορφοποιημένων τιμών (όπως μετά το format_decimals,
+με ~0.1% τιμές που παραβιάζουν το όριο) ελέγχει ότι βρίσκονται τα ίδια
+σφάλματα και τυπώνει τους χρόνους.
+
+    python benchmarks/bench_validate_decimals.py
+    python benchmarks/bench_validate_decimals.py --rows 10000 100000 --repeats 5
+"""
+import sys
+import os
+import argparse
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _common import best_of, formatted_strings_frame
+from modules.data_processor import DataProcessor, find_decimal_errors
+
+COLUMNS = ["Fat", "Protein", "Lactose"]
+
+
+def loop_errors(df, max_decimals: int) -> list:
+    """Ο παλιός έλεγχος του DataProcessor._validate_decimals"""
+    errors = []
+    for col in COLUMNS:
+        for idx, val in df[col].items():
+            decs = DataProcessor._count_decimals(val)
+            if decs > max_decimals:
+                errors.append((col, idx, val, decs))
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ελέγχου δεκαδικών")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'errors':>7} {'loop':>10} {'vectorised':>11} {'speedup':>8}")
+    for rows in args.rows:
+        df = formatted_strings_frame(rows, COLUMNS)
+        expected = loop_errors(df, 2)
+        report = find_decimal_errors(df, COLUMNS, 2)
+        result = [tuple(r) for r in report[['column', 'row', 'value', 'decimals']].itertuples(index=False)]
+        assert result == expected, "Διαφορετικά σφάλματα"
+
+        t_loop = best_of(lambda: loop_errors(df, 2), args.repeats)
+        t_vec = best_of(lambda: find_decimal_errors(df, COLUMNS, 2), args.repeats)
+        print(f"{rows:>10} {len(report):>7} {t_loop * 1000:>8.1f}ms {t_vec * 1000:>9.1f}ms "
+              f"{t_loop / t_vec:>7.1f}x")
+
+    print("✅ Ίδια σφάλματα σε όλες τις μετρήσεις")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: zero blocks ως αντίγραφα DataFrame + to_csv (παλιό) vs ZeroBlockTemplate
+
+Για 100/1000/5000 blocks φτιάχνει το κείμενο όλων των zero blocks και με
+τους δύο τρόπους, ελέγχει ότι είναι ίδιο και τυπώνει τους χρόνους (και ανά block).
+
+    python benchmarks/bench_zero_blocks.py
+    python benchmarks/bench_zero_blocks.py --blocks 100 5000
+"""
+import sys
+import os
+import argparse
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from _common import best_of, quiet
+from modules.time_handler import Schedule
+from modules.zero_manager import ZeroDataManager
+
+
+def old_blocks(manager: ZeroDataManager, count: int, zero_times) -> str:
+    """create_zero_copies + update_zero_times + ένα to_csv ανά block"""
+    manager.create_zero_copies(count)
+    manager.update_zero_times(zero_times)
+    return "".join(
+        zero_df.to_csv(header=False, index=False, lineterminator="\n")
+        for zero_df in manager.get_zero_copies()
+    )
+
+
+def new_blocks(manager: ZeroDataManager, count: int, date: str, zero_times) -> str:
+    return "".join(manager.create_zero_blocks(count, date, zero_times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark zero blocks")
+    parser.add_argument("--blocks", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    date = "16/05/2025"
+    print(f"{'blocks':>8} {'old':>10} {'template':>10} {'us/block':>9} {'speedup':>8}")
+    with quiet():
+        manager = ZeroDataManager()
+        manager.load_zero_data(date)
+
+    for count in args.blocks:
+        zero_times = Schedule("11:00", count * config.BATCH_SIZE).zeros
+        with quiet():
+            assert old_blocks(manager, count, zero_times) == new_blocks(manager, count, date, zero_times), \
+                "Διαφορετικά zero blocks"
+            t_old = best_of(lambda: old_blocks(manager, count, zero_times), args.repeats)
+            t_new = best_of(lambda: new_blocks(manager, count, date, zero_times), args.repeats)
+        print(f"{count:>8} {t_old * 1000:>8.1f}ms {t_new * 1000:>8.1f}ms "
+              f"{t_new / count * 1e6:>9.1f} {t_old / t_new:>7.0f}x")
+
+    print("✅ Ίδια zero blocks σε όλες τις μετρήσεις")
+
+
+if __name__ == "__main__":
+    main()
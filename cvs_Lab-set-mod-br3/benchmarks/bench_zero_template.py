@@ -0,0 +1,70 @@
+"""
+Benchmark: ZeroDataManager.load_zero_data με pd.read_excel κάθε φορά (παλιό) vs zero template cache
+
+Μετρά το παλιό φόρτωμα, το πρώτο φόρτωμα από την on-disk cache (νέα
+διεργασία) και τα επόμενα από τη μνήμη, και ελέγχει ότι το zero
+DataFrame είναι ίδιο.
+
+    python benchmarks/bench_zero_template.py
+    python benchmarks/bench_zero_template.py --repeats 50
+"""
+import sys
+import os
+import argparse
+import tempfile
+
+import pandas as pd
+
+# Προσθήκη της ρίζας του project στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from _common import best_of, quiet
+from modules import zero_manager
+from modules.workbook_cache import WorkbookCache
+
+
+def old_load(date: str) -> pd.DataFrame:
+    """Το παλιό load_zero_data"""
+    zero_df = pd.read_excel(config.ZERO_PATH).fillna("")
+    zero_df = zero_df.dropna(axis=1, how="all")
+    zero_df['Date'] = zero_df['Date'].astype(str)
+    zero_df.loc[zero_df['Date'].str.strip() != '', 'Date'] = date
+    return zero_df
+
+
+def new_load(date: str) -> pd.DataFrame:
+    with quiet():
+        return zero_manager.ZeroDataManager().load_zero_data(date)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark zero template cache")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    date = "16/05/2025"
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Προσωρινή cache ώστε να μετράται και η πρώτη εγγραφή
+        config.WORKBOOK_CACHE_PATH = cache_dir
+        pd.testing.assert_frame_equal(new_load(date), old_load(date))
+
+        t_old = best_of(lambda: old_load(date), args.repeats)
+
+        def from_disk():
+            zero_manager._TEMPLATES.clear()  # όπως μια νέα διεργασία
+            new_load(date)
+        t_disk = best_of(from_disk, args.repeats)
+
+        new_load(date)
+        t_memory = best_of(lambda: new_load(date), args.repeats)
+        WorkbookCache(cache_dir).clear()
+
+    print(f"read_excel κάθε φορά: {t_old * 1000:>8.2f} ms")
+    print(f"on-disk cache:        {t_disk * 1000:>8.2f} ms")
+    print(f"μνήμη διεργασίας:     {t_memory * 1000:>8.2f} ms")
+    print("✅ Ίδιο zero DataFrame")
+
+
+if __name__ == "__main__":
+    main()
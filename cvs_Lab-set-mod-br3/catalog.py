@@ -0,0 +1,69 @@
+"""
+Κατάλογος πρωτοκόλλων του BASE_PATH: ενημέρωση και αναζήτηση από τη γραμμή εντολών
+"""
+import sys
+import os
+import argparse
+
+# Προσθήκη του parent directory στο path για σωστά imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.protocol_catalog import ProtocolCatalog
+
+
+def print_entry(entry):
+    """Τυπώνει μία εγγραφή του καταλόγου"""
+    if entry['error']:
+        details = f"❌ {entry['error']}"
+    elif entry['rows'] is None:
+        details = "(χωρίς σύνοψη ακόμα)"
+    else:
+        details = (f"{entry['rows']} γραμμές, a/a {entry['aa_min']}-{entry['aa_max']}, "
+                   f"{entry['missing_aa']} missing a/a, {len(entry['columns'])} στήλες")
+    print(f"  {entry['protocol']:<20} {details}")
+
+
+def main():
+    """Κύρια συνάρτηση εκτέλεσης"""
+    parser = argparse.ArgumentParser(description="Κατάλογος πρωτοκόλλων του BASE_PATH")
+    parser.add_argument("--base-path", help="Φάκελος με τα Excel (προεπιλογή: config.BASE_PATH)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    refresh = sub.add_parser("refresh", help="Ενημέρωση καταλόγου (μόνο αλλαγμένα αρχεία)")
+    refresh.add_argument("--quick", action="store_true", help="Χωρίς συνόψεις (μόνο ονόματα)")
+
+    search = sub.add_parser("search", help="Πρωτόκολλα που ξεκινούν με το prefix")
+    search.add_argument("prefix", nargs="?", default="")
+    search.add_argument("--limit", type=int, default=20)
+
+    show = sub.add_parser("show", help="Σύνοψη και διαδρομή ενός πρωτοκόλλου")
+    show.add_argument("protocol")
+
+    args = parser.parse_args()
+
+    with ProtocolCatalog(args.base_path) as catalog:
+        if args.command == "refresh":
+            stats = catalog.refresh(with_summaries=not args.quick)
+            print(f"✅ Κατάλογος: {catalog.count()} αρχεία "
+                  f"(+{stats['added']} νέα, {stats['updated']} αλλαγμένα, "
+                  f"-{stats['removed']} διαγραμμένα, {stats['summarized']} συνόψεις)")
+
+        elif args.command == "search":
+            results = catalog.search(args.prefix, args.limit)
+            if not results:
+                print("❌ Δεν βρέθηκαν πρωτόκολλα.")
+            for entry in results:
+                print_entry(entry)
+
+        elif args.command == "show":
+            entry = catalog.summary(args.protocol)
+            if entry is None:
+                print(f"❌ Το πρωτόκολλο δεν υπάρχει στον κατάλογο: {args.protocol}")
+                return
+            print(f"📄 {entry['path']}")
+            print_entry(entry)
+            print(f"  Στήλες: {', '.join(entry['columns'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,12 +14,32 @@ OUTPUT_PATH = r"C:/Users/user/Desktop/csv_Lab/cvs_Lab-set-mod-br"
 # Files/folders
 PARTS_PATH = APP_PATH / "parts"
 ZERO_PATH = APP_PATH / "zero" / "zero.xlsx"
+# Zero templates ανά product/όργανο (manifest.json· όσα δεν είναι εκεί χρησιμοποιούν το ZERO_PATH)
+ZERO_LIBRARY_PATH = APP_PATH / "zero" / "library"
 FINAL_OUTPUT_PATH = OUTPUT_PATH + "\\" + "final.csv"
 
+# Cache των parsed Excel αρχείων (.npz + .json ανά αρχείο)
+WORKBOOK_CACHE_PATH = APP_PATH / "cache" / "workbooks"
+WORKBOOK_CACHE_MAX_MB = 256
+USE_WORKBOOK_CACHE = True
+
+# Κατάλογος (SQLite) των αρχείων του BASE_PATH για γρήγορη αναζήτηση πρωτοκόλλων
+CATALOG_PATH = APP_PATH / "cache" / "catalog.sqlite"
+
+# Ταχύτερος reader engine ανά μορφή (xls/xlsx/csv) για αυτό το μηχάνημα,
+# όπως τον μέτρησε το benchmark_engines.py
+READER_ENGINES_PATH = APP_PATH / "cache" / "reader_engines.json"
+
 ZERO_REMOTE_URL = (
     "https://qhlpulnlyvarhmckbelq.supabase.co/"
     "storage/v1/object/public/zero/zero.xlsx"
 )
+# ETag/Last-Modified/checksum της τελευταίας λήψης του zero.xlsx
+ZERO_META_PATH = APP_PATH / "cache" / "zero.json"
+ZERO_REFRESH_SECONDS = 24 * 3600   # Έλεγχος για νεότερο zero.xlsx στο παρασκήνιο (0 = ποτέ)
+ZERO_DOWNLOAD_TIMEOUT = 10         # Δευτερόλεπτα ανά αίτημα
+ZERO_DOWNLOAD_RETRIES = 3          # Προσπάθειες ανά λήψη (με αυξανόμενη αναμονή)
+ZERO_RETRY_SECONDS = 10 * 60      # Αναμονή πριν από νέο έλεγχο μετά από αποτυχημένο/διακομμένο
 
 APP_ICON = "icon2.ico"
 
@@ -34,10 +54,24 @@ APP_ICON = "icon2.ico"
 # Στήλες για έλεγχο δεκαδικών
 TWO_DECIMAL_COLS = ["Fat", "Protein", "Lactose"]
 FOUR_DECIMAL_COLS = ["FPD"]
+# Αναφορά σφαλμάτων δεκαδικών (γράφεται δίπλα στο τελικό CSV, μόνο αν υπάρχουν σφάλματα)
+DECIMAL_REPORT_NAME = "decimal_report.csv"
+# Αναφορά γραμμών που αφαιρέθηκαν ως διπλές και διπλών a/a (μόνο αν υπάρχουν)
+DUPLICATE_REPORT_NAME = "duplicate_report.csv"
 
 # Στήλες προς διαγραφή
 COLS_TO_DELETE = ["PH", "syal", "som cells", "water", "omx", "antibiotics"]
 
+# Στήλες που δεν διαγράφονται ποτέ ως "άχρηστη στήλη μετά το a/a"
+PROTECTED_COLS = ["Fat", "Protein", "Lactose", "FPD", "freeze point", "proteine", "fat", "lactose"]
+
+# Ανάγνωση Excel μόνο με τις στήλες που χρειάζεται η επεξεργασία
+PROJECT_EXCEL_COLUMNS = True
+
+# Γρήγορος έλεγχος header (+ δείγμα γραμμών) πριν το πλήρες parsing
+VALIDATE_BEFORE_PARSE = True
+VALIDATION_SAMPLE_ROWS = 20
+
 # Αφαίρεση γραμμών με μηδενικά nutrients
 DROP_ZERO_NUTRIENTS = True
 
@@ -49,6 +83,14 @@ COLUMN_RENAMES = {
     'freeze point': 'FPD'
 }
 
+# Παράγωγες στήλες: {στήλη: (έκφραση, δεκαδικά)}, με τη σειρά υπολογισμού
+# Εκφράσεις με ονόματα στηλών (μετά τις μετονομασίες), αριθμούς, + - * / και παρενθέσεις
+DERIVED_COLUMNS = {
+    'TS': ('Fat + Protein + Lactose', 2),       # Total Solids
+    'SNF': ('Protein + Lactose + 0.70', 2),     # Solids Non-Fat
+    # 'Casein_ratio': ('Casein / Protein', 4),
+}
+
 # ============================================================
 # ΠΑΡΑΜΕΤΡΟΙ ΧΡΟΝΙΣΜΟΥ
 # ============================================================
@@ -58,6 +100,17 @@ T_SAMPLE_INCREMENT = 43
 T_ZERO_INCREMENT = 19
 ZERO_BLOCK_ROWS = 8            # Γραμμές ανά zero block
 ZERO_ROW_INDEX = [1, 2, 3, 4, 5, 6, 7, 9]  # Indices για update timestamps
+STREAM_CHUNK_BATCHES = 10      # Batches ανά chunk στη streaming ανάγνωση
+OUTPUT_BUFFER_SIZE = 1 << 20   # Buffer (bytes) εγγραφής του τελικού CSV
+
+# ============================================================
+# ΠΑΡΑΜΕΤΡΟΙ WATCHER (batch.py --watch)
+# ============================================================
+
+WATCH_POLL_SECONDS = 2         # Κάθε πόσο ελέγχεται ο φάκελος
+WATCH_SETTLE_SECONDS = 5       # Πόση ώρα πρέπει να μείνουν ίδια size/mtime
+WATCH_DONE_DIR = "done"        # Υποφάκελος του BASE_PATH για τα επεξεργασμένα
+WATCH_FAILED_DIR = "failed"    # Υποφάκελος του BASE_PATH για τα αποτυχημένα
 
 # ============================================================
 # ΠΡΟΕΠΙΛΕΓΜΕΝΕΣ ΤΙΜΕΣ
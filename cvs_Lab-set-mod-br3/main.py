@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from modules.data_loader import load_data
-from modules.data_processor import process_data
+from modules.data_processor import process_data, write_decimal_report, write_duplicate_report
 from modules.time_handler import generate_time_metadata
 from modules.zero_manager import prepare_zero_data
 from modules.output_generator import generate_output
@@ -35,7 +35,8 @@ def main():
         
         # Βήμα 2: Επεξεργασία δεδομένων
         print_header("ΒΗΜΑ 2/5: Επεξεργασία και καθαρισμός δεδομένων")
-        processed_df = process_data(excel_df)
+        decimal_reports, duplicate_reports = [], []
+        processed_df = process_data(excel_df, decimal_reports, duplicate_reports=duplicate_reports)
         print()
         
         # Βήμα 3: Δημιουργία μεταδεδομένων και χρονικών δεδομένων
@@ -59,6 +60,12 @@ def main():
         # Βήμα 5: Δημιουργία τελικού output
         print_header("ΒΗΜΑ 5/5: Δημιουργία τελικού output")
         final_path = generate_output(processed_df, metadata, zero_dfs)
+        report_path = write_decimal_report(decimal_reports, os.path.dirname(final_path))
+        if report_path:
+            print(f"⚠️  Σφάλματα δεκαδικών: {report_path}")
+        report_path = write_duplicate_report(duplicate_reports, os.path.dirname(final_path))
+        if report_path:
+            print(f"⚠️  Διπλές γραμμές / διπλά a/a: {report_path}")
         print()
         
         # Επιτυχής ολοκλήρωση
@@ -7,14 +7,36 @@ Modules:
 - data_processor: Επεξεργασία και καθαρισμός DataFrame
 - time_handler: Διαχείριση χρονικών δεδομένων
 - zero_data_manager: Διαχείριση zero calibration data
+- zero_library: Zero templates ανά product/όργανο
 - output_generator: Δημιουργία τελικού output
+- batch_processor: Μαζική επεξεργασία όλων των αρχείων του BASE_PATH
 """
 
-from .data_loader import DataLoader, load_data
-from .data_processor import DataProcessor, process_data
-from .time_handler import TimeHandler, MetadataGenerator, generate_time_metadata
-from .zero_manager import ZeroDataManager, prepare_zero_data
-from .output_generator import OutputGenerator, FinalOutputAssembler, generate_output
+from .data_loader import DataLoader, LoadCancelled, load_data
+from .background_loader import BackgroundExcelLoader
+from .header_validator import HeaderValidator, InvalidWorkbookError, validate_workbook
+from .data_processor import (
+    DataProcessor, ProcessingPlan, process_data, process_data_chunks,
+    find_decimal_errors, write_decimal_report,
+    DuplicateDetector, write_duplicate_report,
+    to_fixed_point, format_fixed_point,
+    DerivedFormula, compile_derived_formulas
+)
+from .time_handler import (
+    TimeHandler, MetadataGenerator, Schedule, ConstantColumn, SampleIds, generate_time_metadata
+)
+from .zero_loader import ZeroFetcher, ensure_zero_file
+from .zero_library import ZeroLibrary, zero_template_path
+from .zero_manager import (
+    ZeroDataManager, ZeroBlockTemplate, ZeroBlocks, prepare_zero_data, load_zero_template
+)
+from .output_generator import (
+    OutputGenerator, FinalOutputAssembler, FinalCsvWriter, StreamingOutputWriter,
+    generate_output, generate_output_streaming
+)
+from .batch_processor import BatchProcessor, run_batch, run_job, run_jobs, read_job_specs
+from .folder_watcher import FolderWatcher, watch_folder
+from .protocol_catalog import ProtocolCatalog
 
 __version__ = "1.0.0"
 __author__ = "Your Name"
@@ -23,43 +45,122 @@ __all__ = [
     # Data Loading
     'DataLoader',
     'load_data',
+    'LoadCancelled',
+    'BackgroundExcelLoader',
+    'HeaderValidator',
+    'InvalidWorkbookError',
+    'validate_workbook',
     
     # Data Processing
     'DataProcessor',
+    'ProcessingPlan',
     'process_data',
+    'process_data_chunks',
+    'find_decimal_errors',
+    'write_decimal_report',
+    'DuplicateDetector',
+    'write_duplicate_report',
+    'to_fixed_point',
+    'format_fixed_point',
+    'DerivedFormula',
+    'compile_derived_formulas',
     
     # Time Handling
     'TimeHandler',
     'MetadataGenerator',
+    'Schedule',
+    'ConstantColumn',
+    'SampleIds',
     'generate_time_metadata',
     
     # Zero Data Management
     'ZeroDataManager',
+    'ZeroBlockTemplate',
+    'ZeroBlocks',
     'prepare_zero_data',
+    'load_zero_template',
+    'ZeroFetcher',
+    'ensure_zero_file',
+    'ZeroLibrary',
+    'zero_template_path',
     
     # Output Generation
     'OutputGenerator',
     'FinalOutputAssembler',
+    'FinalCsvWriter',
+    'StreamingOutputWriter',
     'generate_output',
+    'generate_output_streaming',
+    
+    # Batch Processing
+    'BatchProcessor',
+    'run_batch',
+    'run_job',
+    'run_jobs',
+    'read_job_specs',
+    'FolderWatcher',
+    'watch_folder',
+
+    # Protocol Catalog
+    'ProtocolCatalog',
 ]
 
 
 # Package-level convenience functions
-def quick_process(file_number: str, date: str = None, initial_time: str = None):
+def quick_process(file_number: str, date: str = None, initial_time: str = None,
+                  product: str = None, rep: int = None, drop_zero_nutrients: bool = None,
+                  output_dir: str = None, base_path: str = None, instrument: str = None) -> str:
     """
-    Γρήγορη επεξεργασία με ελάχιστες παραμέτρους
+    Γρήγορη επεξεργασία με ελάχιστες παραμέτρους, χωρίς input() και prints
     
     Args:
         file_number: Αριθμός πρωτοκόλλου (π.χ. "1234-56")
-        date: Ημερομηνία σε μορφή DD-MM (προαιρετική)
-        initial_time: Αρχική ώρα σε μορφή HH:MM (προαιρετική)
+        date: Ημερομηνία σε μορφή DD-MM (αν None, από το πρωτόκολλο)
+        initial_time: Αρχική ώρα σε μορφή HH:MM (αν None, config.DEFAULT_TIME)
+        product: Product (αν None, config.DEFAULT_PRODUCT)
+        rep: Rep # (αν None, config.DEFAULT_REP)
+        drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από config
+        output_dir: Φάκελος εξόδου (αν None, batch_output/<πρωτόκολλο>)
+        base_path: Φάκελος με τα Excel αρχεία (αν None, config.BASE_PATH)
+        instrument: Όργανο για την επιλογή zero template (βλ. zero_library)
         
     Returns:
         str: Διαδρομή τελικού αρχείου
+
+    Raises:
+        RuntimeError: Αν η επεξεργασία απέτυχε (λεπτομέρειες στο batch.log)
+    """
+    result = run_job({
+        'protocol': file_number,
+        'date': date,
+        'time': initial_time,
+        'product': product,
+        'rep': rep,
+        'instrument': instrument,
+        'drop_zero': drop_zero_nutrients,
+        'output_dir': output_dir,
+    }, base_path=base_path)
+    if result['status'] != 'ok':
+        raise RuntimeError(f"{result['protocol']}: {result['error']}")
+    return result['output']
+
+
+def quick_process_jobs(job_file: str, output_root: str = None, max_workers: int = None,
+                       base_path: str = None) -> list:
+    """
+    Επεξεργασία όλων των jobs ενός αρχείου JSON/CSV, χωρίς input() και prints
+
+    Args:
+        job_file: Διαδρομή .json ή .csv με job specs (βλ. read_job_specs)
+        output_root: Φάκελος εξόδου· κάθε πρωτόκολλο παίρνει υποφάκελο
+        max_workers: Πλήθος διεργασιών
+        base_path: Φάκελος με τα Excel αρχεία (αν None, config.BASE_PATH)
+
+    Returns:
+        list: Αποτελέσματα ανά job (status, output, error, κλπ.)
     """
-    print(f"Quick processing for file: {file_number}")
-    # Implementation would go here
-    pass
+    return run_jobs(job_file, base_path=base_path, output_root=output_root,
+                    max_workers=max_workers)
 
 
 def get_module_info():
@@ -0,0 +1,171 @@
+"""
+Module για φόρτωση Excel σε background thread (για τα GUI)
+
+Η ανάγνωση (και ο έλεγχος σχήματος πριν από αυτή) τρέχει σε
+ThreadPoolExecutor και τα γεγονότα (έλεγχος, πρόοδος, αποτέλεσμα, σφάλμα,
+ακύρωση) μπαίνουν σε ουρά. Το GUI τα διαβάζει από
+το main thread με root.after, οπότε κανένα widget δεν αγγίζεται από το
+worker thread.
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+# Import με fallback
+try:
+    from . import config
+    from .data_loader import DataLoader, LoadCancelled
+    from .header_validator import InvalidWorkbookError, validate_workbook
+except ImportError:
+    import config
+    from modules.data_loader import DataLoader, LoadCancelled
+    from modules.header_validator import InvalidWorkbookError, validate_workbook
+
+
+class BackgroundExcelLoader:
+    """Κλάση για μη-blocking φόρτωση Excel με πρόοδο και ακύρωση"""
+
+    POLL_MS = 50
+
+    def __init__(self, root, loader: DataLoader = None):
+        """
+        Args:
+            root: Tk root (ή οποιοδήποτε widget) για το after()
+            loader: DataLoader (αν None, νέος με τις ρυθμίσεις του config)
+        """
+        self.root = root
+        self.loader = loader or DataLoader()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="excel-load")
+        self._events = queue.Queue()
+        self._cancel_event: Optional[threading.Event] = None
+        self._load_id = 0
+        self._callbacks = {}
+        self._pumping = False
+
+    @property
+    def busy(self) -> bool:
+        """True όσο υπάρχει φόρτωση σε εξέλιξη"""
+        return self._cancel_event is not None
+
+    def start(self, file_path: str,
+              on_done: Callable,
+              on_error: Callable[[Exception], None],
+              on_progress: Callable[[int, Optional[int]], None] = None,
+              on_cancel: Callable[[], None] = None,
+              on_verdict: Callable[[dict], None] = None,
+              validate: bool = None):
+        """
+        Ξεκινά φόρτωση στο background· αν τρέχει ήδη άλλη, ακυρώνεται
+
+        Όλα τα callbacks καλούνται στο Tk main thread.
+
+        Args:
+            file_path: Διαδρομή Excel
+            on_done: Καλείται με το DataFrame
+            on_error: Καλείται με την εξαίρεση
+            on_progress: Καλείται με (γραμμές, σύνολο ή None)
+            on_cancel: Καλείται αν η φόρτωση ακυρώθηκε
+            on_verdict: Καλείται με το αποτέλεσμα του validate_workbook (π.χ. για
+                τις προειδοποιήσεις)· αν το αρχείο απορρίπτεται, ακολουθεί
+                on_error με InvalidWorkbookError
+            validate: Έλεγχος σχήματος πριν τη φόρτωση, στο worker thread (για
+                .xls το άνοιγμα διαβάζει όλο το αρχείο)· αν None,
+                config.VALIDATE_BEFORE_PARSE
+        """
+        if validate is None:
+            validate = getattr(config, 'VALIDATE_BEFORE_PARSE', True)
+        self.cancel()
+
+        self._load_id += 1
+        load_id = self._load_id
+        cancel_event = threading.Event()
+        self._cancel_event = cancel_event
+        self._callbacks = {
+            'done': on_done,
+            'error': on_error,
+            'progress': on_progress,
+            'cancel': on_cancel,
+            'verdict': on_verdict,
+        }
+
+        def report(done, total):
+            self._events.put((load_id, 'progress', (done, total)))
+
+        def work():
+            try:
+                if validate:
+                    verdict = validate_workbook(file_path)
+                    self._events.put((load_id, 'verdict', verdict))
+                    if not verdict['ok']:
+                        raise InvalidWorkbookError(verdict)
+                    if cancel_event.is_set():
+                        raise LoadCancelled(file_path)
+
+                df = self.loader.load_excel_progress(
+                    file_path, progress=report, cancel_event=cancel_event
+                )
+                if cancel_event.is_set():
+                    raise LoadCancelled(file_path)
+                self._events.put((load_id, 'done', df))
+            except LoadCancelled:
+                self._events.put((load_id, 'cancel', None))
+            except Exception as e:
+                self._events.put((load_id, 'error', e))
+
+        self._executor.submit(work)
+        if not self._pumping:
+            self._pumping = True
+            self.root.after(self.POLL_MS, self._pump)
+
+    def cancel(self):
+        """Ζητά ακύρωση της τρέχουσας φόρτωσης (σταματά στο επόμενο chunk)"""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            callback = self._callbacks.get('cancel')
+            self._cancel_event = None
+            self._callbacks = {}
+            if callback is not None:
+                callback()
+
+    def shutdown(self):
+        """Ακύρωση και τερματισμός του worker thread (π.χ. στο κλείσιμο του παραθύρου)"""
+        self.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _pump(self):
+        """Διαβάζει τα γεγονότα της ουράς στο main thread"""
+        while True:
+            try:
+                load_id, kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            # Γεγονότα από φόρτωση που ακυρώθηκε ή αντικαταστάθηκε
+            if load_id != self._load_id or self._cancel_event is None:
+                continue
+
+            if kind == 'progress':
+                callback = self._callbacks.get('progress')
+                if callback is not None:
+                    callback(*payload)
+                continue
+            if kind == 'verdict':
+                callback = self._callbacks.get('verdict')
+                if callback is not None:
+                    callback(payload)
+                continue
+
+            callbacks = self._callbacks
+            self._cancel_event = None
+            self._callbacks = {}
+            if kind == 'done':
+                callbacks['done'](payload)
+            elif kind == 'error':
+                callbacks['error'](payload)
+            elif kind == 'cancel' and callbacks.get('cancel') is not None:
+                callbacks['cancel']()
+
+        if self._cancel_event is not None:
+            self.root.after(self.POLL_MS, self._pump)
+        else:
+            self._pumping = False
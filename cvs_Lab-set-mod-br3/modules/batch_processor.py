@@ -0,0 +1,576 @@
+"""
+Module για μαζική (headless) επεξεργασία όλων των πρωτοκόλλων του BASE_PATH
+σε πολλαπλές διεργασίες (ProcessPoolExecutor)
+"""
+import os
+import csv
+import json
+import time
+import contextlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional
+# Import config με fallback
+try:
+    from . import config
+    from .data_loader import DataLoader
+    from .data_processor import (
+        process_data, process_data_chunks, write_decimal_report, write_duplicate_report
+    )
+    from .time_handler import TimeHandler, generate_time_metadata
+    from .zero_manager import prepare_zero_data
+    from .zero_loader import ensure_zero_file
+    from .output_generator import generate_output, get_app_root, StreamingOutputWriter
+    from .header_validator import (
+        InvalidWorkbookError, ensure_valid_workbook, validate_workbook, format_verdict
+    )
+except ImportError:
+    import config
+    from modules.data_loader import DataLoader
+    from modules.data_processor import (
+        process_data, process_data_chunks, write_decimal_report, write_duplicate_report
+    )
+    from modules.time_handler import TimeHandler, generate_time_metadata
+    from modules.zero_manager import prepare_zero_data
+    from modules.zero_loader import ensure_zero_file
+    from modules.output_generator import generate_output, get_app_root, StreamingOutputWriter
+    from modules.header_validator import (
+        InvalidWorkbookError, ensure_valid_workbook, validate_workbook, format_verdict
+    )
+
+
+# Πεδία ενός job spec (JSON/CSV ή dict του quick_process)
+JOB_SPEC_FIELDS = (
+    'protocol', 'file', 'date', 'time', 'product', 'rep', 'instrument',
+    'drop_zero', 'stream', 'validate', 'output_dir'
+)
+_TRUE_VALUES = ("1", "true", "yes", "y", "ναι")
+_FALSE_VALUES = ("0", "false", "no", "n", "όχι")
+
+
+def _parse_flag(value, field: str) -> bool:
+    """Boolean πεδίο job spec (bool ή κείμενο όπως 1/0, true/false, yes/no)"""
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Μη έγκυρη τιμή για {field}: {value!r}")
+
+
+def normalize_job_spec(spec: dict) -> Optional[dict]:
+    """
+    Ελέγχει ένα job spec και μετατρέπει τις τιμές του στους σωστούς τύπους
+
+    Κενές τιμές θεωρούνται ότι λείπουν. Υποχρεωτικό είναι μόνο το protocol
+    ή το file· τα υπόλοιπα παίρνουν προεπιλογές στο BatchProcessor.job_from_spec.
+
+    Args:
+        spec: Dictionary με πεδία από τα JOB_SPEC_FIELDS
+
+    Returns:
+        Optional[dict]: Το spec χωρίς κενά, ή None αν δεν ορίζει protocol/file
+    """
+    unknown = set(spec) - set(JOB_SPEC_FIELDS)
+    if unknown:
+        raise ValueError(f"Άγνωστα πεδία job: {', '.join(sorted(map(str, unknown)))}")
+
+    normalized = {}
+    for field, value in spec.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == "":
+            continue
+        if field in ('drop_zero', 'stream', 'validate'):
+            value = _parse_flag(value, field)
+        elif field == 'rep':
+            value = int(value)
+        normalized[field] = value
+
+    if 'protocol' not in normalized and 'file' not in normalized:
+        return None
+    return normalized
+
+
+def read_job_specs(path: str) -> List[dict]:
+    """
+    Διαβάζει job specs από JSON ή CSV
+
+    JSON: λίστα αντικειμένων ή {"jobs": [...]}. CSV: μία γραμμή ανά job με
+    στήλες από τα JOB_SPEC_FIELDS (π.χ. protocol,date,time,product,rep).
+    Γραμμές χωρίς protocol/file αγνοούνται.
+
+    Args:
+        path: Διαδρομή του .json ή .csv
+
+    Returns:
+        List[dict]: Τα job specs (βλ. normalize_job_spec)
+    """
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get('jobs')
+        if not isinstance(data, list) or not all(isinstance(spec, dict) for spec in data):
+            raise ValueError(f"Το {path} πρέπει να περιέχει λίστα από jobs")
+        specs = data
+    else:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            specs = list(csv.DictReader(f))
+
+    return [spec for spec in map(normalize_job_spec, specs) if spec is not None]
+
+
+def process_job(job: dict) -> dict:
+    """
+    Εκτελεί ολόκληρο το pipeline για ένα αρχείο (τρέχει μέσα σε worker process)
+
+    Όλα τα prints του pipeline γράφονται στο batch.log του φακέλου εξόδου
+    του αρχείου, ώστε να μην ανακατεύονται στην κονσόλα.
+
+    Args:
+        job: Dictionary με protocol, file, date (DD-MM ή None), time,
+             product, rep, instrument, drop_zero, stream, validate, output_dir
+
+    Returns:
+        dict: Αποτέλεσμα για το summary (status, samples, output, error, κλπ.)
+    """
+    start = time.time()
+    result = {
+        'protocol': job['protocol'],
+        'file': job['file'],
+        'status': 'ok',
+        'samples': 0,
+        'date': '',
+        'time': job['time'],
+        'output': '',
+        'decimal_errors': 0,
+        'duplicates': 0,
+        'duration_sec': 0.0,
+        'error': '',
+    }
+
+    os.makedirs(job['output_dir'], exist_ok=True)
+    log_path = os.path.join(job['output_dir'], "batch.log")
+
+    with open(log_path, "w", encoding="utf-8") as log, contextlib.redirect_stdout(log):
+        try:
+            csv_first_4, dash_part = DataLoader.parse_protocol(job['protocol'])
+            if job['date']:
+                date = TimeHandler.format_analysis_date(job['date'])
+            else:
+                date = TimeHandler.date_from_protocol(csv_first_4)
+            result['date'] = date
+
+            # Γρήγορος έλεγχος header πριν το πλήρες parsing
+            if job.get('validate'):
+                ensure_valid_workbook(job['file'])
+
+            if job['stream']:
+                result.update(_run_streaming(job, csv_first_4, dash_part, date))
+            else:
+                result.update(_run_in_memory(job, csv_first_4, dash_part, date))
+
+        except InvalidWorkbookError as e:
+            result['status'] = 'invalid'
+            result['error'] = str(e)
+            print(format_verdict(e.verdict))
+
+        except Exception as e:
+            result['status'] = 'error'
+            result['error'] = str(e)
+            traceback.print_exc(file=log)
+
+    result['duration_sec'] = round(time.time() - start, 3)
+    return result
+
+
+def _run_in_memory(job: dict, csv_first_4: str, dash_part: str, date: str) -> dict:
+    """Pipeline με ολόκληρο το αρχείο στη μνήμη (όπως main.py / GUI)"""
+    excel_df = DataLoader().load_excel(job['file'])
+    decimal_reports, duplicate_reports = [], []
+    processed_df = process_data(excel_df, decimal_reports,
+                                duplicate_reports=duplicate_reports)
+    del excel_df
+
+    metadata = generate_time_metadata(
+        len(processed_df),
+        csv_first_4,
+        dash_part,
+        date=date,
+        initial_time=job['time'],
+        product=job.get('product'),
+        rep=job.get('rep')
+    )
+    zero_dfs = prepare_zero_data(
+        len(processed_df),
+        date,
+        metadata['zero_times'],
+        output_dir=job['output_dir'],
+        product=job.get('product'),
+        instrument=job.get('instrument')
+    )
+
+    output = generate_output(
+        processed_df,
+        metadata,
+        zero_dfs,
+        drop_zero_nutrients=job['drop_zero'],
+        output_dir=job['output_dir']
+    )
+    return {'output': output, 'samples': len(processed_df),
+            'decimal_errors': _save_decimal_report(decimal_reports, job['output_dir']),
+            'duplicates': _save_duplicate_report(duplicate_reports, job['output_dir'])}
+
+
+def _run_streaming(job: dict, csv_first_4: str, dash_part: str, date: str) -> dict:
+    """Streaming pipeline: διάβασμα, επεξεργασία και εγγραφή ανά chunk"""
+    chunks = DataLoader().iter_chunks(job['file'])
+
+    writer = StreamingOutputWriter(
+        os.path.join(job['output_dir'], "FINAL_OUTPUT.csv"),
+        csv_first_4,
+        dash_part,
+        date,
+        job['time'],
+        drop_zero_nutrients=job['drop_zero'],
+        product=job.get('product'),
+        rep=job.get('rep'),
+        instrument=job.get('instrument')
+    )
+    decimal_reports, duplicate_reports = [], []
+    output = writer.write(process_data_chunks(chunks, decimal_reports, duplicate_reports))
+    return {'output': output, 'samples': writer.samples,
+            'decimal_errors': _save_decimal_report(decimal_reports, job['output_dir']),
+            'duplicates': _save_duplicate_report(duplicate_reports, job['output_dir'])}
+
+
+def _save_decimal_report(decimal_reports: list, output_dir: str) -> int:
+    """Γράφει το decimal_report.csv του αρχείου και επιστρέφει το πλήθος σφαλμάτων"""
+    path = write_decimal_report(decimal_reports, output_dir)
+    if path is None:
+        return 0
+    errors = sum(len(r) for r in decimal_reports)
+    print(f"📄 Αναφορά δεκαδικών ({errors} σφάλματα): {path}")
+    return errors
+
+
+def _save_duplicate_report(duplicate_reports: list, output_dir: str) -> int:
+    """Γράφει το duplicate_report.csv του αρχείου και επιστρέφει το πλήθος γραμμών του"""
+    path = write_duplicate_report(duplicate_reports, output_dir)
+    if path is None:
+        return 0
+    count = sum(len(r) for r in duplicate_reports)
+    print(f"📄 Αναφορά duplicates ({count} γραμμές): {path}")
+    return count
+
+
+class BatchProcessor:
+    """Κλάση για μαζική επεξεργασία πολλών Excel αρχείων"""
+
+    SUMMARY_FIELDS = [
+        'protocol', 'file', 'status', 'samples', 'date', 'time',
+        'output', 'decimal_errors', 'duplicates', 'duration_sec', 'error'
+    ]
+
+    def __init__(self, base_path: str = None, output_root: str = None,
+                 max_workers: int = None, drop_zero_nutrients: bool = None,
+                 stream: bool = False, validate: bool = None):
+        """
+        Args:
+            base_path: Φάκελος με τα Excel αρχεία (αν None, config.BASE_PATH)
+            output_root: Φάκελος εξόδου· κάθε πρωτόκολλο παίρνει υποφάκελο
+            max_workers: Πλήθος διεργασιών (αν None, όσοι οι πυρήνες)
+            drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από config
+            stream: Streaming ανάγνωση/εγγραφή ανά chunk (για πολύ μεγάλα αρχεία)
+            validate: Έλεγχος header πριν το parsing (αν None, config.VALIDATE_BEFORE_PARSE)
+        """
+        self.loader = DataLoader(base_path)
+        self.output_root = output_root or os.path.join(get_app_root(), "batch_output")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if drop_zero_nutrients is None:
+            drop_zero_nutrients = getattr(config, 'DROP_ZERO_NUTRIENTS', True)
+        self.drop_zero_nutrients = drop_zero_nutrients
+        self.stream = stream
+        if validate is None:
+            validate = getattr(config, 'VALIDATE_BEFORE_PARSE', True)
+        self.validate = validate
+
+    def _make_job(self, file_path: str, date: str = None, initial_time: str = None,
+                  protocol: str = None) -> dict:
+        """Δημιουργεί job για ένα αρχείο"""
+        if protocol is None:
+            protocol = os.path.splitext(os.path.basename(file_path))[0]
+        return {
+            'protocol': protocol,
+            'file': file_path,
+            'date': date,
+            'time': initial_time or config.DEFAULT_TIME,
+            'product': config.DEFAULT_PRODUCT,
+            'rep': config.DEFAULT_REP,
+            'instrument': None,
+            'drop_zero': self.drop_zero_nutrients,
+            'stream': self.stream,
+            'validate': self.validate,
+            'output_dir': os.path.join(self.output_root, protocol),
+        }
+
+    def discover_jobs(self, initial_time: str = None) -> List[dict]:
+        """
+        Δημιουργεί ένα job για κάθε .xls/.xlsx του BASE_PATH
+
+        Η ημερομηνία κάθε αρχείου προκύπτει από τον αριθμό πρωτοκόλλου.
+
+        Args:
+            initial_time: Κοινή αρχική ώρα HH:MM (αν None, config.DEFAULT_TIME)
+
+        Returns:
+            List[dict]: Λίστα με jobs
+        """
+        files = self.loader.list_excel_files()
+        print(f"📁 Βρέθηκαν {len(files)} αρχεία στο {self.loader.base_path}")
+        return [self._make_job(f, initial_time=initial_time) for f in files]
+
+    def job_from_spec(self, spec: dict, initial_time: str = None) -> dict:
+        """
+        Δημιουργεί job από ένα job spec (βλ. normalize_job_spec)
+
+        Το αρχείο βρίσκεται από το protocol αν δεν δίνεται file· η ημερομηνία
+        (αν λείπει) προκύπτει από το πρωτόκολλο και τα υπόλοιπα πεδία
+        παίρνουν τις τιμές του BatchProcessor/config.
+
+        Args:
+            spec: Job spec
+            initial_time: Αρχική ώρα αν το spec δεν ορίζει time
+
+        Returns:
+            dict: Το job για το process_job
+        """
+        spec = normalize_job_spec(spec)
+        if spec is None:
+            raise ValueError("Το job πρέπει να ορίζει protocol ή file")
+
+        protocol = spec.get('protocol')
+        file_path = spec.get('file')
+        if file_path is None:
+            # Αν δεν βρεθεί, το job αποτυγχάνει στο load_excel και καταγράφεται στο summary
+            file_path = (self.loader.find_protocol_file(protocol)
+                         or os.path.join(self.loader.base_path, f"{protocol}.xls"))
+
+        job = self._make_job(file_path, date=spec.get('date'),
+                             initial_time=spec.get('time') or initial_time, protocol=protocol)
+        for field in ('product', 'rep', 'instrument', 'drop_zero', 'stream', 'validate',
+                      'output_dir'):
+            if field in spec:
+                job[field] = spec[field]
+        return job
+
+    def load_job_list(self, job_list_path: str, initial_time: str = None) -> List[dict]:
+        """
+        Διαβάζει λίστα jobs από JSON ή CSV (βλ. read_job_specs)
+
+        Εκτός από protocol, date (DD-MM) και time (HH:MM), κάθε job μπορεί να
+        ορίζει file, product, rep, instrument, drop_zero, stream, validate και
+        output_dir. Το zero template επιλέγεται από product/instrument (βλ. zero_library).
+        Αν λείπουν, η ημερομηνία προκύπτει από το πρωτόκολλο, η ώρα από το
+        initial_time και τα υπόλοιπα από τις ρυθμίσεις του BatchProcessor.
+
+        Args:
+            job_list_path: Διαδρομή του .json ή .csv
+            initial_time: Αρχική ώρα για jobs χωρίς time
+
+        Returns:
+            List[dict]: Λίστα με jobs
+        """
+        jobs = [self.job_from_spec(spec, initial_time) for spec in read_job_specs(job_list_path)]
+
+        print(f"📋 Φορτώθηκαν {len(jobs)} jobs από {job_list_path}")
+        return jobs
+
+    def run(self, jobs: List[dict]) -> List[dict]:
+        """
+        Εκτελεί τα jobs παράλληλα σε ProcessPoolExecutor
+
+        Args:
+            jobs: Λίστα με jobs
+
+        Returns:
+            List[dict]: Αποτελέσματα με τη σειρά των jobs
+        """
+        if not jobs:
+            print("❌ Δεν υπάρχουν αρχεία για επεξεργασία.")
+            return []
+
+        workers = min(self.max_workers, len(jobs))
+        print(f"⚡ Επεξεργασία {len(jobs)} αρχείων με {workers} διεργασίες...")
+
+        self.prefetch_zero_file()
+
+        results = [None] * len(jobs)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(process_job, job): i for i, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results[futures[future]] = result
+                icon = "✅" if result['status'] == 'ok' else "❌"
+                print(f"  [{done}/{len(jobs)}] {icon} {result['protocol']} "
+                      f"({result['samples']} δείγματα, {result['duration_sec']:.1f}s) {result['error']}")
+
+        return results
+
+    @staticmethod
+    def prefetch_zero_file():
+        """
+        Λήψη/έλεγχος του zero.xlsx από την κύρια διεργασία, πριν υποβληθούν jobs
+
+        Οι workers δεν ξεκινούν δικό τους έλεγχο, οπότε κάθε κώδικας που
+        υποβάλλει process_job σε pool (run, FolderWatcher) καλεί πρώτα αυτό.
+        Αν το τοπικό αντίγραφο είναι πρόσφατο δεν γίνεται τίποτα.
+        """
+        try:
+            ensure_zero_file()
+        except Exception as e:
+            print(f"⚠️ zero.xlsx: {e}")
+
+    def validate_jobs(self, jobs: List[dict]) -> List[dict]:
+        """
+        Μόνο έλεγχος header των αρχείων, χωρίς επεξεργασία (milliseconds ανά αρχείο)
+
+        Args:
+            jobs: Λίστα με jobs
+
+        Returns:
+            List[dict]: Αποτελέσματα με τα πεδία του summary (status ok/invalid)
+        """
+        results = []
+        for job in jobs:
+            verdict = validate_workbook(job['file'])
+            results.append({
+                'protocol': job['protocol'],
+                'file': job['file'],
+                'status': 'ok' if verdict['ok'] else 'invalid',
+                'samples': '',
+                'date': '',
+                'time': '',
+                'output': '',
+                'decimal_errors': '',
+                'duplicates': '',
+                'duration_sec': round(verdict['elapsed_ms'] / 1000, 4),
+                'error': "; ".join(verdict['errors'] + verdict['warnings']),
+            })
+            icon = "✅" if verdict['ok'] else "❌"
+            print(f"  {icon} {job['protocol']} ({verdict['elapsed_ms']:.0f}ms)")
+            if verdict['errors'] or verdict['warnings']:
+                print("     " + format_verdict(verdict).replace("\n", "\n     "))
+        return results
+
+    def write_summary(self, results: List[dict]) -> str:
+        """
+        Αποθηκεύει το summary της εκτέλεσης ως CSV
+
+        Args:
+            results: Αποτελέσματα από run()
+
+        Returns:
+            str: Διαδρομή του batch_summary.csv
+        """
+        os.makedirs(self.output_root, exist_ok=True)
+        summary_path = os.path.join(self.output_root, "batch_summary.csv")
+
+        with open(summary_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.SUMMARY_FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+        ok = sum(1 for r in results if r['status'] == 'ok')
+        print(f"✅ Επιτυχή: {ok}/{len(results)}")
+        with_errors = [r['protocol'] for r in results if r.get('decimal_errors')]
+        if with_errors:
+            print(f"⚠️ Σφάλματα δεκαδικών σε {len(with_errors)} αρχεία "
+                  f"(βλ. {config.DECIMAL_REPORT_NAME}): {', '.join(with_errors)}")
+        with_duplicates = [r['protocol'] for r in results if r.get('duplicates')]
+        if with_duplicates:
+            print(f"⚠️ Duplicates σε {len(with_duplicates)} αρχεία "
+                  f"(βλ. {config.DUPLICATE_REPORT_NAME}): {', '.join(with_duplicates)}")
+        print(f"📄 Summary: {summary_path}")
+        return summary_path
+
+
+def run_batch(base_path: str = None, output_root: str = None, job_list: str = None,
+              max_workers: int = None, initial_time: str = None,
+              drop_zero_nutrients: bool = None, stream: bool = False,
+              validate: bool = None, validate_only: bool = False) -> str:
+    """
+    Wrapper function για μαζική επεξεργασία
+
+    Args:
+        base_path: Φάκελος με τα Excel αρχεία (αν None, config.BASE_PATH)
+        output_root: Φάκελος εξόδου
+        job_list: JSON/CSV με jobs (αν None, επεξεργάζονται όλα τα αρχεία του φακέλου)
+        max_workers: Πλήθος διεργασιών
+        initial_time: Κοινή αρχική ώρα για τα jobs χωρίς δική τους
+        drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από config
+        stream: Streaming επεξεργασία ανά chunk (για πολύ μεγάλα αρχεία)
+        validate: Έλεγχος header πριν το parsing (αν None, config.VALIDATE_BEFORE_PARSE)
+        validate_only: Μόνο έλεγχος header όλων των αρχείων, χωρίς επεξεργασία
+
+    Returns:
+        str: Διαδρομή του batch_summary.csv
+    """
+    processor = BatchProcessor(base_path, output_root, max_workers, drop_zero_nutrients,
+                               stream, validate)
+
+    if job_list:
+        jobs = processor.load_job_list(job_list, initial_time)
+    else:
+        jobs = processor.discover_jobs(initial_time)
+
+    if validate_only:
+        results = processor.validate_jobs(jobs)
+    else:
+        results = processor.run(jobs)
+    return processor.write_summary(results)
+
+
+def run_job(spec: dict, base_path: str = None, output_root: str = None) -> dict:
+    """
+    Εκτελεί ένα job spec στην τρέχουσα διεργασία, χωρίς input() και χωρίς prints
+
+    Τα μηνύματα του pipeline γράφονται στο batch.log του φακέλου εξόδου.
+
+    Args:
+        spec: Job spec (βλ. normalize_job_spec)
+        base_path: Φάκελος με τα Excel αρχεία (αν None, config.BASE_PATH)
+        output_root: Φάκελος εξόδου αν το spec δεν ορίζει output_dir
+
+    Returns:
+        dict: Αποτέλεσμα με τα πεδία του summary (status, output, error, κλπ.)
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        processor = BatchProcessor(base_path, output_root)
+        return process_job(processor.job_from_spec(spec))
+
+
+def run_jobs(specs, base_path: str = None, output_root: str = None,
+             max_workers: int = None) -> List[dict]:
+    """
+    Εκτελεί πολλά job specs παράλληλα, χωρίς prints, και γράφει το batch_summary.csv
+
+    Args:
+        specs: Λίστα από job specs ή διαδρομή αρχείου JSON/CSV (βλ. read_job_specs)
+        base_path: Φάκελος με τα Excel αρχεία (αν None, config.BASE_PATH)
+        output_root: Φάκελος εξόδου· κάθε πρωτόκολλο παίρνει υποφάκελο
+        max_workers: Πλήθος διεργασιών
+
+    Returns:
+        List[dict]: Αποτελέσματα με τη σειρά των jobs
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        if isinstance(specs, (str, os.PathLike)):
+            specs = read_job_specs(os.fspath(specs))
+        processor = BatchProcessor(base_path, output_root, max_workers)
+        results = processor.run([processor.job_from_spec(spec) for spec in specs])
+        processor.write_summary(results)
+    return results
@@ -4,8 +4,12 @@ Windows Version
 """
 import os
 import re
+import json
+import math
+import time
+import importlib.util
 import pandas as pd
-from typing import Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import xlrd
 import openpyxl
 
@@ -13,39 +17,798 @@ import openpyxl
 # Import config με fallback
 try:
     from . import config
+    from .workbook_cache import WorkbookCache
+    from .protocol_catalog import ProtocolCatalog, folder_key
 except ImportError:
     import config
+    from modules.workbook_cache import WorkbookCache
+    from modules.protocol_catalog import ProtocolCatalog, folder_key
+
+
+class LoadCancelled(Exception):
+    """Η φόρτωση ακυρώθηκε από τον χρήστη"""
 
 
 class DataLoader:
     """Κλάση για τη διαχείριση φόρτωσης δεδομένων"""
-    
 
-    def load_excel(self, file_path: str) -> pd.DataFrame:
+    EXCEL_EXTENSIONS = ('.xls', '.xlsx')
+
+    def __init__(self, base_path: str = None, use_cache: bool = None):
+        self.base_path = base_path or config.BASE_PATH
+        if use_cache is None:
+            use_cache = getattr(config, 'USE_WORKBOOK_CACHE', True)
+        self.cache = WorkbookCache() if use_cache else None
+
+    def get_user_file(self) -> Tuple[pd.DataFrame, str, str]:
+        """
+        Ζητά από το χρήστη τον αριθμό πρωτοκόλλου και φορτώνει το αντίστοιχο αρχείο
+        
+        Returns:
+            Tuple[DataFrame, str, str]: (excel_df, csv_first_4, dash_part)
+        """
+        while True:
+            user_excel = input("Πληκτρολογήστε τον Αρ. πρωτ. εργαστηρίου για το δελτίο: ").strip()
+
+            if not user_excel:
+                print("Δεν δόθηκε τιμή από τον χρήστη. Παρακαλώ δοκιμάστε ξανά.")
+                continue
+
+            try:
+                csv_first_4, dash_part = self.parse_protocol(user_excel)
+            except ValueError as e:
+                print(f"{e}. Παρακαλώ δοκιμάστε ξανά.")
+                continue
+
+            excel_file = self.find_protocol_file(user_excel)
+            if excel_file is None:
+                print(f"Το αρχείο δεν βρέθηκε: {user_excel}")
+                self._list_available_files(user_excel[:4])
+                continue
+
+            try:
+                excel_df = self.load_excel(excel_file)
+            except Exception as e:
+                print(f"Αποτυχία ανάγνωσης του Excel: {e}")
+                continue
+
+            print("✅ Το αρχείο φορτώθηκε επιτυχώς!")
+            print(f"Πρώτα 4 ψηφία: {csv_first_4}")
+            print(f"Dash part: {dash_part}")
+            print(f"Συνολικές γραμμές: {len(excel_df)}")
+            return excel_df, csv_first_4, dash_part
+
+    def find_protocol_file(self, protocol: str) -> Optional[str]:
+        """
+        Βρίσκει το αρχείο ενός πρωτοκόλλου μέσω του καταλόγου
+
+        Αν ο κατάλογος δεν το γνωρίζει ακόμα (π.χ. νέο αρχείο), ελέγχονται
+        απευθείας τα {protocol}.xls / {protocol}.xlsx στον BASE_PATH.
+
+        Args:
+            protocol: Αριθμός πρωτοκόλλου (π.χ. "16052024-6")
+
+        Returns:
+            Optional[str]: Διαδρομή αρχείου ή None
+        """
+        with ProtocolCatalog(self.base_path) as catalog:
+            path = catalog.lookup(protocol)
+        # Μόνο αρχεία του δικού μας φακέλου (ο κατάλογος μπορεί να είναι κοινός)
+        if path and self._in_base_path(path) and os.path.exists(path):
+            return path
+
+        for ext in self.EXCEL_EXTENSIONS:
+            path = os.path.join(self.base_path, f"{protocol}{ext}")
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _in_base_path(self, path: str) -> bool:
+        """Αν το path βρίσκεται απευθείας μέσα στον BASE_PATH"""
+        return folder_key(os.path.dirname(os.path.abspath(path))) == folder_key(self.base_path)
+
+    def load_excel(self, file_path: str, project_columns: bool = None) -> pd.DataFrame:
+        """
+        Φορτώνει Excel αρχείο (μέσω cache αν είναι ενεργή)
+
+        Args:
+            file_path: Διαδρομή αρχείου
+            project_columns: Αν True, διαβάζονται μόνο οι στήλες που χρειάζεται
+                η επεξεργασία (αν None, config.PROJECT_EXCEL_COLUMNS)
+
+        Returns:
+            pd.DataFrame: Τα δεδομένα του αρχείου
+        """
+        if not file_path or not os.path.exists(file_path):
+            raise FileNotFoundError(f"Δεν βρέθηκε αρχείο: {file_path}")
+
+        reader, read_kwargs = self._read_spec(project_columns)
+
+        if self.cache is not None:
+            return self.cache.load(file_path, reader, **read_kwargs)
+        return reader(file_path, **read_kwargs)
+
+    def load_excel_progress(self, file_path: str,
+                            progress: Callable[[int, Optional[int]], None] = None,
+                            cancel_event=None,
+                            project_columns: bool = None) -> pd.DataFrame:
+        """
+        Φορτώνει Excel αρχείο με αναφορά προόδου και δυνατότητα ακύρωσης (για GUI)
+
+        Το αρχείο διαβάζεται σε chunks· μετά από κάθε chunk καλείται
+        progress(γραμμές, σύνολο) και ελέγχεται το cancel_event. Το αποτέλεσμα
+        είναι το ίδιο με το load_excel και αποθηκεύεται στην ίδια cache.
+
+        Args:
+            file_path: Διαδρομή αρχείου
+            progress: Callback με (γραμμές που διαβάστηκαν, σύνολο ή None)
+            cancel_event: threading.Event· αν γίνει set η φόρτωση διακόπτεται
+            project_columns: Όπως στο load_excel
+
+        Returns:
+            pd.DataFrame: Τα δεδομένα του αρχείου
+
+        Raises:
+            LoadCancelled: Αν ζητήθηκε ακύρωση
+        """
         if not file_path or not os.path.exists(file_path):
             raise FileNotFoundError(f"Δεν βρέθηκε αρχείο: {file_path}")
-        return pd.read_excel(file_path)
-
-
-    def _list_available_files(self):
-        """Εμφανίζει τα διαθέσιμα αρχεία στον BASE_PATH"""
-        if os.path.exists(self.base_path):
-            available_files = [
-                f for f in os.listdir(self.base_path)
-                if f.endswith(('.xls', '.xlsx'))
-            ]
-            if available_files:
-                print("\n📁 Διαθέσιμα αρχεία στον φάκελο:")
-                for f in sorted(available_files)[:10]:  # Εμφάνιση μέχρι 10 αρχείων
-                    print(f"  - {f}")
-                if len(available_files) > 10:
-                    print(f"  ... και {len(available_files) - 10} ακόμα αρχεία")
-            else:
-                print("❌ Δεν βρέθηκαν αρχεία .xls ή .xlsx στον φάκελο.")
-                print(f"   Τοποθετήστε τα αρχεία σας στο: {self.base_path}")
+
+        if project_columns is None:
+            project_columns = getattr(config, 'PROJECT_EXCEL_COLUMNS', True)
+        reader, read_kwargs = self._read_spec(project_columns)
+
+        if self.cache is not None:
+            df = self.cache.get(file_path, **read_kwargs)
+            if df is not None:
+                if progress is not None:
+                    progress(len(df), len(df))
+                return df
+
+        if sniff_format(file_path) == "csv":
+            # Τα CSV διαβάζονται αρκετά γρήγορα σε ένα βήμα
+            df = self.load_excel(file_path, project_columns)
+            if progress is not None:
+                progress(len(df), len(df))
+            return df
+
+        chunks = iter_excel_chunks(file_path, project_columns=project_columns, progress=progress)
+        parts = []
+        try:
+            for chunk in chunks:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled(f"Ακυρώθηκε η φόρτωση: {os.path.basename(file_path)}")
+                parts.append(chunk)
+        finally:
+            chunks.close()
+
+        if parts:
+            df = _concat_chunks(parts, project_columns)
         else:
+            # Μόνο header: δεν υπάρχει κάτι να διακοπεί
+            df = reader(file_path, **read_kwargs)
+
+        if self.cache is not None:
+            self.cache.put(file_path, df, **read_kwargs)
+        return df
+
+    @staticmethod
+    def _read_spec(project_columns: bool = None) -> Tuple[Callable[..., pd.DataFrame], dict]:
+        """Reader και παράμετροί του (μέρος του κλειδιού της cache)"""
+        if project_columns is None:
+            project_columns = getattr(config, 'PROJECT_EXCEL_COLUMNS', True)
+
+        if not project_columns:
+            return read_excel_plain, {}
+
+        # Οι παράμετροι είναι και μέρος του κλειδιού της cache, οπότε
+        # αλλαγή στο config δεν επιστρέφει παλιά projection
+        return read_excel_projected, {
+            'drop_columns': tuple(config.COLS_TO_DELETE),
+            'protected_columns': tuple(config.PROTECTED_COLS),
+            'numeric_columns': tuple(numeric_columns()),
+        }
+
+    def iter_chunks(self, file_path: str, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Streaming ανάγνωση σε DataFrame chunks (για πολύ μεγάλα αρχεία)
+
+        Args:
+            file_path: Διαδρομή αρχείου
+            chunk_size: Γραμμές ανά chunk (αν None, BATCH_SIZE * STREAM_CHUNK_BATCHES)
+
+        Returns:
+            Iterator[pd.DataFrame]: Chunks με τις στήλες της column projection
+        """
+        if not file_path or not os.path.exists(file_path):
+            raise FileNotFoundError(f"Δεν βρέθηκε αρχείο: {file_path}")
+        return iter_excel_chunks(file_path, chunk_size)
+
+    def list_excel_files(self) -> List[str]:
+        """
+        Επιστρέφει όλα τα Excel αρχεία του BASE_PATH (ταξινομημένα)
+
+        Returns:
+            List[str]: Πλήρεις διαδρομές αρχείων .xls/.xlsx
+        """
+        if not os.path.isdir(self.base_path):
+            raise FileNotFoundError(f"Ο φάκελος δεν βρέθηκε: {self.base_path}")
+
+        return sorted(
+            os.path.join(self.base_path, f)
+            for f in os.listdir(self.base_path)
+            # Τα "~$..." είναι lock files του Excel για ανοιχτά αρχεία
+            if f.lower().endswith(self.EXCEL_EXTENSIONS) and not f.startswith("~$")
+        )
+
+    def benchmark_engines(self, files: List[str] = None, repeats: int = 3,
+                          per_format: int = 3) -> dict:
+        """
+        Μετρά τους reader engines και αποθηκεύει τον ταχύτερο ανά μορφή
+
+        Args:
+            files: Αρχεία για τη μέτρηση (αν None, τα per_format μεγαλύτερα
+                κάθε μορφής του BASE_PATH)
+            repeats: Επαναλήψεις ανά αρχείο (κρατιέται ο καλύτερος χρόνος)
+            per_format: Πλήθος αρχείων ανά μορφή όταν files είναι None
+
+        Returns:
+            dict: Αποτελέσματα του benchmark_reader_engines
+        """
+        if files is None:
+            by_format = {}
+            for path in sorted(self.list_excel_files(), key=os.path.getsize, reverse=True):
+                try:
+                    fmt = sniff_format(path)
+                except (OSError, ValueError):
+                    continue
+                if len(by_format.setdefault(fmt, [])) < per_format:
+                    by_format[fmt].append(path)
+            files = [path for paths in by_format.values() for path in paths]
+
+        return benchmark_reader_engines(files, repeats)
+
+    @staticmethod
+    def parse_protocol(protocol: str) -> Tuple[str, str]:
+        """
+        Ελέγχει έναν αριθμό πρωτοκόλλου και τον σπάει στα τμήματά του
+
+        Args:
+            protocol: Αριθμός πρωτοκόλλου (π.χ. "16052024-6")
+
+        Returns:
+            Tuple[str, str]: (csv_first_4, dash_part), π.χ. ("1605", "-6")
+        """
+        result = re.search(r"(-\d+)", protocol)
+        if not result:
+            raise ValueError(f"Δεν βρέθηκε παύλα '-' με αριθμούς: {protocol}")
+        if len(protocol) < 4 or not protocol[:4].isdigit():
+            raise ValueError(f"Τα πρώτα 4 ψηφία δεν είναι έγκυρα: {protocol}")
+        return protocol[:4], result.group()
+
+    def _list_available_files(self, prefix: str = ""):
+        """
+        Εμφανίζει διαθέσιμα αρχεία του BASE_PATH από τον κατάλογο
+
+        Args:
+            prefix: Αν δοθεί, εμφανίζονται πρώτα τα πρωτόκολλα που ξεκινούν έτσι
+        """
+        if not os.path.exists(self.base_path):
             print(f"❌ Ο φάκελος '{self.base_path}' δεν βρέθηκε.")
             print(f"   Δημιουργήστε τον φάκελο ή ελέγξτε το config.py")
+            return
+
+        with ProtocolCatalog(self.base_path) as catalog:
+            # Γρήγορο refresh (μόνο ονόματα/mtimes)· οι συνόψεις γίνονται αργότερα
+            catalog.refresh(with_summaries=False)
+            total = catalog.count()
+            matches = catalog.search(prefix, limit=10) if prefix else []
+            if not matches:
+                matches = catalog.search("", limit=10)
+
+        if not total:
+            print("❌ Δεν βρέθηκαν αρχεία .xls ή .xlsx στον φάκελο.")
+            print(f"   Τοποθετήστε τα αρχεία σας στο: {self.base_path}")
+            return
+
+        print("\n📁 Διαθέσιμα αρχεία στον φάκελο:")
+        for entry in matches:
+            info = ""
+            if entry['rows'] is not None:
+                info = f" ({entry['rows']} γραμμές, {entry['missing_aa']} missing a/a)"
+            print(f"  - {os.path.basename(entry['path'])}{info}")
+        if total > len(matches):
+            print(f"  ... και {total - len(matches)} ακόμα αρχεία")
+
+
+# ============================================================
+# READER ENGINES
+# ============================================================
+
+OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"   # .xls (BIFF σε OLE2 container)
+ZIP_MAGIC = b"PK\x03\x04"                             # .xlsx (OOXML σε zip)
+TEXT_EXTENSIONS = ('.csv', '.txt')
+
+# μορφή -> {όνομα engine: opener}· ο opener επιστρέφει αντικείμενο με το API
+# του pd.ExcelFile (parse(...) και context manager). Ο πρώτος είναι ο προεπιλεγμένος.
+READER_ENGINES: Dict[str, Dict[str, Callable[[str], object]]] = {}
+
+# Επιλογές του benchmark (φορτώνονται μία φορά από το READER_ENGINES_PATH)
+_engine_choices: Optional[dict] = None
+
+
+def sniff_format(file_path: str) -> str:
+    """
+    Αναγνωρίζει τη μορφή του αρχείου από τα πρώτα bytes (όχι από την κατάληξη)
+
+    Returns:
+        str: 'xls', 'xlsx' ή 'csv'
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(2048)
+
+    if head.startswith(OLE2_MAGIC):
+        return "xls"
+    if head.startswith(ZIP_MAGIC):
+        return "xlsx"
+    # Κείμενο μόνο για αρχεία που δηλώνονται ως κείμενο, ώστε ένα χαλασμένο
+    # .xlsx να μη διαβαστεί σιωπηλά ως CSV
+    if file_path.lower().endswith(TEXT_EXTENSIONS) and b"\x00" not in head:
+        return "csv"
+    raise ValueError(f"Άγνωστη μορφή αρχείου: {file_path}")
+
+
+def register_reader_engine(fmt: str, name: str, opener: Callable[[str], object],
+                           requires: str = None):
+    """
+    Προσθέτει reader engine για μια μορφή
+
+    Args:
+        fmt: 'xls', 'xlsx' ή 'csv'
+        name: Όνομα engine (π.χ. "calamine")
+        opener: Συνάρτηση path -> αντικείμενο με parse() όπως το pd.ExcelFile
+        requires: Python module που χρειάζεται· αν δεν είναι εγκατεστημένο,
+            ο engine δεν καταχωρείται
+    """
+    if requires and importlib.util.find_spec(requires) is None:
+        return
+    READER_ENGINES.setdefault(fmt, {})[name] = opener
+
+
+class _CsvBook:
+    """Το pd.read_csv με το API του pd.ExcelFile (parse + context manager)"""
+
+    def __init__(self, file_path: str, engine: str):
+        self.file_path = file_path
+        self.engine = engine
+
+    def parse(self, **kwargs) -> pd.DataFrame:
+        return pd.read_csv(self.file_path, engine=self.engine, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _excel_opener(engine: str) -> Callable[[str], pd.ExcelFile]:
+    return lambda file_path: pd.ExcelFile(file_path, engine=engine)
+
+
+def _csv_opener(engine: str) -> Callable[[str], _CsvBook]:
+    return lambda file_path: _CsvBook(file_path, engine)
+
+
+register_reader_engine("xls", "xlrd", _excel_opener("xlrd"), requires="xlrd")
+register_reader_engine("xls", "calamine", _excel_opener("calamine"), requires="python_calamine")
+register_reader_engine("xlsx", "openpyxl", _excel_opener("openpyxl"), requires="openpyxl")
+register_reader_engine("xlsx", "calamine", _excel_opener("calamine"), requires="python_calamine")
+register_reader_engine("csv", "c", _csv_opener("c"))
+register_reader_engine("csv", "python", _csv_opener("python"))
+
+
+def choose_reader_engine(fmt: str) -> str:
+    """
+    Engine για μια μορφή: ο ταχύτερος του benchmark, αλλιώς ο προεπιλεγμένος
+
+    Returns:
+        str: Όνομα engine
+    """
+    global _engine_choices
+    engines = READER_ENGINES.get(fmt)
+    if not engines:
+        raise ValueError(f"Δεν υπάρχει reader engine για μορφή: {fmt}")
+
+    if _engine_choices is None:
+        _engine_choices = _load_engine_choices()
+
+    chosen = (_engine_choices.get(fmt) or {}).get('engine')
+    if chosen in engines:
+        return chosen
+    return next(iter(engines))
+
+
+def open_workbook(file_path: str, engine: str = None):
+    """
+    Ανοίγει το αρχείο με τον engine της μορφής του (βάσει magic bytes)
+
+    Args:
+        file_path: Διαδρομή .xls/.xlsx/.csv
+        engine: Συγκεκριμένος engine (αν None, choose_reader_engine)
+
+    Returns:
+        Αντικείμενο με parse() και context manager (όπως το pd.ExcelFile)
+    """
+    fmt = sniff_format(file_path)
+    engine = engine or choose_reader_engine(fmt)
+    try:
+        opener = READER_ENGINES[fmt][engine]
+    except KeyError:
+        raise ValueError(f"Άγνωστος engine '{engine}' για μορφή {fmt}") from None
+    return opener(file_path)
+
+
+def _load_engine_choices() -> dict:
+    path = str(getattr(config, 'READER_ENGINES_PATH', ""))
+    if path and os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return {}
+
+
+def _save_engine_choices(choices: dict):
+    path = str(config.READER_ENGINES_PATH)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(choices, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def benchmark_reader_engines(files: List[str], repeats: int = 3, save: bool = True) -> dict:
+    """
+    Μετρά κάθε διαθέσιμο engine ανά μορφή και κρατά τον ταχύτερο
+
+    Κάθε engine διαβάζει τα ίδια αρχεία όπως το load_excel (καλύτερος χρόνος
+    από repeats). Engines που αποτυγχάνουν ή δίνουν διαφορετικό DataFrame από
+    τον προεπιλεγμένο αποκλείονται.
+
+    Args:
+        files: Αρχεία για μέτρηση (ομαδοποιούνται ανά μορφή)
+        repeats: Επαναλήψεις ανά αρχείο
+        save: Αποθήκευση της επιλογής στο config.READER_ENGINES_PATH
+
+    Returns:
+        dict: {μορφή: {'engine', 'timings' (sec ή None), 'files', 'measured_at'}}
+    """
+    global _engine_choices
+    by_format = {}
+    for path in files:
+        try:
+            by_format.setdefault(sniff_format(path), []).append(path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Παράλειψη {path}: {e}")
+
+    _, read_kwargs = DataLoader._read_spec(True)
+    results = {}
+
+    for fmt, paths in by_format.items():
+        timings = {}
+        reference = None
+
+        for name in READER_ENGINES.get(fmt, {}):
+            try:
+                elapsed = 0.0
+                frames = []
+                for path in paths:
+                    best = float("inf")
+                    for _ in range(max(1, repeats)):
+                        start = time.perf_counter()
+                        df = read_excel_projected(path, engine=name, **read_kwargs)
+                        best = min(best, time.perf_counter() - start)
+                    elapsed += best
+                    frames.append(df)
+
+                if reference is None:
+                    reference = frames
+                else:
+                    for expected, df in zip(reference, frames):
+                        pd.testing.assert_frame_equal(expected, df)
+
+                timings[name] = round(elapsed, 4)
+            except Exception as e:
+                print(f"⚠️ {fmt}/{name}: αποκλείεται ({str(e).splitlines()[0] if str(e) else type(e).__name__})")
+                timings[name] = None
+
+        valid = {name: t for name, t in timings.items() if t is not None}
+        results[fmt] = {
+            'engine': min(valid, key=valid.get) if valid else None,
+            'timings': timings,
+            'files': len(paths),
+            'measured_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    if save and results:
+        choices = dict(_load_engine_choices())
+        choices.update(results)
+        _save_engine_choices(choices)
+        _engine_choices = choices
+
+    return results
+
+
+def numeric_columns() -> List[str]:
+    """
+    Στήλες που διαβάζονται απευθείας ως float64
+
+    Returns:
+        List[str]: a/a και οι στήλες μετρήσεων (πριν και μετά τη μετονομασία)
+    """
+    cols = ["a/a"]
+    cols += list(config.COLUMN_RENAMES.keys()) + list(config.COLUMN_RENAMES.values())
+    cols += config.TWO_DECIMAL_COLS + config.FOUR_DECIMAL_COLS
+    return list(dict.fromkeys(cols))
+
+
+def plan_projection(header: List[str], drop_columns, protected_columns) -> List[int]:
+    """
+    Επιλέγει ποιες στήλες του header θα διαβαστούν
+
+    Παραλείπει ό,τι θα έσβηνε ο DataProcessor αμέσως μετά: τις στήλες του
+    COLS_TO_DELETE και την άχρηστη στήλη μετά το 'a/a' (με τους ίδιους
+    κανόνες με το _remove_column_after_aa).
+
+    Args:
+        header: Ονόματα στηλών όπως είναι στο αρχείο
+        drop_columns: Στήλες προς διαγραφή (χωρίς κενά)
+        protected_columns: Στήλες που δεν θεωρούνται ποτέ άχρηστες
+
+    Returns:
+        List[int]: Θέσεις στηλών προς ανάγνωση
+    """
+    skip = set()
+
+    if "a/a" in header:
+        idx = header.index("a/a")
+        if idx + 1 < len(header) and str(header[idx + 1]).strip() not in protected_columns:
+            skip.add(idx + 1)
+
+    for i, col in enumerate(header):
+        if str(col).strip() in drop_columns:
+            skip.add(i)
+
+    return [i for i in range(len(header)) if i not in skip]
+
+
+def read_excel_plain(file_path: str, engine: str = None) -> pd.DataFrame:
+    """Όπως το pd.read_excel, αλλά με τον engine της μορφής του αρχείου"""
+    with open_workbook(file_path, engine) as xl:
+        return xl.parse()
+
+
+def read_excel_projected(file_path: str, drop_columns=(), protected_columns=(),
+                         numeric_columns=(), engine: str = None) -> pd.DataFrame:
+    """
+    Διαβάζει το Excel με column projection και δηλωμένα dtypes
+
+    Το workbook ανοίγει μία φορά: πρώτα διαβάζεται μόνο ο header και μετά
+    μόνο οι χρήσιμες στήλες. Οι αριθμητικές στήλες διαβάζονται ως float64·
+    αν κάποια έχει κείμενο, γίνεται ανάγνωση με αυτόματα dtypes.
+
+    Args:
+        engine: Reader engine (αν None, ο επιλεγμένος για τη μορφή του αρχείου)
+
+    Returns:
+        pd.DataFrame: Δεδομένα με attrs['columns_projected'] = True
+    """
+    with open_workbook(file_path, engine) as xl:
+        header = xl.parse(nrows=0).columns.tolist()
+        usecols = plan_projection(header, drop_columns, protected_columns)
+
+        dtype = {
+            header[i]: "float64" for i in usecols
+            if str(header[i]).strip() in numeric_columns
+        }
+        try:
+            df = xl.parse(usecols=usecols, dtype=dtype)
+        except ValueError:
+            df = xl.parse(usecols=usecols)
+
+    df.attrs['columns_projected'] = True
+    return df
+
+
+def _iter_xlsx_rows(file_path: str, on_open: Callable[[Optional[int]], None] = None) -> Iterator[tuple]:
+    """
+    Γραμμές .xlsx μέσω openpyxl read_only (χωρίς φόρτωση όλου του φύλλου)
+
+    Το on_open δέχεται το πλήθος γραμμών από τις διαστάσεις του φύλλου (ή None).
+    """
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = wb.worksheets[0]
+        if on_open is not None:
+            on_open(sheet.max_row)
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _iter_xls_rows(file_path: str, on_open: Callable[[Optional[int]], None] = None) -> Iterator[list]:
+    """
+    Γραμμές .xls μέσω xlrd, μία-μία, με τις μετατροπές του read_excel
+    (κενά -> None, ακέραιοι αριθμοί -> int, ημερομηνίες -> datetime, #errors -> None)
+
+    Το on_open δέχεται το πλήθος γραμμών του φύλλου.
+    """
+    book = xlrd.open_workbook(file_path, on_demand=True)
+    try:
+        sheet = book.sheet_by_index(0)
+        if on_open is not None:
+            on_open(sheet.nrows)
+        for i in range(sheet.nrows):
+            yield [_xls_cell_value(cell, book.datemode) for cell in sheet.row(i)]
+    finally:
+        book.release_resources()
+
+
+def _xls_cell_value(cell, datemode: int):
+    """Τιμή κελιού xlrd όπως θα την έδινε το pd.read_excel"""
+    ctype, value = cell.ctype, cell.value
+    if ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+        return None
+    if ctype == xlrd.XL_CELL_NUMBER:
+        if math.isfinite(value) and value == int(value):
+            return int(value)
+        return value
+    if ctype == xlrd.XL_CELL_BOOLEAN:
+        return bool(value)
+    if ctype == xlrd.XL_CELL_DATE:
+        try:
+            return xlrd.xldate.xldate_as_datetime(value, datemode)
+        except OverflowError:
+            return value
+    return value
+
+
+def _header_names(raw_header) -> List[str]:
+    """Ονόματα στηλών με τους κανόνες του pd.read_excel (Unnamed: N, .1 σε διπλότυπα)"""
+    names = []
+    seen = {}
+    for i, name in enumerate(raw_header):
+        if name is None or (isinstance(name, str) and not name):
+            name = f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def iter_excel_chunks(file_path: str, chunk_size: int = None, project_columns: bool = True,
+                      progress: Callable[[int, Optional[int]], None] = None) -> Iterator[pd.DataFrame]:
+    """
+    Διαβάζει το Excel γραμμή-γραμμή και επιστρέφει DataFrame chunks
+
+    Εφαρμόζει την ίδια column projection και τα ίδια dtypes με το
+    read_excel_projected, ώστε κάθε chunk να μπαίνει κατευθείαν στον
+    DataProcessor. Στη μνήμη μένει μόνο ένα chunk κάθε φορά (για .xls το
+    xlrd κρατά ολόκληρο το φύλλο, αλλά όχι και ένα DataFrame όλου του αρχείου).
+
+    Args:
+        file_path: Διαδρομή .xls/.xlsx
+        chunk_size: Γραμμές ανά chunk (αν None, BATCH_SIZE * STREAM_CHUNK_BATCHES)
+        project_columns: Αν False, διαβάζονται όλες οι στήλες χωρίς δηλωμένα dtypes
+        progress: Callback με (γραμμές δεδομένων που διαβάστηκαν, σύνολο ή None)
+
+    Returns:
+        Iterator[pd.DataFrame]: Chunks (με attrs['columns_projected'] = True αν
+        έγινε projection)
+    """
+    chunk_size = chunk_size or config.BATCH_SIZE * config.STREAM_CHUNK_BATCHES
+    total = [None]
+
+    def on_open(sheet_rows):
+        # Χωρίς τη γραμμή του header
+        total[0] = max(sheet_rows - 1, 0) if sheet_rows is not None else None
+        if progress is not None:
+            progress(0, total[0])
+
+    fmt = sniff_format(file_path)
+    if fmt == "xlsx":
+        rows = _iter_xlsx_rows(file_path, on_open)
+    elif fmt == "xls":
+        rows = _iter_xls_rows(file_path, on_open)
+    else:
+        raise ValueError(f"Η streaming ανάγνωση υποστηρίζει μόνο .xls/.xlsx: {file_path}")
+
+    header = next(rows, None)
+    if header is None:
+        return
+    header = _header_names(header)
+
+    if project_columns:
+        usecols = plan_projection(header, tuple(config.COLS_TO_DELETE), tuple(config.PROTECTED_COLS))
+        numeric = set(numeric_columns())
+    else:
+        usecols = list(range(len(header)))
+        numeric = set()
+    columns = [header[i] for i in usecols]
+
+    def make_chunk(buffer):
+        chunk = pd.DataFrame(buffer, columns=columns)
+        for col in columns:
+            if str(col).strip() in numeric:
+                try:
+                    chunk[col] = chunk[col].astype("float64")
+                except (ValueError, TypeError):
+                    pass  # κείμενο στη στήλη· το format_decimals κάνει coerce
+        if project_columns:
+            chunk.attrs['columns_projected'] = True
+        return chunk
+
+    buffer = []
+    done = 0
+    for row in rows:
+        row = list(row) + [None] * (len(header) - len(row))
+        buffer.append([row[i] for i in usecols])
+        if len(buffer) == chunk_size:
+            done += len(buffer)
+            yield make_chunk(buffer)
+            buffer = []
+            if progress is not None:
+                progress(done, total[0])
+
+    if buffer:
+        done += len(buffer)
+        yield make_chunk(buffer)
+        if progress is not None:
+            progress(done, total[0])
+
+
+def _concat_chunks(parts: List[pd.DataFrame], project_columns: bool) -> pd.DataFrame:
+    """
+    Ενώνει τα chunks σε ένα DataFrame με τα dtypes που θα έδινε το load_excel
+
+    Αν κάποια αριθμητική στήλη έχει κείμενο, το read_excel_projected διαβάζει
+    όλο το αρχείο με αυτόματα dtypes· το ίδιο γίνεται κι εδώ.
+    """
+    df = pd.concat(parts, ignore_index=True)
+
+    if project_columns:
+        numeric = set(numeric_columns())
+        cols = [c for c in df.columns if str(c).strip() in numeric]
+        try:
+            df[cols] = df[cols].astype("float64")
+        except (ValueError, TypeError):
+            df = _infer_dtypes(df, int_columns=cols)
+        df.attrs['columns_projected'] = True
+    else:
+        df = _infer_dtypes(df)
+
+    return df
+
+
+def _infer_dtypes(df: pd.DataFrame, int_columns=()) -> pd.DataFrame:
+    """
+    Αυτόματα dtypes όπως του pd.read_excel: κενές στήλες -> float64 και
+    (στις int_columns που διαβάστηκαν ως float) ακέραιες τιμές -> int64
+    """
+    df = df.infer_objects()
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == object and values.isna().all():
+            df[col] = values.astype("float64")
+        elif (col in int_columns and values.dtype == "float64"
+              and values.notna().all() and (values == values.round()).all()):
+            df[col] = values.astype("int64")
+    return df
 
 
 def load_data() -> Tuple[pd.DataFrame, str, str]:
@@ -2,8 +2,12 @@
 Module για την επεξεργασία και καθαρισμό δεδομένων DataFrame
 Windows Version - Updated με Zero Nutrient Filter
 """
+import os
+import ast
+import numpy as np
 import pandas as pd
-from typing import List, Optional
+from decimal import Decimal
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 # Import config με fallback
 try:
@@ -15,9 +19,48 @@ except ImportError:
 class DataProcessor:
     """Κλάση για την επεξεργασία δεδομένων γάλακτος"""
     
-    def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+    def __init__(self, df: pd.DataFrame, verbose: bool = True,
+                 duplicates: "DuplicateDetector" = None,
+                 plan: "ProcessingPlan" = None):
+        """
+        Args:
+            df: Το αρχικό DataFrame
+            verbose: Αν False, τυπώνονται μόνο τα σφάλματα (π.χ. ανά chunk)
+            duplicates: DuplicateDetector κοινός για όλα τα chunks ενός αρχείου
+                (streaming), ώστε τα duplicates να βρίσκονται σε όλο το αρχείο
+            plan: ProcessingPlan για το header του df (από ProcessingPlan.for_frame)·
+                το φιλτράρισμα του plan δεν αλλάζει το df, οπότε δεν χρειάζεται αντίγραφο
+        """
+        self.plan = plan
+        self.df = df if plan is not None else df.copy()
+        self.verbose = verbose
+        self.duplicates = duplicates if duplicates is not None else DuplicateDetector()
+        # Σφάλματα δεκαδικών (column, row, value, decimals, max_decimals)
+        self.decimal_report = empty_decimal_report()
+        # Γραμμές που αφαιρέθηκαν / διπλά a/a (kind, row, a/a, first_row)
+        self.duplicate_report = empty_duplicate_report()
+
+    def _print(self, *args):
+        if self.verbose:
+            print(*args)
     
+    def run(self) -> pd.DataFrame:
+        """
+        Όλη η επεξεργασία: φιλτράρισμα, fixed-point, TS/SNF
+
+        Με plan εκτελούνται απευθείας τα βήματά του· αλλιώς οι μέθοδοι μία-μία.
+
+        Returns:
+            pd.DataFrame: Επεξεργασμένο DataFrame
+        """
+        if self.plan is not None:
+            return self.plan.execute(self)
+
+        self.initial_filtering()
+        self.format_decimals()
+        self.calculate_derived_values()
+        return self.df
+
     def initial_filtering(self) -> pd.DataFrame:
         """
         Εκτελεί αρχικό καθαρισμό και φιλτράρισμα του DataFrame
@@ -25,6 +68,10 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Καθαρισμένο DataFrame
         """
+        if self.plan is not None:
+            self.df, self.duplicate_report = self.plan.filter_frame(self.df, self.duplicates, self._print)
+            return self.df
+
         # Αφαίρεση περιττής στήλης μετά το 'a/a'
         self._remove_column_after_aa()
         
@@ -34,11 +81,11 @@ class DataProcessor:
         # Διαγραφή περιττών στηλών
         self._remove_unnecessary_columns()
         
-        # Αφαίρεση duplicates
-        self.df = self.df.drop_duplicates()
-        
-        # Καθαρισμός NaN σειρών στο a/a
-        self.df = self.df.dropna(subset=["a/a"])
+        # Αφαίρεση duplicates και γραμμών χωρίς a/a (με αναφορά)
+        rows, self.duplicate_report = self.duplicates.check(
+            self.df, list(self.df.columns), "a/a", log=self._print
+        )
+        self.df = self.df.iloc[rows]
         
         # Reset index
         self.df = self.df.reset_index(drop=True)
@@ -49,14 +96,17 @@ class DataProcessor:
         # Μετονομασίες στηλών
         self.df = self.df.rename(columns=config.COLUMN_RENAMES)
         dupes = self.df.columns[self.df.columns.duplicated()].tolist()
-        print("DUPLICATE COLS:", dupes)
+        self._print("DUPLICATE COLS:", dupes)
 
-        print(f"✅ Αρχικό filtering ολοκληρώθηκε. Σύνολο γραμμών: {len(self.df)}")
+        self._print(f"✅ Αρχικό filtering ολοκληρώθηκε. Σύνολο γραμμών: {len(self.df)}")
         return self.df
-    
 
     def _remove_column_after_aa(self):
         """Διαγράφει τη στήλη αμέσως μετά το 'a/a' ΜΟΝΟ αν είναι άχρηστη."""
+        # Ο DataLoader την έχει ήδη παραλείψει κατά την ανάγνωση
+        if self.df.attrs.get("columns_projected"):
+            return
+
         cols = self.df.columns.tolist()
         if "a/a" not in cols:
             return
@@ -68,50 +118,61 @@ class DataProcessor:
         col_to_delete = cols[idx + 1]
 
         # ✅ Προστασία: ΜΗΝ σβήνεις χρήσιμες στήλες
-        protected = {"Fat", "Protein", "Lactose", "FPD", "freeze point", "proteine", "fat", "lactose"}
-        if col_to_delete.strip() in protected:
+        if col_to_delete.strip() in config.PROTECTED_COLS:
             # Είναι χρήσιμη → μην την πειράξεις
             return
 
         self.df = self.df.drop(columns=[col_to_delete])
-        print(f"Η στήλη '{col_to_delete}' διαγράφηκε.")
+        self._print(f"Η στήλη '{col_to_delete}' διαγράφηκε.")
 
     def _remove_unnecessary_columns(self):
         """Διαγράφει περιττές στήλες"""
         cols_to_delete = [col for col in config.COLS_TO_DELETE if col in self.df.columns]
         if cols_to_delete:
             self.df = self.df.drop(columns=cols_to_delete)
-            print(f"Διαγράφηκαν στήλες: {cols_to_delete}")
+            self._print(f"Διαγράφηκαν στήλες: {cols_to_delete}")
     
     def format_decimals(self, two_dec_cols: List[str] = None, 
                        four_dec_cols: List[str] = None) -> pd.DataFrame:
         """
-        Μορφοποιεί δεκαδικά ψηφία και ελέγχει για σφάλματα
+        Μετατρέπει τις στήλες μετρήσεων σε ακέραιους fixed-point
+
+        Οι τιμές στρογγυλεύονται μία φορά (όπως το _smart_format) και
+        αποθηκεύονται ως Int64 σε εκατοστά (2 δεκαδικά) ή δεκάκις-χιλιοστά
+        (4 δεκαδικά). Το κείμενο φτιάχνεται μόνο κατά την εγγραφή του CSV
+        (βλ. output_column).
         
         Args:
             two_dec_cols: Στήλες με 2 δεκαδικά
             four_dec_cols: Στήλες με 4 δεκαδικά
             
         Returns:
-            pd.DataFrame: Μορφοποιημένο DataFrame
+            pd.DataFrame: DataFrame με τις στήλες σε fixed-point
         """
-        two_dec_cols = two_dec_cols or config.TWO_DECIMAL_COLS
-        four_dec_cols = four_dec_cols or config.FOUR_DECIMAL_COLS
-        
-        # Μορφοποίηση
-        for col in two_dec_cols:
-            if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
-                self.df[col] = self.df[col].apply(lambda x: self._smart_format(x, 2))
+        if two_dec_cols is None:
+            two_dec_cols = config.TWO_DECIMAL_COLS
+        if four_dec_cols is None:
+            four_dec_cols = config.FOUR_DECIMAL_COLS
+        fixed_point = dict(self.df.attrs.get('fixed_point', {}))
         
-        for col in four_dec_cols:
-            if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
-                self.df[col] = self.df[col].apply(lambda x: self._smart_format(x, 4))
+        # Μετατροπή
+        for cols, decimals in ((two_dec_cols, 2), (four_dec_cols, 4)):
+            for col in cols:
+                if col not in self.df.columns:
+                    continue
+                numeric = pd.to_numeric(self.df[col], errors='coerce')
+                self.df[col] = to_fixed_point(numeric, decimals)
+                fixed_point[col] = (decimals, 0)
+
+                lost = int((numeric.notna() & self.df[col].isna()).sum())
+                if lost:
+                    self._print(f"⚠️ Στήλη '{col}': {lost} τιμές εκτός εύρους (±inf/τεράστιες) έγιναν κενές")
+
+        self.df.attrs['fixed_point'] = fixed_point
         
-        # Έλεγχος δεκαδικών
-        self._validate_decimals(two_dec_cols, 2)
-        self._validate_decimals(four_dec_cols, 4)
+        # Έλεγχος δεκαδικών (οι fixed-point στήλες τηρούν τα όρια εξ ορισμού)
+        self._validate_decimals([c for c in two_dec_cols if c not in fixed_point], 2)
+        self._validate_decimals([c for c in four_dec_cols if c not in fixed_point], 4)
         
         return self.df
     
@@ -136,53 +197,67 @@ class DataProcessor:
             return len(s.split(".")[1])
         return 0
     
-    def _validate_decimals(self, columns: List[str], max_decimals: int):
-        """Ελέγχει αν οι στήλες τηρούν τα όρια δεκαδικών"""
-        decimal_errors = []
-        
-        for col in columns:
-            if col not in self.df.columns:
-                continue
-            
-            for idx, val in self.df[col].items():
-                decs = self._count_decimals(val)
-                if decs > max_decimals:
-                    decimal_errors.append(
-                        f"Στήλη '{col}', γραμμή {idx}, τιμή {val} "
-                        f"έχει {decs} δεκαδικά (max {max_decimals})"
-                    )
-        
-        if not decimal_errors:
-            print(f"✅ Όλες οι στήλες τηρούν σωστά τα όρια {max_decimals} δεκαδικών.")
+    def _validate_decimals(self, columns: List[str], max_decimals: int) -> pd.DataFrame:
+        """
+        Ελέγχει αν οι στήλες τηρούν τα όρια δεκαδικών
+
+        Returns:
+            pd.DataFrame: Οι παραβάσεις (προστίθενται και στο self.decimal_report)
+        """
+        report = find_decimal_errors(self.df, columns, max_decimals)
+        if not report.empty:
+            self.decimal_report = pd.concat([self.decimal_report, report], ignore_index=True)
+
+        if report.empty:
+            self._print(f"✅ Όλες οι στήλες τηρούν σωστά τα όρια {max_decimals} δεκαδικών.")
         else:
-            print(f"❌ Βρέθηκαν {len(decimal_errors)} σφάλματα δεκαδικών:")
-            for err in decimal_errors[:5]:  # Εμφάνιση μόνο 5 πρώτων
-                print(f"  {err}")
-            if len(decimal_errors) > 5:
-                print(f"  ... και {len(decimal_errors) - 5} ακόμα σφάλματα")
+            print(f"❌ Βρέθηκαν {len(report)} σφάλματα δεκαδικών:")
+            for err in report.head(5).itertuples(index=False):  # Εμφάνιση μόνο 5 πρώτων
+                print(f"  Στήλη '{err.column}', γραμμή {err.row}, τιμή {err.value} "
+                      f"έχει {err.decimals} δεκαδικά (max {err.max_decimals})")
+            if len(report) > 5:
+                print(f"  ... και {len(report) - 5} ακόμα σφάλματα")
+
+        return report
     
-    def calculate_derived_values(self) -> pd.DataFrame:
+    def calculate_derived_values(self, formulas: List["DerivedFormula"] = None) -> pd.DataFrame:
         """
-        Υπολογίζει παράγωγες τιμές (TS, SNF)
-        
+        Υπολογίζει παράγωγες τιμές (TS, SNF και όσες ορίζει το config.DERIVED_COLUMNS)
+
+        Κάθε στήλη πηγής μετατρέπεται μία φορά σε πίνακα NumPy, κοινό για
+        όλες τις εκφράσεις. Οι εκφράσεις με προσθέσεις/αφαιρέσεις
+        υπολογίζονται ακριβώς, σε ακέραιες μονάδες (π.χ. εκατοστά).
+
+        Args:
+            formulas: Μεταφρασμένες εκφράσεις (αν None, compile_derived_formulas())
+
         Returns:
             pd.DataFrame: DataFrame με νέες στήλες
         """
-        # Υπολογισμός TS (Total Solids)
-        self.df['TS'] = (
-            self.df['Fat'].astype(float) + 
-            self.df['Protein'].astype(float) + 
-            self.df['Lactose'].astype(float)
-        ).round(2)
-        
-        # Υπολογισμός SNF (Solids Non-Fat)
-        self.df['SNF'] = (
-            self.df['Protein'].astype(float) + 
-            self.df['Lactose'].astype(float) + 
-            0.7
-        ).round(2)
-        
-        print("✅ Υπολογίστηκαν TS και SNF")
+        if formulas is None:
+            formulas = compile_derived_formulas()
+        fixed_point = dict(self.df.attrs.get('fixed_point', {}))
+        buffers = FormulaBuffers(self.df, fixed_point)
+
+        computed = []
+        for formula in formulas:
+            missing = [col for col in formula.columns if col not in self.df.columns]
+            if missing:
+                self._print(f"⚠️ Η στήλη '{formula.name}' δεν υπολογίστηκε (λείπουν: {missing})")
+                continue
+
+            self.df[formula.name] = formula.evaluate(buffers)
+            # Γράφονται όπως ένας float (π.χ. "12.0"), όπως πριν
+            fixed_point[formula.name] = (formula.decimals, 1)
+            buffers.invalidate(formula.name)
+            computed.append(formula.name)
+
+        self.df.attrs['fixed_point'] = fixed_point
+
+        if computed:
+            names = computed[0] if len(computed) == 1 else \
+                ", ".join(computed[:-1]) + " και " + computed[-1]
+            self._print(f"✅ Υπολογίστηκαν {names}")
         return self.df
     
     def get_processed_data(self) -> pd.DataFrame:
@@ -190,32 +265,848 @@ class DataProcessor:
         return self.df
 
 
-def process_data(excel_df: pd.DataFrame) -> pd.DataFrame:
+class ProcessingPlan:
+    """
+    Οι αποφάσεις του DataProcessor για ένα header, υπολογισμένες μία φορά
+
+    Από το config και τα ονόματα στηλών προκύπτουν οι θέσεις των στηλών
+    που μένουν, τα τελικά ονόματα (strip + COLUMN_RENAMES), οι στήλες
+    για τον έλεγχο duplicates και οι στήλες fixed-point. Τα plans
+    κρατιούνται ανά υπογραφή header (+ config), οπότε αρχεία με την ίδια
+    διάταξη οργάνου εκτελούν απευθείας τα βήματα.
+    """
+
+    CACHE_SIZE = 128
+    _cache: dict = {}
+
+    def __init__(self, header: tuple, columns_projected: bool = False):
+        """
+        Args:
+            header: Τα ονόματα στηλών όπως στο DataFrame του Excel
+            columns_projected: Αν ο DataLoader έχει ήδη παραλείψει τη στήλη μετά το 'a/a'
+
+        Raises:
+            ValueError: Αν το header δεν επιτρέπει plan (ονόματα που δεν είναι
+                κείμενο, διπλά ονόματα ή χωρίς 'a/a')· τότε ο DataProcessor
+                ακολουθεί τα βήματα ένα-ένα
+        """
+        labels = list(header)
+        if not all(isinstance(c, str) for c in labels):
+            raise ValueError("Ονόματα στηλών που δεν είναι κείμενο")
+        stripped = [c.strip() for c in labels]
+        if len(set(stripped)) != len(stripped) or "a/a" not in stripped:
+            raise ValueError("Διπλά ονόματα στηλών ή χωρίς 'a/a'")
+
+        self.header = tuple(labels)
+        self.columns_projected = columns_projected
+        keep = list(range(len(labels)))
+
+        # Η άχρηστη στήλη μετά το 'a/a' (όπως το _remove_column_after_aa)
+        self.dropped_after_aa = None
+        if not columns_projected and "a/a" in labels:
+            idx = labels.index("a/a")
+            if idx + 1 < len(labels) and stripped[idx + 1] not in config.PROTECTED_COLS:
+                self.dropped_after_aa = labels[idx + 1]
+                keep.remove(idx + 1)
+
+        # Περιττές στήλες (όπως το _remove_unnecessary_columns)
+        present = {stripped[i] for i in keep}
+        self.deleted = [col for col in config.COLS_TO_DELETE if col in present]
+        keep = [i for i in keep if stripped[i] not in self.deleted]
+
+        self.keep = keep
+        self.subset = [labels[i] for i in keep]
+        self.aa_label = labels[stripped.index("a/a")]
+        self.columns = [config.COLUMN_RENAMES.get(stripped[i], stripped[i]) for i in keep]
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("Διπλές στήλες μετά τις μετονομασίες")
+
+        self.two_dec_cols = [c for c in config.TWO_DECIMAL_COLS if c in self.columns]
+        self.four_dec_cols = [c for c in config.FOUR_DECIMAL_COLS if c in self.columns]
+        self.derived = compile_derived_formulas()
+
+        # Τα βήματα με τη σειρά εκτέλεσης· το καθένα δέχεται τον DataProcessor
+        self.steps = [
+            ("filter", self._filter),
+            ("fixed_point", self._fixed_point),
+            ("derived", self._derived),
+        ]
+
+    @staticmethod
+    def config_signature() -> tuple:
+        """Οι ρυθμίσεις του config από τις οποίες εξαρτάται ένα plan"""
+        return (
+            tuple(config.COLS_TO_DELETE),
+            tuple(config.PROTECTED_COLS),
+            tuple(config.COLUMN_RENAMES.items()),
+            tuple(config.TWO_DECIMAL_COLS),
+            tuple(config.FOUR_DECIMAL_COLS),
+            tuple(map(str, config.DERIVED_COLUMNS.items())),
+        )
+
+    @classmethod
+    def for_frame(cls, df: pd.DataFrame) -> Optional["ProcessingPlan"]:
+        """
+        Το plan για το header του df (από την cache αν υπάρχει)
+
+        Returns:
+            Optional[ProcessingPlan]: None αν το header δεν επιτρέπει plan
+        """
+        projected = bool(df.attrs.get("columns_projected"))
+        key = (tuple(df.columns), projected, cls.config_signature())
+        if key in cls._cache:
+            return cls._cache[key]
+
+        try:
+            plan = cls(key[0], projected)
+        except ValueError:
+            plan = None
+
+        if len(cls._cache) >= cls.CACHE_SIZE:
+            cls._cache.pop(next(iter(cls._cache)))
+        cls._cache[key] = plan
+        return plan
+
+    def execute(self, processor: DataProcessor) -> pd.DataFrame:
+        """Εκτελεί τα βήματα πάνω στο processor.df"""
+        for _, step in self.steps:
+            step(processor)
+        return processor.df
+
+    def filter_frame(self, df: pd.DataFrame, duplicates: "DuplicateDetector" = None,
+                     log=print) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Το initial_filtering με μία μόνο δέσμευση μνήμης
+
+        Αντί για drop → drop_duplicates → dropna → reset_index → rename (ένα
+        νέο DataFrame σε κάθε βήμα), μία μάσκα γραμμών (duplicates + κενό
+        a/a) και ένα iloc στις στήλες του plan. Index και ονόματα στηλών
+        αλλάζουν χωρίς αντιγραφή· το df δεν τροποποιείται.
+
+        Args:
+            df: DataFrame με header ίδιο με του plan
+            duplicates: DuplicateDetector (αν None, νέος μόνο για το df)
+            log: Συνάρτηση για τα μηνύματα
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: (καθαρισμένο DataFrame, αναφορά duplicates)
+        """
+        if tuple(df.columns) != self.header:
+            raise ValueError("Το DataFrame δεν έχει το header του plan")
+
+        if self.dropped_after_aa is not None:
+            log(f"Η στήλη '{self.dropped_after_aa}' διαγράφηκε.")
+        if self.deleted:
+            log(f"Διαγράφηκαν στήλες: {self.deleted}")
+
+        # Οι γραμμές που μένουν: όχι duplicates (στις στήλες που μένουν), με a/a
+        if duplicates is None:
+            duplicates = DuplicateDetector()
+        rows, report = duplicates.check(df, self.subset, self.aa_label, log=log)
+
+        out = df.iloc[rows, self.keep]
+        out.index = pd.RangeIndex(len(out))
+        out.columns = self.columns
+        out["a/a"] = out["a/a"].astype(int)
+
+        log("DUPLICATE COLS:", [])
+        log(f"✅ Αρχικό filtering ολοκληρώθηκε. Σύνολο γραμμών: {len(out)}")
+        return out, report
+
+    def _filter(self, processor: DataProcessor):
+        processor.df, processor.duplicate_report = self.filter_frame(
+            processor.df, processor.duplicates, processor._print
+        )
+
+    def _fixed_point(self, processor: DataProcessor):
+        processor.format_decimals(self.two_dec_cols, self.four_dec_cols)
+
+    def _derived(self, processor: DataProcessor):
+        processor.calculate_derived_values(self.derived)
+
+
+def _two_product(a: np.ndarray, b: float):
+    """
+    Γινόμενο χωρίς σφάλμα (Dekker): a * b == p + e ακριβώς, με p = fl(a * b)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (p, e)
+    """
+    def split(v):
+        c = 134217729.0 * v  # 2^27 + 1 (Veltkamp)
+        high = c - (c - v)
+        return high, v - high
+
+    p = a * b
+    a_hi, a_lo = split(a)
+    b_hi, b_lo = split(np.float64(b))
+    e = ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+    return p, e
+
+
+DUPLICATE_REPORT_COLUMNS = ['kind', 'row', 'a/a', 'first_row']
+
+
+def empty_duplicate_report() -> pd.DataFrame:
+    """Κενή αναφορά duplicates"""
+    return pd.DataFrame({
+        'kind': pd.Series(dtype=object),
+        'row': pd.Series(dtype="int64"),
+        'a/a': pd.Series(dtype="int64"),
+        'first_row': pd.Series(dtype="int64"),
+    })
+
+
+def row_fingerprints(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Ένα hash (uint64) ανά γραμμή, από τις τιμές των columns"""
+    if not columns:
+        return np.zeros(len(df), dtype=np.uint64)
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+def _first_rows(keys: np.ndarray):
+    """
+    Για κάθε θέση, η θέση της πρώτης εμφάνισης του ίδιου κλειδιού
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (κωδικοί, μοναδικά κλειδιά,
+        θέση πρώτης εμφάνισης κάθε μοναδικού κλειδιού)
+    """
+    codes, uniques = pd.factorize(keys)
+    # Οι κωδικοί δίνονται με σειρά πρώτης εμφάνισης: η k-οστή νέα τιμή είναι ο κωδικός k
+    new = np.ones(len(codes), dtype=bool)
+    if len(codes) > 1:
+        new[1:] = codes[1:] > np.maximum.accumulate(codes)[:-1]
+    return codes, uniques, np.flatnonzero(new)
+
+
+class DuplicateDetector:
+    """
+    Διπλές γραμμές και διπλά a/a, με αναφορά για όσα αφαιρούνται
+
+    Οι διπλές γραμμές βρίσκονται από ένα hash ανά γραμμή
+    (pd.util.hash_pandas_object) σε γραμμικό χρόνο. Οι γραμμές που μένουν
+    ελέγχονται ξεχωριστά για a/a που υπάρχει ήδη με άλλες τιμές· αυτές
+    δεν αφαιρούνται, μόνο αναφέρονται. Με track=True ο έλεγχος συνεχίζει
+    σε διαδοχικά chunks του ίδιου αρχείου.
+    """
+
+    def __init__(self, track: bool = False):
+        """
+        Args:
+            track: Κρατά hashes/a/a για τα επόμενα chunks (streaming)
+        """
+        self.track = track
+        self.offset = 0         # Γραμμές που έχουν ήδη ελεγχθεί (για τις θέσεις της αναφοράς)
+        self.seen_rows = {}     # hash γραμμής → θέση πρώτης εμφάνισης
+        self.seen_aa = {}       # a/a → θέση πρώτης εμφάνισης
+
+    def _first_seen(self, keys: np.ndarray, positions: np.ndarray, seen: dict) -> np.ndarray:
+        """
+        Για κάθε κλειδί, η θέση (στο αρχείο) της πρώτης εμφάνισής του σε
+        αυτό ή σε προηγούμενα chunks· positions: η θέση κάθε κλειδιού
+        """
+        codes, uniques, first = _first_rows(keys)
+        first = positions[first]
+        if self.track:
+            # Ένα lookup ανά μοναδική τιμή του chunk
+            previous = np.fromiter((seen.get(key, -1) for key in uniques.tolist()),
+                                   dtype=np.int64, count=len(uniques))
+            known = previous >= 0
+            seen.update(zip(uniques[~known].tolist(), first[~known].tolist()))
+            first = np.where(known, previous, first)
+        return first[codes]
+
+    def check(self, df: pd.DataFrame, columns: List[str], aa_label: str = "a/a",
+              log=print):
+        """
+        Οι γραμμές που μένουν και η αναφορά duplicates
+
+        Args:
+            df: DataFrame (ή chunk)
+            columns: Στήλες για τον έλεγχο διπλών γραμμών
+            aa_label: Η στήλη a/a (οι γραμμές χωρίς a/a αφαιρούνται)
+            log: Συνάρτηση για τα μηνύματα (π.χ. DataProcessor._print)
+
+        Returns:
+            Tuple[np.ndarray, pd.DataFrame]: (θέσεις γραμμών που μένουν,
+            αναφορά με kind 'duplicate_row' / 'aa_conflict', row, a/a, first_row)
+        """
+        positions = np.arange(len(df)) + self.offset
+        aa = df[aa_label].to_numpy()
+        has_aa = pd.notna(aa)
+
+        # Διπλές γραμμές (ίδιο hash με προηγούμενη)
+        first = self._first_seen(row_fingerprints(df, columns), positions, self.seen_rows)
+        dup = first != positions
+        rows = np.flatnonzero(~dup & has_aa)
+
+        # Διπλά a/a στις γραμμές που μένουν (όπως θα γραφτούν, ως ακέραιοι)
+        aa_kept = aa[rows].astype(np.int64)
+        first_aa = self._first_seen(aa_kept, positions[rows], self.seen_aa)
+        conflict = first_aa != positions[rows]
+
+        # Στην αναφορά οι διπλές γραμμές με a/a (όχι οι κενές γραμμές του φύλλου)
+        dropped = np.flatnonzero(dup & has_aa)
+        conflicts = rows[conflict]
+        report = pd.DataFrame({
+            'kind': ['duplicate_row'] * len(dropped) + ['aa_conflict'] * len(conflicts),
+            'row': np.concatenate([positions[dropped], positions[conflicts]]),
+            'a/a': np.concatenate([aa[dropped].astype(np.int64), aa_kept[conflict]]),
+            'first_row': np.concatenate([first[dropped], first_aa[conflict]]),
+        }) if len(dropped) or len(conflicts) else empty_duplicate_report()
+
+        if len(dropped):
+            log(f"⚠️ Αφαιρέθηκαν {len(dropped)} διπλές γραμμές")
+        if len(conflicts):
+            log(f"⚠️ {len(conflicts)} γραμμές με a/a που υπάρχει ήδη (κρατήθηκαν)")
+
+        self.offset += len(df)
+        return rows, report
+
+
+ROUND_BLOCK_ROWS = 65536
+
+
+def _round_scaled(x: np.ndarray, decimals: int):
+    """
+    |x| * 10^decimals στρογγυλεμένο στον πλησιέστερο ακέραιο, ακριβώς όπως το f-string
+
+    Round-half-even στην πραγματική δυαδική τιμή: το γινόμενο υπολογίζεται
+    μαζί με το σφάλμα του, οπότε οι τιμές κοντά στο .5 αποφασίζονται σωστά.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (|στρογγυλεμένη τιμή| ως int64,
+        μάσκα τιμών που χωρούν — όχι NaN, ±inf ή >= 2^52)
+    """
+    magnitude = np.zeros(len(x), dtype=np.int64)
+    fast = np.zeros(len(x), dtype=bool)
+
+    # Σε τμήματα, ώστε οι ενδιάμεσοι πίνακες να μη μεγαλώνουν με το αρχείο
+    for start in range(0, len(x), ROUND_BLOCK_ROWS):
+        block = x[start:start + ROUND_BLOCK_ROWS]
+        with np.errstate(invalid="ignore", over="ignore"):  # ±inf / τεράστιες τιμές
+            scaled, error = _two_product(np.abs(block), 10.0 ** decimals)
+            whole = np.floor(scaled)
+            # Ακριβές πρόσημο του (|x| * 10^decimals - whole - 0.5)
+            half = (scaled - whole) - 0.5
+            up = (half > 0) | ((half == 0) & ((error > 0) | ((error == 0) & (np.fmod(whole, 2) == 1))))
+            ok = np.isfinite(block) & (scaled < 2.0 ** 52)
+
+        fast[start:start + len(block)] = ok
+        magnitude[start:start + len(block)][ok] = (whole[ok] + up[ok]).astype(np.int64)
+
+    return magnitude, fast
+
+
+def format_decimal_strings(values: pd.Series, decimals: int) -> pd.Series:
+    """
+    Vectorised εκδοχή του values.apply(lambda x: DataProcessor._smart_format(x, decimals))
+
+    Η στρογγυλοποίηση γίνεται με NumPy (_round_scaled) και το κείμενο
+    φτιάχνεται μία φορά ανά μοναδική στρογγυλεμένη τιμή. Μόνο ±inf και
+    τεράστιες τιμές περνούν από το _smart_format.
+
+    Args:
+        values: Αριθμητική στήλη (μετά το pd.to_numeric)
+        decimals: Πλήθος δεκαδικών
+
+    Returns:
+        pd.Series: Κείμενα χωρίς μηδενικά στο τέλος· τα NaN μένουν NaN
+    """
+    dtype = values.dtype
+    if len(values) == 0 or not isinstance(dtype, np.dtype) or dtype.kind not in "biuf":
+        return values.apply(lambda x: DataProcessor._smart_format(x, decimals))
+
+    x = values.to_numpy(dtype="float64")
+    out = np.empty(len(x), dtype=object)
+
+    nan = np.isnan(x)
+    out[nan] = np.nan
+
+    magnitude, fast = _round_scaled(x, decimals)
+
+    # Κλειδί ανά (|στρογγυλεμένη τιμή|, πρόσημο)· το "-" μένει και όταν στρογγυλεύει σε 0
+    negative = np.signbit(x[fast]).astype(np.int64)
+    codes, uniques = pd.factorize(magnitude[fast] * 2 + negative)
+
+    unit = 10 ** decimals
+    texts = []
+    for key in uniques.tolist():
+        whole_part, frac = divmod(key >> 1, unit)
+        text = f"{whole_part}.{frac:0{decimals}d}" if decimals > 0 else f"{whole_part}"
+        text = text.rstrip("0").rstrip(".")
+        texts.append("-" + text if key & 1 else text)
+    out[fast] = np.array(texts, dtype=object)[codes]
+
+    slow = ~fast & ~nan
+    out[slow] = [DataProcessor._smart_format(v, decimals) for v in x[slow].tolist()]
+
+    return pd.Series(out, index=values.index, name=values.name).infer_objects()
+
+
+# ---------- FIXED-POINT ----------
+
+def to_fixed_point(values: pd.Series, decimals: int) -> pd.Series:
+    """
+    Αριθμητική στήλη → Int64 σε μονάδες 10^-decimals (π.χ. 3.55 → 355 για 2 δεκαδικά)
+
+    Η στρογγυλοποίηση είναι ίδια με του format_decimal_strings. NaN, ±inf
+    και τεράστιες τιμές γίνονται <NA>.
+
+    Args:
+        values: Αριθμητική στήλη (μετά το pd.to_numeric)
+        decimals: Πλήθος δεκαδικών
+
+    Returns:
+        pd.Series: Στήλη Int64
+    """
+    x = values.to_numpy(dtype="float64", na_value=np.nan)
+    magnitude, ok = _round_scaled(x, decimals)
+    signed = np.where(np.signbit(x), -magnitude, magnitude)
+    return pd.Series(pd.arrays.IntegerArray(signed, ~ok), index=values.index, name=values.name)
+
+
+def rescale_fixed_point(values: pd.Series, decimals: int, new_decimals: int) -> pd.Series:
+    """
+    Αλλαγή κλίμακας fixed-point στήλης (round-half-even όταν μειώνονται τα δεκαδικά)
+
+    Returns:
+        pd.Series: Στήλη Int64 σε μονάδες 10^-new_decimals
+    """
+    if new_decimals >= decimals:
+        return values * 10 ** (new_decimals - decimals)
+
+    factor = 10 ** (decimals - new_decimals)
+    mask = values.isna().to_numpy()
+    ints = values.to_numpy(dtype="int64", na_value=0)
+    quotient, remainder = np.divmod(ints, factor)
+    up = (2 * remainder > factor) | ((2 * remainder == factor) & (quotient % 2 == 1))
+    return pd.Series(pd.arrays.IntegerArray(quotient + up, mask),
+                     index=values.index, name=values.name)
+
+
+def format_fixed_point(values: pd.Series, decimals: int, min_decimals: int = 0) -> pd.Series:
+    """
+    Κείμενα μιας fixed-point στήλης για το CSV (μία φορά ανά μοναδική τιμή)
+
+    Args:
+        values: Στήλη Int64 σε μονάδες 10^-decimals
+        decimals: Πλήθος δεκαδικών της κλίμακας
+        min_decimals: Ελάχιστα δεκαδικά στο κείμενο (0: "12", όπως το
+            _smart_format· 1: "12.0", όπως ένας float)
+
+    Returns:
+        pd.Series: Κείμενα (object)· τα <NA> γίνονται NaN (κενό κελί στο CSV)
+    """
+    mask = values.isna().to_numpy()
+    ints = values.to_numpy(dtype="int64", na_value=0)
+    out = np.full(len(ints), np.nan, dtype=object)
+
+    codes, uniques = pd.factorize(ints[~mask])
+    unit = 10 ** decimals
+    texts = []
+    for value in uniques.tolist():
+        whole, frac = divmod(abs(value), unit)
+        digits = f"{frac:0{decimals}d}".rstrip("0") if decimals > 0 else ""
+        digits = digits.ljust(min_decimals, "0")
+        text = f"{whole}.{digits}" if digits else f"{whole}"
+        texts.append("-" + text if value < 0 else text)
+    out[~mask] = np.array(texts, dtype=object)[codes]
+
+    return pd.Series(out, index=values.index, name=values.name)
+
+
+def output_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """
+    Η στήλη όπως γράφεται στο CSV: οι fixed-point στήλες (df.attrs['fixed_point'])
+    γίνονται κείμενο, οι υπόλοιπες επιστρέφονται όπως είναι
+    """
+    spec = df.attrs.get('fixed_point', {}).get(col)
+    if spec is None:
+        return df[col]
+    return format_fixed_point(df[col], *spec)
+
+
+# ---------- ΠΑΡΑΓΩΓΕΣ ΣΤΗΛΕΣ ----------
+
+_FORMULA_OPERATORS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+}
+
+
+class FormulaBuffers:
+    """
+    Οι στήλες πηγής των εκφράσεων ως πίνακες NumPy, ένας ανά στήλη και κλίμακα
+
+    Ακέραιοι σε μονάδες 10^-decimals (+ μάσκα κενών) για τις ακριβείς
+    εκφράσεις, float64 με NaN για τις υπόλοιπες. Κάθε στήλη μετατρέπεται
+    μία φορά, όσες εκφράσεις κι αν τη χρησιμοποιούν.
+    """
+
+    def __init__(self, df: pd.DataFrame, fixed_point: dict):
+        self.df = df
+        self.fixed_point = fixed_point
+        self._ints = {}
+        self._floats = {}
+
+    def ints(self, col: str, decimals: int) -> pd.arrays.IntegerArray:
+        """Η στήλη σε μονάδες 10^-decimals (Int64· οι πράξεις διαδίδουν τα κενά)"""
+        key = (col, decimals)
+        if key not in self._ints:
+            spec = self.fixed_point.get(col)
+            if spec is None:
+                values = to_fixed_point(pd.to_numeric(self.df[col], errors='coerce'), decimals)
+            elif spec[0] == decimals:
+                values = self.df[col]
+            else:
+                values = rescale_fixed_point(self.df[col], spec[0], decimals)
+            self._ints[key] = values.array
+        return self._ints[key]
+
+    def floats(self, col: str) -> np.ndarray:
+        """Η στήλη ως float64 (κενά → NaN)"""
+        if col not in self._floats:
+            spec = self.fixed_point.get(col)
+            if spec is None:
+                values = pd.to_numeric(self.df[col], errors='coerce')
+                self._floats[col] = values.to_numpy(dtype="float64", na_value=np.nan)
+            else:
+                values = self.df[col].to_numpy(dtype="float64", na_value=np.nan)
+                self._floats[col] = values / 10 ** spec[0]
+        return self._floats[col]
+
+    def invalidate(self, col: str):
+        """Η στήλη άλλαξε (νέα παράγωγη τιμή)· ξαναδιαβάζεται την επόμενη φορά"""
+        self._floats.pop(col, None)
+        for key in [key for key in self._ints if key[0] == col]:
+            del self._ints[key]
+
+
+class DerivedFormula:
+    """
+    Μια παράγωγη στήλη, μεταφρασμένη μία φορά από κείμενο σε πράξεις NumPy
+
+    Η έκφραση (π.χ. "Protein + Lactose + 0.70") δέχεται ονόματα στηλών,
+    αριθμούς, + - * / και παρενθέσεις. Με μόνο προσθέσεις/αφαιρέσεις και
+    σταθερές που χωρούν στα decimals, ο υπολογισμός γίνεται ακριβώς σε
+    ακέραιες μονάδες 10^-decimals· αλλιώς σε float64, με στρογγυλοποίηση
+    στα decimals όπως το format_decimal_strings.
+    """
+
+    def __init__(self, name: str, expression: str, decimals: int = 2):
+        """
+        Args:
+            name: Όνομα της νέας στήλης
+            expression: Η έκφραση
+            decimals: Δεκαδικά του αποτελέσματος
+
+        Raises:
+            ValueError: Αν η έκφραση δεν είναι έγκυρη
+        """
+        self.name = name
+        self.expression = expression
+        self.decimals = decimals
+        self.columns: List[str] = []
+
+        try:
+            tree = ast.parse(expression, mode="eval").body
+        except SyntaxError as e:
+            raise ValueError(f"Μη έγκυρη έκφραση για '{name}': {expression}") from e
+
+        self.exact = self._is_exact(tree)
+        self._func = self._compile(tree)
+
+    def _is_exact(self, node) -> bool:
+        """True αν η έκφραση υπολογίζεται ακριβώς σε ακέραιες μονάδες"""
+        if isinstance(node, ast.BinOp):
+            return (isinstance(node.op, (ast.Add, ast.Sub))
+                    and self._is_exact(node.left) and self._is_exact(node.right))
+        if isinstance(node, ast.UnaryOp):
+            return self._is_exact(node.operand)
+        if isinstance(node, ast.Constant):
+            return isinstance(node.value, (int, float)) and self._scaled(node.value) is not None
+        return isinstance(node, ast.Name)
+
+    def _scaled(self, value) -> Optional[int]:
+        """Η σταθερά σε μονάδες 10^-decimals, ή None αν δεν χωρά ακριβώς"""
+        scaled = Decimal(repr(value)).scaleb(self.decimals)
+        return int(scaled) if scaled == scaled.to_integral_value() else None
+
+    def _compile(self, node):
+        """Συνάρτηση env → πίνακας για τον κόμβο (env: στήλη → πίνακας)"""
+        if isinstance(node, ast.Name):
+            name = node.id
+            if name not in self.columns:
+                self.columns.append(name)
+            return lambda env: env[name]
+
+        if (isinstance(node, ast.Constant) and isinstance(node.value, (int, float))
+                and not isinstance(node.value, bool)):
+            value = self._scaled(node.value) if self.exact else float(node.value)
+            return lambda env: value
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            operand = self._compile(node.operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            return lambda env: np.negative(operand(env))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _FORMULA_OPERATORS:
+            op = _FORMULA_OPERATORS[type(node.op)]
+            left, right = self._compile(node.left), self._compile(node.right)
+            return lambda env: op(left(env), right(env))
+
+        raise ValueError(f"Μη επιτρεπτό στοιχείο στην έκφραση '{self.name}': {self.expression}")
+
+    def evaluate(self, buffers: FormulaBuffers) -> pd.Series:
+        """
+        Υπολογίζει τη στήλη από τα κοινά buffers
+
+        Returns:
+            pd.Series: Στήλη Int64 σε μονάδες 10^-decimals (κενό αν λείπει κάποιος όρος)
+        """
+        rows = len(buffers.df)
+        if self.exact:
+            env = {col: buffers.ints(col, self.decimals) for col in self.columns}
+            values = self._func(env)
+            if np.ndim(values) == 0:  # έκφραση μόνο με σταθερές
+                values = pd.array(np.full(rows, values, dtype=np.int64), dtype="Int64")
+            elif any(values is buffer for buffer in env.values()):  # π.χ. "Fat"
+                values = values.copy()
+        else:
+            env = {col: buffers.floats(col) for col in self.columns}
+            with np.errstate(all="ignore"):  # διαίρεση με 0 → κενό κελί
+                result = np.asarray(self._func(env), dtype="float64")
+            if result.ndim == 0:
+                result = np.full(rows, result)
+            values = to_fixed_point(pd.Series(result), self.decimals).array
+        return pd.Series(values, index=buffers.df.index, name=self.name)
+
+
+_DERIVED_CACHE = {}
+
+
+def compile_derived_formulas(spec: dict = None) -> List[DerivedFormula]:
+    """
+    Οι εκφράσεις του config.DERIVED_COLUMNS, μεταφρασμένες μία φορά ανά ρύθμιση
+
+    Args:
+        spec: {στήλη: έκφραση ή (έκφραση, δεκαδικά)} (αν None, config.DERIVED_COLUMNS)
+
+    Returns:
+        List[DerivedFormula]: Με τη σειρά του spec· μια έκφραση μπορεί να
+        χρησιμοποιεί παράγωγες στήλες που ορίζονται πριν από αυτή
+    """
+    if spec is None:
+        spec = config.DERIVED_COLUMNS
+    key = tuple(map(str, spec.items()))
+    if key not in _DERIVED_CACHE:
+        formulas = []
+        for name, value in spec.items():
+            expression, decimals = (value, 2) if isinstance(value, str) else value
+            formulas.append(DerivedFormula(name, expression, decimals))
+        _DERIVED_CACHE[key] = formulas
+    return _DERIVED_CACHE[key]
+
+
+DECIMAL_REPORT_COLUMNS = ['column', 'row', 'value', 'decimals', 'max_decimals']
+
+
+def empty_decimal_report() -> pd.DataFrame:
+    """Κενή αναφορά σφαλμάτων δεκαδικών"""
+    return pd.DataFrame({
+        'column': pd.Series(dtype=object),
+        'row': pd.Series(dtype="int64"),
+        'value': pd.Series(dtype=object),
+        'decimals': pd.Series(dtype="int64"),
+        'max_decimals': pd.Series(dtype="int64"),
+    })
+
+
+def count_decimals(values: pd.Series) -> pd.Series:
+    """
+    Vectorised εκδοχή του values.map(DataProcessor._count_decimals)
+
+    Μετά το format_decimals οι στήλες έχουν λίγες διαφορετικές τιμές, οπότε
+    τα δεκαδικά μετρώνται μία φορά ανά μοναδική τιμή (pd.factorize) με np.char.
+    Μόνο οι σπάνιες τιμές με δεύτερη τελεία περνούν από split.
+
+    Returns:
+        pd.Series: Πλήθος δεκαδικών (int64, 0 για NaN)
+    """
+    codes, uniques = pd.factorize(values)
+    if len(uniques) == 0:
+        return pd.Series(np.zeros(len(values), dtype=np.int64), index=values.index, name=values.name)
+
+    text = uniques.astype(str).to_numpy(dtype=str)
+    dot = np.char.find(text, ".")
+    decs = np.where(dot >= 0, np.char.str_len(text) - dot - 1, 0).astype(np.int64)
+
+    # "1.2.3": το _count_decimals μετρά μόνο ως τη δεύτερη τελεία
+    extra = np.flatnonzero(np.char.count(text, ".") > 1)
+    decs[extra] = [len(t.split(".")[1]) for t in text[extra].tolist()]
+
+    # code -1 = NaN/None → 0 δεκαδικά
+    counts = np.append(decs, 0)[codes]
+    return pd.Series(counts, index=values.index, name=values.name)
+
+
+def find_decimal_errors(df: pd.DataFrame, columns: List[str], max_decimals: int) -> pd.DataFrame:
+    """
+    Τιμές με περισσότερα από max_decimals δεκαδικά, για όλες τις στήλες μαζί
+
+    Args:
+        df: DataFrame (συνήθως μετά το format_decimals)
+        columns: Στήλες προς έλεγχο (όσες δεν υπάρχουν αγνοούνται)
+        max_decimals: Μέγιστο επιτρεπτό πλήθος δεκαδικών
+
+    Returns:
+        pd.DataFrame: column, row (index του df), value, decimals, max_decimals
+    """
+    parts = []
+    for col in columns:
+        if col not in df.columns:
+            continue
+        decs = count_decimals(df[col])
+        bad = (decs > max_decimals).to_numpy()
+        if not bad.any():
+            continue
+        parts.append(pd.DataFrame({
+            'column': col,
+            'row': df.index[bad],
+            'value': df[col].to_numpy()[bad].astype(object),
+            'decimals': decs.to_numpy()[bad],
+            'max_decimals': max_decimals,
+        }))
+
+    if not parts:
+        return empty_decimal_report()
+    return pd.concat(parts, ignore_index=True)
+
+
+def _write_report(reports: List[pd.DataFrame], path: str) -> Optional[str]:
+    """Γράφει τις μη κενές αναφορές ως ένα CSV ή διαγράφει τυχόν παλιό αρχείο"""
+    reports = [r for r in reports if not r.empty]
+    if not reports:
+        if os.path.exists(path):
+            os.remove(path)
+        return None
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    pd.concat(reports, ignore_index=True).to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
+def write_decimal_report(reports: List[pd.DataFrame], output_dir: str) -> Optional[str]:
+    """
+    Αποθηκεύει τις αναφορές δεκαδικών ως ένα CSV (config.DECIMAL_REPORT_NAME)
+
+    Αν δεν υπάρχουν σφάλματα δεν γράφεται αρχείο και διαγράφεται τυχόν
+    παλιά αναφορά, ώστε να μη μένει από προηγούμενη εκτέλεση.
+
+    Args:
+        reports: Αναφορές από process_data/process_data_chunks
+        output_dir: Φάκελος εξόδου
+
+    Returns:
+        Optional[str]: Διαδρομή του CSV ή None αν δεν υπάρχουν σφάλματα
+    """
+    return _write_report(reports, os.path.join(output_dir, config.DECIMAL_REPORT_NAME))
+
+
+def write_duplicate_report(reports: List[pd.DataFrame], output_dir: str) -> Optional[str]:
+    """
+    Αποθηκεύει τις αναφορές duplicates ως ένα CSV (config.DUPLICATE_REPORT_NAME)
+
+    Μία γραμμή ανά διπλή γραμμή που αφαιρέθηκε (kind='duplicate_row') και
+    ανά γραμμή με a/a που υπάρχει ήδη (kind='aa_conflict'). Οι row/first_row
+    είναι θέσεις στο φύλλο (0 = πρώτη γραμμή δεδομένων).
+
+    Args:
+        reports: Αναφορές από process_data/process_data_chunks
+        output_dir: Φάκελος εξόδου
+
+    Returns:
+        Optional[str]: Διαδρομή του CSV ή None αν δεν υπάρχουν duplicates
+    """
+    return _write_report(reports, os.path.join(output_dir, config.DUPLICATE_REPORT_NAME))
+
+
+def process_data(excel_df: pd.DataFrame, decimal_reports: list = None,
+                 duplicate_reports: list = None) -> pd.DataFrame:
     """
     Wrapper function για πλήρη επεξεργασία δεδομένων
     
     Args:
         excel_df: Το αρχικό DataFrame από το Excel
-        drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από config
+        decimal_reports: Αν δοθεί λίστα, προστίθεται σε αυτή η αναφορά
+            σφαλμάτων δεκαδικών (DataFrame)
+        duplicate_reports: Αν δοθεί λίστα, προστίθεται σε αυτή η αναφορά
+            διπλών γραμμών / διπλών a/a (DataFrame)
         
     Returns:
         pd.DataFrame: Πλήρως επεξεργασμένο DataFrame
     """
 
     
-    processor = DataProcessor(excel_df)
-    
-    # Βασική επεξεργασία
-    processor.initial_filtering()
+    # Το plan του header υπολογίζεται μία φορά και ξαναχρησιμοποιείται· το
+    # φιλτράρισμά του δεν αλλάζει το excel_df, οπότε δεν χρειάζεται αντίγραφο
+    plan = ProcessingPlan.for_frame(excel_df)
+    processor = DataProcessor(excel_df, plan=plan)
+    processor.run()
 
-    
-    # Συνέχεια επεξεργασίας
-    processor.format_decimals()
-    processor.calculate_derived_values()
+    if decimal_reports is not None:
+        decimal_reports.append(processor.decimal_report)
+    if duplicate_reports is not None:
+        duplicate_reports.append(processor.duplicate_report)
     
     return processor.get_processed_data()
 
 
+def process_data_chunks(chunks: Iterable[pd.DataFrame], decimal_reports: list = None,
+                        duplicate_reports: list = None) -> Iterator[pd.DataFrame]:
+    """
+    Streaming εκδοχή του process_data: επεξεργάζεται κάθε chunk μόλις διαβαστεί
+
+    Τα duplicates αφαιρούνται σε όλο το αρχείο (όχι μόνο μέσα στο chunk).
+
+    Args:
+        chunks: DataFrame chunks (π.χ. από DataLoader.iter_chunks)
+        decimal_reports: Αν δοθεί λίστα, προστίθεται η αναφορά δεκαδικών κάθε chunk
+        duplicate_reports: Αν δοθεί λίστα, προστίθεται η αναφορά duplicates κάθε chunk
+            (οι γραμμές είναι ήδη θέσεις στο αρχείο)
+
+    Returns:
+        Iterator[pd.DataFrame]: Επεξεργασμένα chunks
+    """
+    duplicates = DuplicateDetector(track=True)
+    total = 0
+    offset = 0
+
+    for chunk in chunks:
+        processor = DataProcessor(chunk, verbose=False, duplicates=duplicates,
+                                  plan=ProcessingPlan.for_frame(chunk))
+        processor.run()
+        if decimal_reports is not None and not processor.decimal_report.empty:
+            # Το index κάθε chunk ξεκινά από 0· η αναφορά κρατά τη γραμμή του αρχείου
+            report = processor.decimal_report
+            report['row'] = report['row'] + offset
+            decimal_reports.append(report)
+        if duplicate_reports is not None and not processor.duplicate_report.empty:
+            duplicate_reports.append(processor.duplicate_report)
+        offset += len(chunk)
+
+        processed = processor.get_processed_data()
+        total += len(processed)
+        yield processed
+
+    print(f"✅ Επεξεργάστηκαν {total} γραμμές (streaming)")
+
+
 if __name__ == "__main__":
     # Test του module
     print("=" * 70)
@@ -0,0 +1,306 @@
+"""
+Module για παρακολούθηση (hot folder) του BASE_PATH
+
+Κάθε νέο Excel που πέφτει στον φάκελο επεξεργάζεται αυτόματα μόλις
+σταθεροποιηθεί (ίδια size/mtime για WATCH_SETTLE_SECONDS), με το ίδιο
+pipeline του batch mode σε ProcessPoolExecutor. Τα επιτυχημένα αρχεία
+μεταφέρονται στο done/ (ή απλά σημειώνονται) και τα αποτυχημένα στο failed/
+μαζί με το σφάλμα.
+"""
+import os
+import csv
+import json
+import time
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+# Import config με fallback
+try:
+    from . import config
+    from .batch_processor import BatchProcessor, process_job
+except ImportError:
+    import config
+    from modules.batch_processor import BatchProcessor, process_job
+
+
+class FolderWatcher:
+    """Κλάση για αυτόματη επεξεργασία νέων αρχείων του BASE_PATH"""
+
+    STATE_FILE = "watch_state.json"
+    SUMMARY_FILE = "watch_summary.csv"
+
+    def __init__(self, base_path: str = None, output_root: str = None,
+                 max_workers: int = None, drop_zero_nutrients: bool = None,
+                 stream: bool = False, initial_time: str = None,
+                 poll_seconds: float = None, settle_seconds: float = None,
+                 move_done: bool = True):
+        """
+        Args:
+            base_path: Φάκελος που παρακολουθείται (αν None, config.BASE_PATH)
+            output_root: Φάκελος εξόδου· κάθε πρωτόκολλο παίρνει υποφάκελο
+            max_workers: Πλήθος διεργασιών (αν None, όσοι οι πυρήνες)
+            drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από config
+            stream: Streaming ανάγνωση/εγγραφή ανά chunk
+            initial_time: Αρχική ώρα HH:MM (αν None, config.DEFAULT_TIME)
+            poll_seconds: Διάστημα ελέγχου (αν None, config.WATCH_POLL_SECONDS)
+            settle_seconds: Χρόνος σταθεροποίησης (αν None, config.WATCH_SETTLE_SECONDS)
+            move_done: True: τα επιτυχημένα μεταφέρονται στο done/·
+                False: μένουν στη θέση τους και σημειώνονται στο watch_state.json
+        """
+        self.batch = BatchProcessor(base_path, output_root, max_workers,
+                                    drop_zero_nutrients, stream)
+        self.base_path = self.batch.loader.base_path
+        self.initial_time = initial_time
+        self.poll_seconds = poll_seconds if poll_seconds is not None else config.WATCH_POLL_SECONDS
+        self.settle_seconds = (settle_seconds if settle_seconds is not None
+                               else config.WATCH_SETTLE_SECONDS)
+        self.move_done = move_done
+
+        self.done_dir = os.path.join(self.base_path, config.WATCH_DONE_DIR)
+        self.failed_dir = os.path.join(self.base_path, config.WATCH_FAILED_DIR)
+        self.state_path = os.path.join(self.batch.output_root, self.STATE_FILE)
+        self.summary_path = os.path.join(self.batch.output_root, self.SUMMARY_FILE)
+
+        # path -> (size, mtime_ns, χρονική στιγμή από την οποία είναι σταθερό)
+        self.pending: Dict[str, Tuple[int, int, float]] = {}
+        # future -> (path, size, mtime_ns)
+        self.running = {}
+        # Υπογραφές "path|size|mtime_ns" που έχουν ήδη επεξεργαστεί (όταν move_done=False)
+        self.processed = self._load_state()
+        self.stop_requested = False
+
+    # ---------- ΚΥΡΙΟΣ ΒΡΟΧΟΣ ----------
+
+    def run(self, max_cycles: int = None):
+        """
+        Παρακολουθεί τον φάκελο μέχρι Ctrl+C, stop() ή max_cycles ελέγχους
+
+        Args:
+            max_cycles: Μέγιστο πλήθος ελέγχων (None = χωρίς όριο)
+        """
+        print(f"👀 Παρακολούθηση {self.base_path} "
+              f"(κάθε {self.poll_seconds}s, σταθεροποίηση {self.settle_seconds}s)")
+        print(f"📁 Έξοδος: {self.batch.output_root}")
+
+        # Αν λείπει το zero.xlsx κατεβαίνει μία φορά εδώ, πριν ξεκινήσουν workers
+        self.batch.prefetch_zero_file()
+
+        cycles = 0
+        with ProcessPoolExecutor(max_workers=self.batch.max_workers) as executor:
+            try:
+                while not self.stop_requested:
+                    self.poll(executor)
+                    self.collect()
+                    cycles += 1
+                    if max_cycles is not None and cycles >= max_cycles:
+                        break
+                    time.sleep(self.poll_seconds)
+            except KeyboardInterrupt:
+                print("\n⏹️ Διακοπή παρακολούθησης· αναμονή για όσα τρέχουν...")
+
+            # Ολοκλήρωση όσων βρίσκονται ήδη σε εξέλιξη
+            self.collect(wait=True)
+
+    def stop(self):
+        """Ζητά τερματισμό του run() μετά τον τρέχοντα έλεγχο"""
+        self.stop_requested = True
+
+    def poll(self, executor: ProcessPoolExecutor) -> int:
+        """
+        Ένας έλεγχος του φακέλου: υποβάλλει όσα αρχεία σταθεροποιήθηκαν
+
+        Returns:
+            int: Πλήθος νέων jobs
+        """
+        # Οι workers δεν ελέγχουν το zero.xlsx· ο έλεγχος γίνεται εδώ σε κάθε
+        # κύκλο (φτηνός όταν το αντίγραφο είναι πρόσφατο)
+        self.batch.prefetch_zero_file()
+
+        now = time.time()
+        busy = {path for path, _, _ in self.running.values()}
+        present = set()
+        submitted = 0
+
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if (not name.lower().endswith(self.batch.loader.EXCEL_EXTENSIONS)
+                        or name.startswith("~$") or not entry.is_file()):
+                    continue
+
+                path = entry.path
+                present.add(path)
+                if path in busy:
+                    continue
+
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                signature = (st.st_size, st.st_mtime_ns)
+
+                if self._signature_key(path, *signature) in self.processed:
+                    continue
+
+                known = self.pending.get(path)
+                if known is None or known[:2] != signature:
+                    # Νέο αρχείο ή ακόμα γράφεται: ξεκινά από την αρχή η αναμονή
+                    self.pending[path] = (*signature, now)
+                    continue
+
+                if now - known[2] < self.settle_seconds or not self._is_readable(path):
+                    continue
+
+                del self.pending[path]
+                job = self.batch._make_job(path, initial_time=self.initial_time)
+                future = executor.submit(process_job, job)
+                self.running[future] = (path, *signature)
+                submitted += 1
+                print(f"⚡ Νέο αρχείο: {name}")
+
+        # Αρχεία που χάθηκαν πριν σταθεροποιηθούν
+        for path in list(self.pending):
+            if path not in present:
+                del self.pending[path]
+
+        return submitted
+
+    def collect(self, wait: bool = False) -> int:
+        """
+        Καταγράφει τα ολοκληρωμένα jobs και μεταφέρει/σημειώνει τα αρχεία τους
+
+        Args:
+            wait: Αν True, περιμένει να ολοκληρωθούν όλα τα jobs που τρέχουν
+
+        Returns:
+            int: Πλήθος ολοκληρωμένων jobs
+        """
+        finished = [f for f in self.running if wait or f.done()]
+
+        for future in finished:
+            path, size, mtime_ns = self.running.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                # Π.χ. crash του worker process
+                result = {field: '' for field in BatchProcessor.SUMMARY_FIELDS}
+                result.update({'protocol': os.path.splitext(os.path.basename(path))[0],
+                               'file': path, 'status': 'error', 'error': str(e)})
+
+            if result['status'] == 'ok':
+                print(f"  ✅ {result['protocol']} ({result['samples']} δείγματα, "
+                      f"{result['duration_sec']:.1f}s) → {result['output']}")
+                # Αν η μεταφορά αποτύχει (κλειδωμένο αρχείο, share μόνο για
+                # ανάγνωση) σημειώνεται, ώστε να μην ξαναεπεξεργάζεται σε κάθε κύκλο
+                if not self.move_done or self._move(path, self.done_dir) is None:
+                    self._mark_processed(path, size, mtime_ns)
+            else:
+                print(f"  ❌ {result['protocol']}: {result['error']}")
+                if self._quarantine(path, result['error']) is None:
+                    self._mark_processed(path, size, mtime_ns)
+
+            self._append_summary(result)
+
+        return len(finished)
+
+    # ---------- ΑΡΧΕΙΑ ----------
+
+    @staticmethod
+    def _is_readable(path: str) -> bool:
+        """Σε Windows το άνοιγμα αποτυγχάνει όσο το αρχείο είναι ανοιχτό για εγγραφή"""
+        try:
+            with open(path, "rb"):
+                return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _move(path: str, target_dir: str) -> Optional[str]:
+        """Μεταφέρει το αρχείο στο target_dir χωρίς να αντικαταστήσει υπάρχον"""
+        os.makedirs(target_dir, exist_ok=True)
+        name, ext = os.path.splitext(os.path.basename(path))
+        target = os.path.join(target_dir, name + ext)
+        if os.path.exists(target):
+            target = os.path.join(target_dir, f"{name}_{time.strftime('%Y%m%d-%H%M%S')}{ext}")
+
+        try:
+            shutil.move(path, target)
+            return target
+        except OSError as e:
+            print(f"⚠️ Αδυναμία μεταφοράς {path}: {e}")
+            return None
+
+    def _quarantine(self, path: str, error: str) -> Optional[str]:
+        """Μεταφέρει αποτυχημένο αρχείο στο failed/ με το σφάλμα δίπλα του"""
+        target = self._move(path, self.failed_dir)
+        if target is None:
+            return None
+        with open(os.path.splitext(target)[0] + ".error.txt", "w", encoding="utf-8") as f:
+            f.write(error + "\n")
+        return target
+
+    # ---------- ΚΑΤΑΣΤΑΣΗ / SUMMARY ----------
+
+    @staticmethod
+    def _signature_key(path: str, size: int, mtime_ns: int) -> str:
+        return f"{os.path.abspath(path)}|{size}|{mtime_ns}"
+
+    def _mark_processed(self, path: str, size: int, mtime_ns: int):
+        """Το αρχείο δεν ξαναεπεξεργάζεται όσο δεν αλλάζει (size/mtime)"""
+        self.processed.add(self._signature_key(path, size, mtime_ns))
+        self._save_state()
+
+    def _load_state(self) -> set:
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    return set(json.load(f).get('processed', []))
+            except (OSError, ValueError):
+                pass
+        return set()
+
+    def _save_state(self):
+        os.makedirs(self.batch.output_root, exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({'processed': sorted(self.processed)}, f)
+        try:
+            os.replace(tmp_path, self.state_path)
+        except PermissionError:
+            # Σε Windows αποτυγχάνει αν άλλη διεργασία διαβάζει το αρχείο·
+            # η κατάσταση μένει στη μνήμη και γράφεται στην επόμενη αλλαγή
+            os.remove(tmp_path)
+
+    def _append_summary(self, result: dict):
+        """Προσθέτει μία γραμμή στο watch_summary.csv"""
+        os.makedirs(self.batch.output_root, exist_ok=True)
+        new_file = not os.path.exists(self.summary_path)
+        with open(self.summary_path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=BatchProcessor.SUMMARY_FIELDS)
+            if new_file:
+                writer.writeheader()
+            writer.writerow(result)
+
+
+def watch_folder(base_path: str = None, output_root: str = None, max_workers: int = None,
+                 initial_time: str = None, drop_zero_nutrients: bool = None,
+                 stream: bool = False, poll_seconds: float = None,
+                 settle_seconds: float = None, move_done: bool = True):
+    """
+    Wrapper function για παρακολούθηση του φακέλου μέχρι Ctrl+C
+
+    Args:
+        base_path: Φάκελος που παρακολουθείται (αν None, config.BASE_PATH)
+        output_root: Φάκελος εξόδου
+        max_workers: Πλήθος διεργασιών
+        initial_time: Αρχική ώρα HH:MM για όλα τα αρχεία
+        drop_zero_nutrients: Αν None, χρησιμοποιεί την τιμή από config
+        stream: Streaming επεξεργασία ανά chunk
+        poll_seconds: Διάστημα ελέγχου του φακέλου
+        settle_seconds: Χρόνος σταθεροποίησης αρχείου
+        move_done: Μεταφορά των επιτυχημένων στο done/ (αλλιώς μόνο σημείωση)
+    """
+    watcher = FolderWatcher(base_path, output_root, max_workers, drop_zero_nutrients,
+                            stream, initial_time, poll_seconds, settle_seconds, move_done)
+    watcher.run()
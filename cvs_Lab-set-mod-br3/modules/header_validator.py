@@ -0,0 +1,206 @@
+"""
+Module για γρήγορο έλεγχο σχήματος (header + λίγες γραμμές) πριν το πλήρες parsing
+
+Διαβάζεται μόνο ο header και ένα μικρό δείγμα γραμμών και ελέγχονται
+απέναντι στα COLUMN_RENAMES, COLS_TO_DELETE και TARGET_COLUMN_ORDER με τους
+ίδιους κανόνες που εφαρμόζει μετά ο DataProcessor, ώστε ένα χαλασμένο αρχείο
+να απορρίπτεται σε milliseconds.
+"""
+import re
+import time
+import pandas as pd
+from typing import List
+# Import config με fallback
+try:
+    from . import config
+    from .data_loader import open_workbook
+except ImportError:
+    import config
+    from modules.data_loader import open_workbook
+
+
+class InvalidWorkbookError(ValueError):
+    """Το αρχείο απορρίφθηκε από τον έλεγχο σχήματος"""
+
+    def __init__(self, verdict: dict):
+        super().__init__("; ".join(verdict['errors']))
+        self.verdict = verdict
+
+
+class HeaderValidator:
+    """Κλάση για έλεγχο του header ενός Excel πριν τη φόρτωση"""
+
+    def __init__(self, file_path: str, sample_rows: int = None):
+        """
+        Args:
+            file_path: Διαδρομή αρχείου
+            sample_rows: Γραμμές δείγματος (αν None, config.VALIDATION_SAMPLE_ROWS)
+        """
+        self.file_path = file_path
+        self.sample_rows = sample_rows or getattr(config, 'VALIDATION_SAMPLE_ROWS', 20)
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+
+    @staticmethod
+    def required_columns() -> List[str]:
+        """Στήλες του τελικού output που πρέπει να έρχονται από το Excel"""
+        sources = set(config.COLUMN_RENAMES.values())
+        return [col for col in config.TARGET_COLUMN_ORDER if col in sources]
+
+    def validate(self) -> dict:
+        """
+        Εκτελεί τον έλεγχο
+
+        Returns:
+            dict: ok, errors, warnings, columns (όπως θα είναι μετά το filtering),
+            header (όπως στο αρχείο), sample_rows, elapsed_ms
+        """
+        start = time.perf_counter()
+        self.errors = []
+        self.warnings = []
+        header, columns, sample = [], [], None
+
+        try:
+            with open_workbook(self.file_path) as xl:
+                sample = xl.parse(nrows=self.sample_rows)
+            header = [str(c) for c in sample.columns]
+            columns = self._check_header(header)
+            self._check_sample(sample, header)
+        except Exception as e:
+            self.errors.append(f"Αδυναμία ανάγνωσης header: {e}")
+
+        return {
+            'file': self.file_path,
+            'ok': not self.errors,
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'header': header,
+            'columns': columns,
+            'sample_rows': 0 if sample is None else len(sample),
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 1),
+        }
+
+    def _check_header(self, header: List[str]) -> List[str]:
+        """Προσομοιώνει το initial_filtering στον header και ελέγχει το αποτέλεσμα"""
+        # Στήλες που έχουν ήδη αναφερθεί σε σφάλμα (χωρίς δεύτερο warning)
+        reported = set()
+
+        # Διπλότυπα στο αρχείο: το pandas τα γράφει ως "name.1", "name.2", ...
+        for name in header:
+            match = re.fullmatch(r"(.*)\.(\d+)", name)
+            if match and match.group(1) in header:
+                self.errors.append(f"Διπλότυπη στήλη στο αρχείο: '{match.group(1)}'")
+                reported.add(name.strip())
+
+        if "a/a" not in header:
+            self.errors.append("Λείπει η στήλη 'a/a'")
+            columns = list(header)
+        else:
+            # Η άχρηστη στήλη μετά το 'a/a' (όπως το _remove_column_after_aa)
+            columns = list(header)
+            idx = columns.index("a/a")
+            if idx + 1 < len(columns) and columns[idx + 1].strip() not in config.PROTECTED_COLS:
+                del columns[idx + 1]
+
+        columns = [c.strip() for c in columns]
+        columns = [c for c in columns if c not in config.COLS_TO_DELETE]
+        columns = [config.COLUMN_RENAMES.get(c, c) for c in columns]
+
+        # Διπλότυπα μετά τις μετονομασίες (το "DUPLICATE COLS" του initial_filtering)
+        seen = set()
+        for col in columns:
+            if col in seen:
+                self.errors.append(f"Διπλότυπη στήλη μετά τις μετονομασίες: '{col}'")
+            seen.add(col)
+
+        known = (set(config.COLUMN_RENAMES) | set(config.COLUMN_RENAMES.values())
+                 | set(config.TARGET_COLUMN_ORDER) | {"a/a"})
+        for col in self.required_columns():
+            if col in columns:
+                continue
+            hint = self._similar_column(col, header)
+            if hint:
+                reported.add(hint.strip())
+                self.errors.append(
+                    f"Λείπει η στήλη '{col}' (υπάρχει '{hint}' — άλλαξε όνομα; "
+                    f"βλ. COLUMN_RENAMES)"
+                )
+            else:
+                self.errors.append(f"Λείπει η στήλη '{col}'")
+
+        for col in columns:
+            if col not in known and col not in reported:
+                self.warnings.append(f"Άγνωστη στήλη (θα αγνοηθεί): '{col}'")
+
+        return columns
+
+    def _check_sample(self, sample: pd.DataFrame, header: List[str]):
+        """Έλεγχοι τιμών στο δείγμα γραμμών"""
+        if sample.empty:
+            self.errors.append("Το αρχείο δεν έχει γραμμές δεδομένων")
+            return
+
+        if "a/a" in sample.columns:
+            aa = pd.to_numeric(sample["a/a"], errors="coerce")
+            if aa.isna().all():
+                self.errors.append("Η στήλη 'a/a' δεν έχει αριθμούς στο δείγμα")
+
+        # Στήλες μετρήσεων με κείμενο (θα γίνουν NaN στο format_decimals)
+        sources = {
+            source for source, target in config.COLUMN_RENAMES.items()
+            if target in self.required_columns()
+        } | set(self.required_columns())
+        for name in header:
+            if name.strip() not in sources:
+                continue
+            values = sample[name].dropna()
+            bad = pd.to_numeric(values, errors="coerce").isna().sum()
+            if bad:
+                self.warnings.append(
+                    f"Στήλη '{name.strip()}': {bad}/{len(values)} μη αριθμητικές τιμές στο δείγμα"
+                )
+
+    @staticmethod
+    def _similar_column(target: str, header: List[str]):
+        """Στήλη του header που μοιάζει με την target (πεζά/κενά/αρχή ονόματος)"""
+        candidates = [target] + [s for s, t in config.COLUMN_RENAMES.items() if t == target]
+        keys = {re.sub(r"\W", "", c).lower() for c in candidates}
+        for name in header:
+            norm = re.sub(r"\W", "", name).lower()
+            if norm in keys or (len(norm) >= 3 and any(
+                    norm.startswith(k) or k.startswith(norm) for k in keys)):
+                return name
+        return None
+
+
+def validate_workbook(file_path: str, sample_rows: int = None) -> dict:
+    """
+    Wrapper function για γρήγορο έλεγχο ενός αρχείου
+
+    Args:
+        file_path: Διαδρομή αρχείου
+        sample_rows: Γραμμές δείγματος (αν None, config.VALIDATION_SAMPLE_ROWS)
+
+    Returns:
+        dict: Αποτέλεσμα του HeaderValidator.validate()
+    """
+    return HeaderValidator(file_path, sample_rows).validate()
+
+
+def ensure_valid_workbook(file_path: str) -> dict:
+    """
+    Όπως το validate_workbook, αλλά σηκώνει InvalidWorkbookError αν το αρχείο απορρίπτεται
+
+    Returns:
+        dict: Το αποτέλεσμα (μόνο αν είναι ok)
+    """
+    verdict = validate_workbook(file_path)
+    if not verdict['ok']:
+        raise InvalidWorkbookError(verdict)
+    return verdict
+
+
+def format_verdict(verdict: dict) -> str:
+    """Σύντομο κείμενο για μηνύματα σφάλματος (GUI/log)"""
+    lines = [f"❌ {e}" for e in verdict['errors']] + [f"⚠️ {w}" for w in verdict['warnings']]
+    return "\n".join(lines) if lines else "✅ Σωστό σχήμα"
@@ -129,6 +129,7 @@ class MissingRowHandler:
             new_rows.append(full)
 
         out = pd.concat([df, pd.DataFrame(new_rows)], ignore_index=True)
+        out.attrs = dict(df.attrs)  # π.χ. columns_projected από τον DataLoader
 
         s = pd.to_numeric(out[col], errors="coerce")
         s = s.replace([np.inf, -np.inf], np.nan)
@@ -4,13 +4,19 @@ Module για τη δημιουργία τελικού output και συγχώ
 import os
 import pandas as pd
 import numpy as np
-from typing import List
+from typing import Callable, Iterable, List, Optional, Sequence, Union
 import sys
 # Import config με fallback
 try:
     from . import config
+    from .time_handler import MetadataGenerator, Schedule, SampleIds, LazyColumn
+    from .zero_manager import ZeroDataManager
+    from .data_processor import output_column
 except ImportError:
     import config
+    from modules.time_handler import MetadataGenerator, Schedule, SampleIds, LazyColumn
+    from modules.zero_manager import ZeroDataManager
+    from modules.data_processor import output_column
 
 
 
@@ -22,20 +28,36 @@ def get_app_root():
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
+def frame_column(values):
+    """
+    Οι τιμές μιας στήλης του filled DataFrame: οι lazy στήλες (LazyColumn)
+    υλοποιούνται εδώ, οι Series χωρίς το index τους (θέση προς θέση)
+    """
+    if isinstance(values, LazyColumn):
+        return values.expand()
+    if isinstance(values, pd.Series):
+        return values.array
+    return values
+
+
 
 class OutputGenerator:
     """Κλάση για τη δημιουργία τελικού output"""
     
-    def __init__(self, df: pd.DataFrame, metadata: dict):
+    def __init__(self, df: pd.DataFrame, metadata: dict, parts_path: str = None,
+                 verbose: bool = True):
         """
         Args:
             df: Επεξεργασμένο DataFrame με δεδομένα
             metadata: Dictionary με metadata (sample_ids, times, κλπ.)
+            parts_path: Φάκελος για τα part files (αν None, config.PARTS_PATH)
+            verbose: Αν False, δεν τυπώνονται μηνύματα (π.χ. ανά chunk)
         """
         self.df = df
         self.metadata = metadata
         self.filled_df = None
-        self.parts_path = config.PARTS_PATH
+        self.parts_path = parts_path or config.PARTS_PATH
+        self.verbose = verbose
 
     def drop_zero_nutrient_rows_on_filled(self, reset_index=False, verbose=True):
         if self.filled_df is None:
@@ -47,15 +69,23 @@ class OutputGenerator:
                     print(f"⚠️ Λείπει η στήλη {c}. Skip.")
                 return self.filled_df
 
-        def to_num(s):
-            s = s.astype(str).str.strip().str.replace(",", ".", regex=False)
-            return pd.to_numeric(s, errors="coerce").fillna(0)
+        fixed_point = self.df.attrs.get('fixed_point', {})
+        if (all(c in fixed_point for c in ("Fat", "Protein", "Lactose"))
+                and len(self.filled_df) == len(self.df)):
+            # Έλεγχος κατευθείαν στους ακέραιους fixed-point (κενό = 0)
+            drop_mask = np.ones(len(self.df), dtype=bool)
+            for c in ("Fat", "Protein", "Lactose"):
+                drop_mask &= self.df[c].fillna(0).to_numpy() == 0
+        else:
+            def to_num(s):
+                s = s.astype(str).str.strip().str.replace(",", ".", regex=False)
+                return pd.to_numeric(s, errors="coerce").fillna(0)
 
-        fat = to_num(self.filled_df["Fat"])
-        protein = to_num(self.filled_df["Protein"])
-        lactose = to_num(self.filled_df["Lactose"])
+            fat = to_num(self.filled_df["Fat"])
+            protein = to_num(self.filled_df["Protein"])
+            lactose = to_num(self.filled_df["Lactose"])
 
-        drop_mask = (fat == 0) & (protein == 0) & (lactose == 0)
+            drop_mask = ((fat == 0) & (protein == 0) & (lactose == 0)).to_numpy()
 
         if verbose:
             print(f"🔍 Zero rows to drop: {int(drop_mask.sum())}")
@@ -74,29 +104,29 @@ class OutputGenerator:
         Returns:
             pd.DataFrame: Πλήρως συμπληρωμένο DataFrame
         """
-        # Source - https://stackoverflow.com/a/30522778
-        # Posted by miriamsimone, modified by community
-        # Retrieved 2025-12-10, License - CC BY-SA 4.0
-
+        # Μία στήλη ανά πεδίο (χωρίς κοινό object πίνακα): οι σταθερές
+        # στήλες metadata μένουν Categorical, τα IDs/χρόνοι υλοποιούνται εδώ
+        columns = [
+            self.metadata['sample_ids'],
+            self.metadata['rep'],
+            self.metadata['product'],
+            # Οι fixed-point στήλες γίνονται κείμενο μόνο εδώ
+            output_column(self.df, 'Fat'),
+            output_column(self.df, 'Protein'),
+            output_column(self.df, 'Lactose'),
+            output_column(self.df, 'FPD'),
+            output_column(self.df, 'TS'),
+            output_column(self.df, 'SNF'),
+            self.metadata['date'],
+            self.metadata['sample_times'],
+            self.metadata['remark']
+        ]
         self.filled_df = pd.DataFrame(
-            np.column_stack([
-                self.metadata['sample_ids'],
-                self.metadata['rep'],
-                self.metadata['product'],
-                self.df['Fat'],
-                self.df['Protein'],
-                self.df['Lactose'],
-                self.df['FPD'],
-                self.df['TS'],
-                self.df['SNF'],
-                self.metadata['date'],
-                self.metadata['sample_times'],
-                self.metadata['remark']
-            ]),
-            columns=config.TARGET_COLUMN_ORDER
+            dict(zip(config.TARGET_COLUMN_ORDER, map(frame_column, columns)))
         )
 
-        print(f"✅ Δημιουργήθηκε filled DataFrame με {len(self.filled_df)} γραμμές")
+        if self.verbose:
+            print(f"✅ Δημιουργήθηκε filled DataFrame με {len(self.filled_df)} γραμμές")
         return self.filled_df
     
     def break_into_parts(self) -> List[pd.DataFrame]:
@@ -143,18 +173,22 @@ class OutputGenerator:
 
 
 class FinalOutputAssembler:
-    """Κλάση για τη συναρμολόγηση τελικού output με zero data"""
+    """
+    Κλάση για τη συναρμολόγηση τελικού output με zero data από part files
+    (save_parts_to_csv)· το generate_output γράφει πλέον με FinalCsvWriter
+    """
     
     def __init__(self, parts_path: str = None, output_path: str = None):
         self.parts_path = parts_path or config.PARTS_PATH
         self.output_path = output_path or config.FINAL_OUTPUT_PATH
     
-    def assemble_final_csv(self, zero_dfs: List[pd.DataFrame]):
+    def assemble_final_csv(self, zero_dfs: Sequence[Union[str, pd.DataFrame]]):
         """
         Συναρμολογεί το τελικό CSV με parts και zero blocks
         
         Args:
-            zero_dfs: Λίστα με zero DataFrames
+            zero_dfs: Τα zero blocks ως κείμενο CSV (ZeroBlocks του prepare_zero_data)
+                ή ως DataFrames
         """
         # Εύρεση part files
         part_files = [
@@ -190,9 +224,7 @@ class FinalOutputAssembler:
                 # Προσθήκη zero block (αν δεν είναι το τελευταίο part)
                 if i < len(part_files) - 1:
                     if zero_block_index < len(zero_dfs):
-                        zero_df = zero_dfs[zero_block_index]
-                        zero_csv_string = zero_df.to_csv(header=False, index=False, lineterminator="\n")
-                        fout.write(zero_csv_string)
+                        fout.write(zero_block_text(zero_dfs[zero_block_index]))
                         zero_block_index += 1
                     else:
                         print(f"⚠️  Προειδοποίηση: Δεν υπάρχουν αρκετά zero blocks")
@@ -216,12 +248,210 @@ class FinalOutputAssembler:
             return sum(1 for _ in f)
 
 
+def zero_block_text(zero_block: Union[str, pd.DataFrame]) -> str:
+    """Το κείμενο CSV ενός zero block (τα DataFrames χωρίς header/index)"""
+    if isinstance(zero_block, pd.DataFrame):
+        return zero_block.to_csv(header=False, index=False, lineterminator="\n")
+    return zero_block
+
+
+def csv_lines(df: pd.DataFrame) -> List[str]:
+    """
+    Οι γραμμές CSV ενός DataFrame, χωρίς header και χωρίς "\\n"
+
+    Ένα to_csv για όλο το DataFrame· μόνο αν κάποια τιμή περιέχει αλλαγή
+    γραμμής (οι γραμμές δεν αντιστοιχούν 1-1) σειριοποιείται ανά γραμμή.
+    """
+    if df.empty:
+        return []
+    lines = df.to_csv(header=False, index=False, lineterminator="\n").split("\n")[:-1]
+    if len(lines) != len(df):
+        lines = [
+            df.iloc[i:i+1].to_csv(header=False, index=False, lineterminator="\n")[:-1]
+            for i in range(len(df))
+        ]
+    return lines
+
+
+class FinalCsvWriter:
+    """
+    Γράφει το τελικό CSV σε ένα πέρασμα, χωρίς part files
+
+    Header, parts των BATCH_SIZE γραμμών δειγμάτων και ένα zero block πριν από
+    κάθε part εκτός του πρώτου (δηλαδή μετά από κάθε part εκτός του τελευταίου,
+    όπως το FinalOutputAssembler). Οι γραμμές σειριοποιούνται με ένα to_csv
+    ανά SERIALIZE_ROWS γραμμές και γράφονται μέσα από buffer OUTPUT_BUFFER_SIZE.
+
+        with FinalCsvWriter(output_path, zero_block) as writer:
+            writer.write_rows(filled_df)
+    """
+
+    # Γραμμές ανά to_csv: λίγες κλήσεις, αλλά όχι όλο το αρχείο ως ένα string
+    SERIALIZE_ROWS = config.BATCH_SIZE * 1000
+
+    def __init__(self, output_path: str, zero_block: Callable[[int], Optional[str]],
+                 buffer_size: int = None):
+        """
+        Args:
+            output_path: Διαδρομή τελικού CSV
+            zero_block: Το κείμενο CSV του i-οστού zero block (None αν δεν υπάρχει)
+            buffer_size: Buffer εγγραφής σε bytes (αν None, config.OUTPUT_BUFFER_SIZE)
+        """
+        self.output_path = output_path
+        self.zero_block = zero_block
+        self.buffer_size = buffer_size or config.OUTPUT_BUFFER_SIZE
+        self.fout = None
+        self.pending = []       # Γραμμές του part που δεν έχει συμπληρωθεί ακόμα
+        self.parts = 0
+        self.rows_written = 0   # Γραμμές δειγμάτων στο αρχείο
+        self.zero_blocks = 0
+
+    def __enter__(self):
+        self.fout = open(self.output_path, "w", encoding="utf-8", newline="",
+                         buffering=self.buffer_size)
+        self.fout.write(",".join(config.TARGET_COLUMN_ORDER) + "\n")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None and self.pending:
+                self._write_part(self.pending)
+                self.pending = []
+        finally:
+            self.fout.close()
+        return False
+
+    def write_rows(self, filled_df: pd.DataFrame):
+        """Γράφει τα πλήρη parts· οι γραμμές που περισσεύουν περιμένουν την επόμενη κλήση"""
+        for start in range(0, len(filled_df), self.SERIALIZE_ROWS):
+            lines = csv_lines(filled_df.iloc[start:start+self.SERIALIZE_ROWS])
+            if self.pending:
+                lines = self.pending + lines
+            full = len(lines) - len(lines) % config.BATCH_SIZE
+            for i in range(0, full, config.BATCH_SIZE):
+                self._write_part(lines[i:i+config.BATCH_SIZE])
+            self.pending = lines[full:]
+
+    def _write_part(self, lines: List[str]):
+        if self.parts:
+            zero_block = self.zero_block(self.zero_blocks)
+            if zero_block is None:
+                print(f"⚠️  Προειδοποίηση: Δεν υπάρχουν αρκετά zero blocks")
+            else:
+                self.fout.write(zero_block)
+                self.zero_blocks += 1
+        self.fout.write("\n".join(lines) + "\n")
+        self.parts += 1
+        self.rows_written += len(lines)
+
+
+class StreamingOutputWriter:
+    """
+    Γράφει το τελικό CSV σταδιακά, καθώς φτάνουν επεξεργασμένα chunks
+
+    Παράγει το ίδιο αρχείο με generate_output, αλλά χωρίς ολόκληρο το filled
+    DataFrame στη μνήμη: κάθε chunk περνά από το FinalCsvWriter μόλις γεμίσει.
+    """
+
+    def __init__(self, output_path: str, csv_first_4: str, dash_part: str,
+                 date: str, initial_time: str, drop_zero_nutrients: bool = True,
+                 product: str = None, rep: int = None, instrument: str = None):
+        """
+        Args:
+            output_path: Διαδρομή τελικού CSV
+            csv_first_4: Τα πρώτα 4 ψηφία του πρωτοκόλλου
+            dash_part: Το τμήμα με παύλα
+            date: Ημερομηνία ανάλυσης (DD/MM/YYYY)
+            initial_time: Αρχική ώρα (HH:MM)
+            drop_zero_nutrients: Αφαίρεση γραμμών με Fat=Protein=Lactose=0
+            product: Product (αν None, config.DEFAULT_PRODUCT)
+            rep: Rep # (αν None, config.DEFAULT_REP)
+            instrument: Όργανο για την επιλογή zero template (προαιρετικό)
+        """
+        self.output_path = output_path
+        self.csv_first_4 = csv_first_4
+        self.dash_part = dash_part
+        self.date = date
+        self.initial_time = initial_time
+        self.drop_zero_nutrients = drop_zero_nutrients
+        self.product = product
+        self.rep = rep
+
+        # Το πλήθος δειγμάτων δεν είναι γνωστό από πριν: χρόνοι ανά θέση
+        self.schedule = Schedule(initial_time)
+        self.zero_manager = ZeroDataManager.for_product(product, instrument)
+        self.zero_template = None  # ZeroBlockTemplate, μετά το load_zero_data
+        self.samples = 0        # Δείγματα πριν το φίλτρο μηδενικών (όπως το len(processed_df))
+        self.rows_written = 0   # Γραμμές δειγμάτων στο αρχείο
+        self.zero_blocks = 0
+
+    def write(self, processed_chunks: Iterable[pd.DataFrame]) -> str:
+        """
+        Γράφει όλα τα chunks στο τελικό CSV
+
+        Args:
+            processed_chunks: Επεξεργασμένα chunks (π.χ. από process_data_chunks)
+
+        Returns:
+            str: Διαδρομή τελικού αρχείου
+        """
+        self.zero_manager.load_zero_data(self.date)
+        self.zero_template = self.zero_manager.block_template()
+
+        writer = FinalCsvWriter(self.output_path, self._zero_block)
+        with writer:
+            for chunk in processed_chunks:
+                writer.write_rows(self._fill_chunk(chunk))
+        self.rows_written = writer.rows_written
+        self.zero_blocks = writer.zero_blocks
+
+        print(f"✅ Τελικό αρχείο αποθηκεύτηκε: {self.output_path}")
+        print(f"📊 Δείγματα: {self.samples}, γραμμές δειγμάτων: {self.rows_written}, "
+              f"zero blocks: {self.zero_blocks}")
+        return self.output_path
+
+    def _fill_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Filled DataFrame ενός chunk, με IDs/χρόνους από τη συνολική θέση των δειγμάτων"""
+        start, stop = self.samples, self.samples + len(chunk)
+        self.samples = stop
+
+        metadata = MetadataGenerator.generate_metadata(len(chunk), self.date, self.product, self.rep)
+        metadata['sample_ids'] = SampleIds(f"{self.csv_first_4}{self.dash_part} ",
+                                           range(start + 1, stop + 1))
+        metadata['sample_times'] = self.schedule.sample_times(start, stop)
+
+        generator = OutputGenerator(chunk, metadata, verbose=False)
+        generator.create_filled_dataframe()
+        if self.drop_zero_nutrients:
+            generator.drop_zero_nutrient_rows_on_filled(reset_index=True, verbose=False)
+        return generator.get_filled_dataframe()
+
+    def _zero_block(self, index: int) -> str:
+        """Το zero block μετά το part index (χρόνοι από τη θέση του στο schedule)"""
+        return self.zero_template.render(self.date, self.schedule.zero_block_times(index))
+
+
 def generate_output(df, metadata, zero_dfs, drop_zero_nutrients=True, output_dir=None) -> str:
+    """
+    Wrapper function για τη δημιουργία του τελικού CSV
+
+    Γράφει header, parts και zero blocks κατευθείαν στο FINAL_OUTPUT.csv
+    (FinalCsvWriter), χωρίς part files.
+
+    Args:
+        df: Επεξεργασμένο DataFrame
+        metadata: Dictionary με metadata (generate_time_metadata)
+        zero_dfs: Τα zero blocks (ZeroBlocks του prepare_zero_data ή DataFrames)
+        drop_zero_nutrients: Αφαίρεση γραμμών με Fat=Protein=Lactose=0
+        output_dir: Φάκελος εξόδου (αν None, ο φάκελος της εφαρμογής)
+
+    Returns:
+        str: Διαδρομή τελικού αρχείου
+    """
     generator = OutputGenerator(df, metadata)
     generator.create_filled_dataframe()
     if drop_zero_nutrients:
         generator.drop_zero_nutrient_rows_on_filled(reset_index=False, verbose=False)
-    generator.save_parts_to_csv()
 
     if output_dir is None:
         output_dir = get_app_root()
@@ -229,10 +459,52 @@ def generate_output(df, metadata, zero_dfs, drop_zero_nutrients=True, output_dir
     os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(output_dir, "FINAL_OUTPUT.csv")
 
-    assembler = FinalOutputAssembler(output_path=output_path)
-    assembler.assemble_final_csv(zero_dfs)
+    def zero_block(index: int) -> Optional[str]:
+        return zero_block_text(zero_dfs[index]) if index < len(zero_dfs) else None
+
+    writer = FinalCsvWriter(output_path, zero_block)
+    with writer:
+        writer.write_rows(generator.get_filled_dataframe())
+
+    print(f"✅ Τελικό αρχείο αποθηκεύτηκε: {output_path}")
+    print(f"📊 Parts: {writer.parts}, γραμμές δειγμάτων: {writer.rows_written}, "
+          f"zero blocks: {writer.zero_blocks}")
+    return output_path
+
+
+def generate_output_streaming(processed_chunks, csv_first_4: str, dash_part: str,
+                              date: str, initial_time: str, drop_zero_nutrients=True,
+                              output_dir=None, product: str = None, rep: int = None,
+                              instrument: str = None) -> str:
+    """
+    Wrapper function για streaming δημιουργία του τελικού CSV
+
+    Args:
+        processed_chunks: Επεξεργασμένα chunks (π.χ. από process_data_chunks)
+        csv_first_4: Τα πρώτα 4 ψηφία του πρωτοκόλλου
+        dash_part: Το τμήμα με παύλα
+        date: Ημερομηνία ανάλυσης (DD/MM/YYYY)
+        initial_time: Αρχική ώρα (HH:MM)
+        drop_zero_nutrients: Αφαίρεση γραμμών με Fat=Protein=Lactose=0
+        output_dir: Φάκελος εξόδου (αν None, ο φάκελος της εφαρμογής)
+        product: Product (αν None, config.DEFAULT_PRODUCT)
+        rep: Rep # (αν None, config.DEFAULT_REP)
+        instrument: Όργανο για την επιλογή zero template (προαιρετικό)
+
+    Returns:
+        str: Διαδρομή τελικού αρχείου
+    """
+    if output_dir is None:
+        output_dir = get_app_root()
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, "FINAL_OUTPUT.csv")
 
-    return assembler.output_path
+    writer = StreamingOutputWriter(
+        output_path, csv_first_4, dash_part, date, initial_time, drop_zero_nutrients,
+        product=product, rep=rep, instrument=instrument
+    )
+    return writer.write(processed_chunks)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,273 @@
+"""
+Module για τον κατάλογο (SQLite) των Excel αρχείων του BASE_PATH
+
+Κρατά για κάθε αρχείο το πρωτόκολλο, τη διαδρομή και μια φτηνή σύνοψη
+(γραμμές, εύρος a/a, πλήθος missing a/a, στήλες), ώστε η αναζήτηση
+πρωτοκόλλου να μη χρειάζεται os.listdir ή parsing. Το refresh είναι
+incremental: ξαναδιαβάζονται μόνο αρχεία με διαφορετικό size/mtime.
+
+Η ίδια βάση μπορεί να κρατά πολλούς φακέλους (π.χ. --base-path του
+batch.py)· κάθε εγγραφή έχει τον φάκελό της και όλες οι πράξεις
+περιορίζονται στον φάκελο του ProtocolCatalog.
+"""
+import os
+import json
+import time
+import sqlite3
+import pandas as pd
+from typing import List, Optional
+# Import config με fallback
+try:
+    from . import config
+    from .missing_row import MissingRowHandler
+except ImportError:
+    import config
+    from modules.missing_row import MissingRowHandler
+
+
+EXCEL_EXTENSIONS = ('.xls', '.xlsx')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workbooks (
+    path        TEXT PRIMARY KEY,
+    base_path   TEXT NOT NULL,
+    protocol    TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    rows        INTEGER,
+    aa_min      INTEGER,
+    aa_max      INTEGER,
+    missing_aa  INTEGER,
+    columns     TEXT,
+    error       TEXT,
+    scanned_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_workbooks_protocol ON workbooks(base_path, protocol);
+"""
+
+
+def folder_key(path: str) -> str:
+    """Κανονικοποιημένη απόλυτη διαδρομή φακέλου (κλειδί στη βάση)"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def summarize_workbook(file_path: str) -> dict:
+    """
+    Φτηνή σύνοψη ενός Excel: διαβάζεται ο header και μόνο η στήλη a/a
+
+    Args:
+        file_path: Διαδρομή αρχείου
+
+    Returns:
+        dict: rows, aa_min, aa_max, missing_aa, columns
+    """
+    with pd.ExcelFile(file_path) as xl:
+        header = xl.parse(nrows=0).columns.tolist()
+        if "a/a" in header:
+            aa_df = xl.parse(usecols=[header.index("a/a")])
+        else:
+            # Χωρίς a/a διαβάζουμε μία στήλη μόνο για το πλήθος γραμμών
+            aa_df = xl.parse(usecols=[0]) if header else pd.DataFrame()
+
+    summary = {
+        'rows': len(aa_df),
+        'aa_min': None,
+        'aa_max': None,
+        'missing_aa': None,
+        'columns': json.dumps([str(c) for c in header], ensure_ascii=False),
+    }
+
+    if "a/a" in aa_df.columns:
+        aa = pd.to_numeric(aa_df["a/a"], errors="coerce").dropna()
+        if not aa.empty:
+            summary['aa_min'] = int(aa.min())
+            summary['aa_max'] = int(aa.max())
+        summary['missing_aa'] = len(MissingRowHandler.find_missing_aa_numbers(aa_df))
+
+    return summary
+
+
+class ProtocolCatalog:
+    """Κλάση για τον κατάλογο πρωτοκόλλων του BASE_PATH"""
+
+    def __init__(self, base_path: str = None, db_path: str = None):
+        """
+        Args:
+            base_path: Φάκελος με τα Excel αρχεία (αν None, config.BASE_PATH)
+            db_path: Αρχείο SQLite (αν None, config.CATALOG_PATH)
+        """
+        self.base_path = base_path or config.BASE_PATH
+        self.db_path = str(db_path or config.CATALOG_PATH)
+        # Κλειδί του φακέλου στη βάση (ίδιο για σχετικές/απόλυτες διαδρομές)
+        self.folder_key = folder_key(self.base_path)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self._migrate()
+        self.conn.executescript(SCHEMA)
+
+    def _migrate(self):
+        """Καταλόγοι χωρίς στήλη base_path ξαναχτίζονται (είναι μόνο cache)"""
+        columns = [row['name'] for row in self.conn.execute("PRAGMA table_info(workbooks)")]
+        if columns and 'base_path' not in columns:
+            with self.conn:
+                self.conn.execute("DROP TABLE workbooks")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- REFRESH ----------
+
+    def refresh(self, with_summaries: bool = True) -> dict:
+        """
+        Ενημερώνει τον κατάλογο με os.scandir
+
+        Αρχεία με ίδιο size/mtime δεν ξαναδιαβάζονται· αρχεία που χάθηκαν
+        διαγράφονται από τον κατάλογο.
+
+        Args:
+            with_summaries: Αν False, καταγράφονται μόνο πρωτόκολλα/διαδρομές
+                (γρήγορο)· οι συνόψεις συμπληρώνονται σε επόμενο refresh
+
+        Returns:
+            dict: Πλήθος added, updated, removed, summarized
+        """
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'summarized': 0}
+        if not os.path.isdir(self.base_path):
+            raise FileNotFoundError(f"Ο φάκελος δεν βρέθηκε: {self.base_path}")
+
+        known = {
+            row['path']: (row['size'], row['mtime_ns'])
+            for row in self.conn.execute(
+                "SELECT path, size, mtime_ns FROM workbooks WHERE base_path = ?",
+                (self.folder_key,)
+            )
+        }
+        seen = set()
+
+        with self.conn:
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (not name.lower().endswith(EXCEL_EXTENSIONS)
+                            or name.startswith("~$") or not entry.is_file()):
+                        continue
+
+                    path = os.path.abspath(entry.path)
+                    st = entry.stat()
+                    seen.add(path)
+
+                    if known.get(path) == (st.st_size, st.st_mtime_ns):
+                        continue
+
+                    stats['updated' if path in known else 'added'] += 1
+                    # Νέο ή αλλαγμένο αρχείο: η παλιά σύνοψη δεν ισχύει πια
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO workbooks "
+                        "(path, base_path, protocol, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+                        (path, self.folder_key, os.path.splitext(name)[0],
+                         st.st_size, st.st_mtime_ns)
+                    )
+
+            removed = [path for path in known if path not in seen]
+            self.conn.executemany("DELETE FROM workbooks WHERE path = ?", [(p,) for p in removed])
+            stats['removed'] = len(removed)
+
+        if with_summaries:
+            stats['summarized'] = self._summarize_pending()
+
+        return stats
+
+    def _summarize_pending(self) -> int:
+        """Υπολογίζει σύνοψη για όσα αρχεία δεν έχουν ακόμα"""
+        pending = [
+            row['path'] for row in self.conn.execute(
+                "SELECT path FROM workbooks "
+                "WHERE base_path = ? AND rows IS NULL AND error IS NULL",
+                (self.folder_key,)
+            )
+        ]
+
+        for path in pending:
+            try:
+                summary = summarize_workbook(path)
+                summary['error'] = None
+            except Exception as e:
+                summary = {'rows': None, 'aa_min': None, 'aa_max': None,
+                           'missing_aa': None, 'columns': None, 'error': str(e)}
+
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE workbooks SET rows = :rows, aa_min = :aa_min, aa_max = :aa_max, "
+                    "missing_aa = :missing_aa, columns = :columns, error = :error, "
+                    "scanned_at = :scanned_at WHERE path = :path",
+                    {**summary, 'scanned_at': time.time(), 'path': path}
+                )
+
+        return len(pending)
+
+    # ---------- LOOKUP ----------
+
+    def lookup(self, protocol: str) -> Optional[str]:
+        """
+        Διαδρομή του αρχείου ενός πρωτοκόλλου (προτιμάται το .xls, όπως στο GUI)
+
+        Returns:
+            Optional[str]: Διαδρομή ή None αν δεν υπάρχει στον κατάλογο
+        """
+        rows = self.conn.execute(
+            "SELECT path FROM workbooks WHERE base_path = ? AND protocol = ? ORDER BY path",
+            (self.folder_key, protocol)
+        ).fetchall()
+        paths = [row['path'] for row in rows]
+        for ext in EXCEL_EXTENSIONS:
+            for path in paths:
+                if path.lower().endswith(ext):
+                    return path
+        return None
+
+    def search(self, prefix: str, limit: int = 20) -> List[dict]:
+        """
+        Πρωτόκολλα που ξεκινούν με prefix (χρησιμοποιεί το index)
+
+        Args:
+            prefix: Αρχή του αριθμού πρωτοκόλλου (π.χ. "1605")
+            limit: Μέγιστο πλήθος αποτελεσμάτων
+
+        Returns:
+            List[dict]: Εγγραφές του καταλόγου
+        """
+        rows = self.conn.execute(
+            "SELECT * FROM workbooks WHERE base_path = ? AND protocol >= ? AND protocol < ? "
+            "ORDER BY protocol LIMIT ?",
+            (self.folder_key, prefix, prefix + "\U0010ffff", limit)
+        ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def summary(self, protocol: str) -> Optional[dict]:
+        """Η εγγραφή του καταλόγου για ένα πρωτόκολλο ή None"""
+        path = self.lookup(protocol)
+        if path is None:
+            return None
+        row = self.conn.execute(
+            "SELECT * FROM workbooks WHERE base_path = ? AND path = ?", (self.folder_key, path)
+        ).fetchone()
+        return self._row_to_dict(row)
+
+    def count(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM workbooks WHERE base_path = ?", (self.folder_key,)
+        ).fetchone()[0]
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> dict:
+        data = dict(row)
+        data['columns'] = json.loads(data['columns']) if data['columns'] else []
+        return data
@@ -2,7 +2,11 @@
 Module για τη διαχείριση χρονικών δεδομένων και μεταδεδομένων δειγμάτων
 """
 import datetime
+import operator
 import random
+import numpy as np
+import pandas as pd
+from collections.abc import Sequence
 from typing import List, Tuple
 # Import config με fallback
 try:
@@ -11,6 +15,226 @@ except ImportError:
     import config
 
 
+# "HH:MM" για κάθε λεπτό της ημέρας (0..1439)
+MINUTE_LABELS = np.array([f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60)], dtype=object)
+
+
+def clock_seconds(initial_time: str) -> int:
+    """Δευτερόλεπτα από τα μεσάνυχτα για ώρα HH:MM (ValueError αν δεν είναι έγκυρη)"""
+    parsed = datetime.datetime.strptime(initial_time, "%H:%M")
+    return parsed.hour * 3600 + parsed.minute * 60
+
+
+def sample_offsets(start: int, stop: int) -> np.ndarray:
+    """
+    Δευτερόλεπτα από την αρχική ώρα για τα δείγματα start..stop-1
+
+    Κάθε δείγμα προσθέτει T_SAMPLE_INCREMENT και κάθε πλήρες batch που
+    προηγείται προσθέτει ένα zero block (ZERO_BLOCK_ROWS * T_ZERO_INCREMENT).
+    """
+    i = np.arange(start, stop, dtype=np.int64)
+    zero_block_sec = config.ZERO_BLOCK_ROWS * config.T_ZERO_INCREMENT
+    return (i + 1) * config.T_SAMPLE_INCREMENT + (i // config.BATCH_SIZE) * zero_block_sec
+
+
+def zero_offsets(start: int, stop: int) -> np.ndarray:
+    """
+    Δευτερόλεπτα από την αρχική ώρα για τις γραμμές zero start..stop-1
+    (αρίθμηση σε όλα τα blocks· block = γραμμή // ZERO_BLOCK_ROWS)
+
+    Το block b ακολουθεί τα (b + 1) * BATCH_SIZE δείγματα και τις
+    b * ZERO_BLOCK_ROWS γραμμές των προηγούμενων blocks.
+    """
+    rows = np.arange(start, stop, dtype=np.int64)
+    block = rows // config.ZERO_BLOCK_ROWS
+    return (block + 1) * config.BATCH_SIZE * config.T_SAMPLE_INCREMENT \
+        + (rows + 1) * config.T_ZERO_INCREMENT
+
+
+def format_clock(base_seconds: int, offsets: np.ndarray) -> List[str]:
+    """HH:MM για base_seconds + offsets (μετά τα μεσάνυχτα συνεχίζει από 00:00)"""
+    minutes = ((base_seconds + offsets) // 60) % (24 * 60)
+    return MINUTE_LABELS[minutes].tolist()
+
+
+class Schedule:
+    """
+    Το χρονοδιάγραμμα δειγμάτων και zero blocks σε κλειστή μορφή
+
+    Κάθε χρόνος υπολογίζεται απευθείας από τη θέση του (O(1)), χωρίς
+    λίστες, οπότε η μνήμη δεν εξαρτάται από το πλήθος δειγμάτων. Τα
+    samples/zeros συμπεριφέρονται σαν τις λίστες του generate_sample_times
+    (len, index, slicing), αλλά υπολογίζουν μόνο ό,τι ζητηθεί.
+    """
+
+    def __init__(self, initial_time: str, num_samples: int = None):
+        """
+        Args:
+            initial_time: Αρχική ώρα HH:MM
+            num_samples: Πλήθος δειγμάτων (αν None, π.χ. στο streaming, δεν
+                υπάρχουν len/end_time και τα slices θέλουν ρητό τέλος)
+        """
+        self.initial_time = initial_time
+        self.base = clock_seconds(initial_time)
+        self.num_samples = num_samples
+        self.samples = SampleTimes(self)
+        self.zeros = ZeroTimes(self)
+
+    def _total(self) -> int:
+        if self.num_samples is None:
+            raise ValueError("Το Schedule δεν έχει πλήθος δειγμάτων")
+        return self.num_samples
+
+    @property
+    def num_blocks(self) -> int:
+        """Zero blocks (ένα μετά από κάθε πλήρες batch)"""
+        return self._total() // config.BATCH_SIZE
+
+    def _label(self, offset: int) -> str:
+        return MINUTE_LABELS[((self.base + offset) // 60) % (24 * 60)]
+
+    def sample_time(self, i: int) -> str:
+        """Ο χρόνος του δείγματος i (ξεκινά από 0)"""
+        zero_block_sec = config.ZERO_BLOCK_ROWS * config.T_ZERO_INCREMENT
+        return self._label((i + 1) * config.T_SAMPLE_INCREMENT + (i // config.BATCH_SIZE) * zero_block_sec)
+
+    def zero_time(self, block: int, row: int) -> str:
+        """Ο χρόνος της γραμμής row (0..ZERO_BLOCK_ROWS-1) του zero block block"""
+        return self._label((block + 1) * config.BATCH_SIZE * config.T_SAMPLE_INCREMENT
+                           + (block * config.ZERO_BLOCK_ROWS + row + 1) * config.T_ZERO_INCREMENT)
+
+    def sample_times(self, start: int = 0, stop: int = None) -> List[str]:
+        """Οι χρόνοι των δειγμάτων start..stop-1 (vectorised)"""
+        if stop is None:
+            stop = self._total()
+        return format_clock(self.base, sample_offsets(start, stop))
+
+    def zero_block_times(self, block: int) -> List[str]:
+        """Οι ZERO_BLOCK_ROWS χρόνοι ενός zero block"""
+        first = block * config.ZERO_BLOCK_ROWS
+        return format_clock(self.base, zero_offsets(first, first + config.ZERO_BLOCK_ROWS))
+
+    def end_time(self) -> str:
+        """Ο τελευταίος χρόνος του χρονοδιαγράμματος (δείγμα ή γραμμή zero)"""
+        total = self._total()
+        return self._label(total * config.T_SAMPLE_INCREMENT
+                           + self.num_blocks * config.ZERO_BLOCK_ROWS * config.T_ZERO_INCREMENT)
+
+    def __len__(self) -> int:
+        return self._total()
+
+    def __getitem__(self, key):
+        return self.samples[key]
+
+
+class LazyColumn(Sequence):
+    """
+    Στήλη metadata που δεν κρατά λίστα τιμών
+
+    Συμπεριφέρεται σαν λίστα (len, index, slicing)· οι τιμές υλοποιούνται
+    όλες μαζί μόνο με το expand(), όταν φτιάχνεται το DataFrame του output.
+    """
+
+    def expand(self):
+        """Όλες οι τιμές (λίστα, πίνακας NumPy ή Categorical)"""
+        return self[:]
+
+
+class _TimesView(LazyColumn):
+    """Βάση για τα samples/zeros του Schedule: len, index και slicing χωρίς λίστα"""
+
+    def __init__(self, schedule: Schedule):
+        self.schedule = schedule
+
+    def _time(self, i: int) -> str:
+        raise NotImplementedError
+
+    def _times(self, start: int, stop: int) -> List[str]:
+        raise NotImplementedError
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self._time(i) for i in range(start, stop, step)]
+            return self._times(start, max(start, stop))
+
+        i = operator.index(key)
+        size = len(self)
+        if i < 0:
+            i += size
+        if not 0 <= i < size:
+            raise IndexError("Εκτός χρονοδιαγράμματος")
+        return self._time(i)
+
+
+class SampleTimes(_TimesView):
+    """Οι χρόνοι των δειγμάτων (όπως generate_sample_times()[0])"""
+
+    def __len__(self) -> int:
+        return self.schedule._total()
+
+    def _time(self, i: int) -> str:
+        return self.schedule.sample_time(i)
+
+    def _times(self, start: int, stop: int) -> List[str]:
+        return self.schedule.sample_times(start, stop)
+
+
+class ZeroTimes(_TimesView):
+    """Οι χρόνοι όλων των γραμμών zero, block μετά block (όπως generate_sample_times()[1])"""
+
+    def __len__(self) -> int:
+        return self.schedule.num_blocks * config.ZERO_BLOCK_ROWS
+
+    def _time(self, i: int) -> str:
+        return self.schedule.zero_time(*divmod(i, config.ZERO_BLOCK_ROWS))
+
+    def _times(self, start: int, stop: int) -> List[str]:
+        return format_clock(self.schedule.base, zero_offsets(start, stop))
+
+
+class ConstantColumn(LazyColumn):
+    """Η ίδια τιμή σε length γραμμές (π.χ. Product, Date)· γίνεται Categorical με μία κατηγορία"""
+
+    def __init__(self, value, length: int):
+        self.value = value
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return ConstantColumn(self.value, len(range(self.length)[key]))
+        range(self.length)[key]  # IndexError εκτός ορίων
+        return self.value
+
+    def expand(self) -> pd.Categorical:
+        codes = np.zeros(self.length, dtype=np.int8)
+        return pd.Categorical.from_codes(codes, categories=[self.value])
+
+
+class SampleIds(LazyColumn):
+    """Sample IDs ως πρόθεμα + εύρος αριθμών ("{πρόθεμα}{n}" για κάθε n του range)"""
+
+    def __init__(self, prefix: str, numbers: range):
+        self.prefix = prefix
+        self.numbers = numbers
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return SampleIds(self.prefix, self.numbers[key])
+        return f"{self.prefix}{self.numbers[key]}"
+
+    def expand(self) -> List[str]:
+        prefix = self.prefix
+        return [f"{prefix}{n}" for n in self.numbers]
+
+
 class TimeHandler:
     """Κλάση για τη διαχείριση χρονικών δεδομένων"""
     
@@ -66,8 +290,37 @@ class TimeHandler:
         except ValueError:
             print(f"❌ Λάθος μορφή. Χρησιμοποιείται προεπιλογή: {config.DEFAULT_TIME}")
             return config.DEFAULT_TIME
-    
-    def generate_sample_ids(self, csv_first_4: str, dash_part: str) -> List[str]:
+
+    @staticmethod
+    def date_from_protocol(csv_first_4: str) -> str:
+        """
+        Παράγει την ημερομηνία ανάλυσης από τα πρώτα 4 ψηφία του πρωτοκόλλου
+        (DDMM), όπως το κουμπί "Σήμερα" του GUI
+
+        Args:
+            csv_first_4: Τα πρώτα 4 ψηφία (π.χ. "1605")
+
+        Returns:
+            str: Ημερομηνία σε μορφή DD/MM/YYYY
+        """
+        return TimeHandler.format_analysis_date(f"{csv_first_4[0:2]}-{csv_first_4[2:4]}")
+
+    @staticmethod
+    def format_analysis_date(date_input: str) -> str:
+        """
+        Μετατρέπει ημερομηνία DD-MM σε DD/MM/YYYY με το τρέχον έτος
+
+        Args:
+            date_input: Ημερομηνία σε μορφή DD-MM
+
+        Returns:
+            str: Ημερομηνία σε μορφή DD/MM/YYYY
+        """
+        parsed_date = datetime.datetime.strptime(date_input, "%d-%m")
+        current_year = datetime.datetime.now().year
+        return parsed_date.replace(year=current_year).strftime("%d/%m/%Y")
+
+    def generate_sample_ids(self, csv_first_4: str, dash_part: str) -> SampleIds:
         """
         Δημιουργεί Sample IDs για όλα τα δείγματα
         
@@ -76,15 +329,24 @@ class TimeHandler:
             dash_part: Το τμήμα με παύλα
             
         Returns:
-            List[str]: Λίστα με Sample IDs
+            SampleIds: "{csv_first_4}{dash_part} 1" .. num_samples, χωρίς λίστα
         """
-        sample_ids = [
-            f"{csv_first_4}{dash_part} {i+1}" 
-            for i in range(self.num_samples)
-        ]
+        sample_ids = SampleIds(f"{csv_first_4}{dash_part} ", range(1, self.num_samples + 1))
         print(f"✅ Δημιουργήθηκαν {len(sample_ids)} Sample IDs")
         return sample_ids
     
+    def schedule(self, initial_time: str) -> Schedule:
+        """
+        Το χρονοδιάγραμμα των num_samples δειγμάτων, χωρίς λίστες
+
+        Args:
+            initial_time: Αρχική ώρα σε μορφή HH:MM
+
+        Returns:
+            Schedule: Με samples/zeros στη θέση των λιστών του generate_sample_times
+        """
+        return Schedule(initial_time, self.num_samples)
+
     def generate_sample_times(self, initial_time: str) -> Tuple[List[str], List[str]]:
         """
         Δημιουργεί χρονικά timestamps για δείγματα και zero blocks
@@ -95,64 +357,70 @@ class TimeHandler:
         Returns:
             Tuple[List[str], List[str]]: (sample_times, zero_times)
         """
-        current_time = datetime.datetime.strptime(
-            initial_time, "%H:%M"
-        ).replace(year=2000, month=1, day=1)
-        
-        sample_times = []
-        zero_times = []
-        
-        num_full_batches = self.num_samples // config.BATCH_SIZE
-        remaining_samples = self.num_samples % config.BATCH_SIZE
-        
-        # Επεξεργασία πλήρων batches
-        for _ in range(num_full_batches):
-            # Χρόνοι για δείγματα
-            for _ in range(config.BATCH_SIZE):
-                current_time += datetime.timedelta(seconds=config.T_SAMPLE_INCREMENT)
-                sample_times.append(current_time.strftime("%H:%M"))
-            
-            # Χρόνοι για zero block
-            for _ in range(config.ZERO_BLOCK_ROWS):
-                current_time += datetime.timedelta(seconds=config.T_ZERO_INCREMENT)
-                zero_times.append(current_time.strftime("%H:%M"))
-        
-        # Επεξεργασία υπολοίπων δειγμάτων
-        for _ in range(remaining_samples):
-            current_time += datetime.timedelta(seconds=config.T_SAMPLE_INCREMENT)
-            sample_times.append(current_time.strftime("%H:%M"))
+        # Όλοι οι χρόνοι μαζί: offsets σε δευτερόλεπτα και ένα lookup ανά λεπτό
+        schedule = self.schedule(initial_time)
+        sample_times = schedule.samples[:]
+        zero_times = schedule.zeros[:]
         
         print(f"✅ Δημιουργήθηκαν {len(sample_times)} sample times και "
               f"{len(zero_times)} zero times")
         
         return sample_times, zero_times
 
+    @staticmethod
+    def sample_times_range(initial_time: str, start: int, stop: int) -> List[str]:
+        """
+        Χρόνοι των δειγμάτων start..stop-1 χωρίς να υπολογιστούν τα προηγούμενα
+
+        Ίδιο αποτέλεσμα με generate_sample_times()[0][start:stop] (βλ. sample_offsets).
+        """
+        return Schedule(initial_time).sample_times(start, stop)
+
+    @staticmethod
+    def zero_block_times(initial_time: str, block: int) -> List[str]:
+        """
+        Χρόνοι του zero block με αριθμό block (ξεκινά από 0)
+
+        Ίδιο αποτέλεσμα με το αντίστοιχο τμήμα ZERO_BLOCK_ROWS του
+        generate_sample_times()[1].
+        """
+        return Schedule(initial_time).zero_block_times(block)
+
 
 class MetadataGenerator:
     """Κλάση για τη δημιουργία μεταδεδομένων"""
     
     @staticmethod
-    def generate_metadata(num_samples: int, date: str) -> dict:
+    def generate_metadata(num_samples: int, date: str, product: str = None,
+                          rep: int = None) -> dict:
         """
         Δημιουργεί όλα τα μεταδεδομένα για τα δείγματα
         
         Args:
             num_samples: Αριθμός δειγμάτων
             date: Ημερομηνία ανάλυσης
+            product: Product (αν None, config.DEFAULT_PRODUCT)
+            rep: Rep # (αν None, config.DEFAULT_REP)
             
         Returns:
-            dict: Dictionary με metadata
+            dict: Dictionary με metadata (ConstantColumn ανά στήλη)
         """
+        if product is None:
+            product = config.DEFAULT_PRODUCT
+        if rep is None:
+            rep = config.DEFAULT_REP
         return {
-            'product': [config.DEFAULT_PRODUCT] * num_samples,
-            'rep': [config.DEFAULT_REP] * num_samples,
-            'date': [date] * num_samples,
-            'remark': [""] * num_samples
+            'product': ConstantColumn(product, num_samples),
+            'rep': ConstantColumn(rep, num_samples),
+            'date': ConstantColumn(date, num_samples),
+            'remark': ConstantColumn("", num_samples)
         }
 
 
 def generate_time_metadata(df_length: int, csv_first_4: str, 
-                          dash_part: str) -> dict:
+                          dash_part: str, date: str = None,
+                          initial_time: str = None, product: str = None,
+                          rep: int = None) -> dict:
     """
     Wrapper function για δημιουργία όλων των χρονικών μεταδεδομένων
     
@@ -160,27 +428,37 @@ def generate_time_metadata(df_length: int, csv_first_4: str,
         df_length: Αριθμός γραμμών στο DataFrame
         csv_first_4: Πρώτα 4 ψηφία
         dash_part: Dash part
+        date: Ημερομηνία DD/MM/YYYY (αν None, ζητείται από τον χρήστη)
+        initial_time: Αρχική ώρα HH:MM (αν None, ζητείται από τον χρήστη)
+        product: Product (αν None, config.DEFAULT_PRODUCT)
+        rep: Rep # (αν None, config.DEFAULT_REP)
         
     Returns:
-        dict: Dictionary με όλα τα μεταδεδομένα
+        dict: Dictionary με όλα τα μεταδεδομένα· τα sample_times/zero_times
+        είναι τα samples/zeros ενός Schedule (υπολογίζονται όταν ζητηθούν)
     """
     time_handler = TimeHandler(df_length)
     
     # Λήψη ημερομηνίας και ώρας
-    date = time_handler.get_analysis_date()
-    initial_time = time_handler.get_initial_time()
+    if date is None:
+        date = time_handler.get_analysis_date()
+    if initial_time is None:
+        initial_time = time_handler.get_initial_time()
     
     # Δημιουργία IDs και χρόνων
     sample_ids = time_handler.generate_sample_ids(csv_first_4, dash_part)
-    sample_times, zero_times = time_handler.generate_sample_times(initial_time)
+    schedule = time_handler.schedule(initial_time)
+    print(f"✅ Χρονοδιάγραμμα {len(schedule.samples)} sample times και "
+          f"{len(schedule.zeros)} zero times ({initial_time} → {schedule.end_time()})")
     
     # Δημιουργία υπόλοιπων metadata
-    metadata = MetadataGenerator.generate_metadata(df_length, date)
+    metadata = MetadataGenerator.generate_metadata(df_length, date, product, rep)
     
     return {
         'sample_ids': sample_ids,
-        'sample_times': sample_times,
-        'zero_times': zero_times,
+        'sample_times': schedule.samples,
+        'zero_times': schedule.zeros,
+        'schedule': schedule,
         **metadata
     }
 
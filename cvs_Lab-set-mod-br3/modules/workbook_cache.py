@@ -0,0 +1,302 @@
+"""
+Module για on-disk cache των DataFrames που διαβάζονται από Excel
+
+Κάθε entry αποθηκεύεται ως .npz (μία στήλη ανά array) και ένα .json sidecar
+με ονόματα/dtypes στηλών και τα attrs του DataFrame. Το κλειδί είναι το
+περιεχόμενο του αρχείου (hash)·
+η αντιστοίχιση path + size + mtime -> hash (ένα μικρό .json ανά αρχείο στον
+φάκελο files/) γλιτώνει το hashing όταν το αρχείο δεν έχει αλλάξει. Παλιά
+entries διαγράφονται με LRU όταν ξεπεραστεί το όριο μεγέθους.
+
+Δεν υπάρχει κοινό index: μέγεθος και τελευταία χρήση κάθε entry είναι το
+μέγεθος και το mtime των αρχείων του, οπότε πολλές διεργασίες (π.χ. οι
+workers του batch) γράφουν ταυτόχρονα χωρίς να χάνουν η μία τις εγγραφές
+της άλλης.
+"""
+import os
+import json
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Optional
+# Import config με fallback
+try:
+    from . import config
+except ImportError:
+    import config
+
+
+class WorkbookCache:
+    """Κλάση για persistent cache parsed Excel αρχείων"""
+
+    FILES_DIR = "files"
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        """
+        Args:
+            cache_dir: Φάκελος cache (αν None, config.WORKBOOK_CACHE_PATH)
+            max_bytes: Μέγιστο μέγεθος cache (αν None, config.WORKBOOK_CACHE_MAX_MB)
+        """
+        self.cache_dir = str(cache_dir or config.WORKBOOK_CACHE_PATH)
+        if max_bytes is None:
+            max_bytes = config.WORKBOOK_CACHE_MAX_MB * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.files_dir = os.path.join(self.cache_dir, self.FILES_DIR)
+
+    # ---------- PUBLIC API ----------
+
+    def load(self, file_path: str, reader: Callable[..., pd.DataFrame] = pd.read_excel,
+             **read_kwargs) -> pd.DataFrame:
+        """
+        Επιστρέφει το DataFrame από την cache ή το διαβάζει και το αποθηκεύει
+
+        Args:
+            file_path: Διαδρομή Excel αρχείου
+            reader: Συνάρτηση ανάγνωσης (προεπιλογή pd.read_excel)
+            **read_kwargs: Παράμετροι του reader (μέρος του κλειδιού)
+
+        Returns:
+            pd.DataFrame: Το περιεχόμενο του αρχείου
+        """
+        df = self._get(file_path, read_kwargs)
+        if df is not None:
+            return df
+
+        df = reader(file_path, **read_kwargs)
+        self._put(file_path, df, read_kwargs)
+        return df
+
+    def get(self, file_path: str, **read_kwargs) -> Optional[pd.DataFrame]:
+        """Επιστρέφει το cached DataFrame ή None αν δεν υπάρχει"""
+        return self._get(file_path, read_kwargs)
+
+    def put(self, file_path: str, df: pd.DataFrame, **read_kwargs):
+        """Αποθηκεύει ένα DataFrame στην cache (best effort)"""
+        self._put(file_path, df, read_kwargs)
+
+    def clear(self):
+        """Διαγράφει όλα τα entries της cache"""
+        for entry_id in self._entries():
+            self._remove_entry(entry_id)
+        for name in self._listdir(self.files_dir):
+            self._remove(os.path.join(self.files_dir, name))
+
+    def _get(self, file_path: str, read_kwargs: dict) -> Optional[pd.DataFrame]:
+        try:
+            entry_id = self._entry_id(file_path, read_kwargs)
+            npz_path = self._entry_paths(entry_id)[0]
+            if not os.path.exists(npz_path):
+                return None
+
+            df = self._read_entry(entry_id)
+            # Η τελευταία χρήση για το LRU είναι το mtime του .npz
+            os.utime(npz_path)
+            return df
+        except FileNotFoundError:
+            return None  # Διαγράφηκε από άλλη διεργασία (eviction) στο μεταξύ
+        except Exception as e:
+            print(f"⚠️ Workbook cache: αποτυχία ανάγνωσης ({e})")
+            return None
+
+    def _put(self, file_path: str, df: pd.DataFrame, read_kwargs: dict):
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0:
+            return
+
+        try:
+            entry_id = self._entry_id(file_path, read_kwargs)
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._write_entry(entry_id, df, os.path.abspath(file_path))
+            self._evict()
+        except Exception as e:
+            print(f"⚠️ Workbook cache: αποτυχία αποθήκευσης ({e})")
+
+    # ---------- KEYS ----------
+
+    def _entry_id(self, file_path: str, read_kwargs: dict) -> str:
+        """Κλειδί entry: hash περιεχομένου + hash των παραμέτρων ανάγνωσης"""
+        content_hash = self._content_hash(file_path)
+        variant = hashlib.sha1(
+            repr(sorted(read_kwargs.items())).encode("utf-8")
+        ).hexdigest()[:8]
+        return f"{content_hash}-{variant}"
+
+    def _content_hash(self, file_path: str) -> str:
+        """
+        Hash περιεχομένου του αρχείου· αν path, size και mtime είναι ίδια
+        με την προηγούμενη φορά, επιστρέφεται το αποθηκευμένο χωρίς ανάγνωση
+        """
+        abs_path = os.path.abspath(file_path)
+        st = os.stat(abs_path)
+
+        record_path = self._file_record_path(abs_path)
+        known = self._read_json(record_path)
+        if (known and known.get('path') == abs_path and known.get('size') == st.st_size
+                and known.get('mtime_ns') == st.st_mtime_ns):
+            return known['sha1']
+
+        sha = hashlib.sha1()
+        with open(abs_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(block)
+
+        record = {
+            'path': abs_path,
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'sha1': sha.hexdigest(),
+        }
+        try:
+            os.makedirs(self.files_dir, exist_ok=True)
+            self._write_json(record_path, record)
+        except OSError:
+            pass  # Χωρίς αντιστοίχιση απλά ξαναγίνεται το hashing την επόμενη φορά
+        return record['sha1']
+
+    def _file_record_path(self, abs_path: str) -> str:
+        """Η αντιστοίχιση path -> hash ενός αρχείου (όνομα από το hash του path)"""
+        key = hashlib.sha1(os.path.normcase(abs_path).encode("utf-8")).hexdigest()
+        return os.path.join(self.files_dir, key + ".json")
+
+    # ---------- STORAGE ----------
+
+    def _entry_paths(self, entry_id: str):
+        base = os.path.join(self.cache_dir, entry_id)
+        return base + ".npz", base + ".json"
+
+    def _write_entry(self, entry_id: str, df: pd.DataFrame, source: str) -> int:
+        """Γράφει .npz + .json sidecar και επιστρέφει το μέγεθος σε bytes"""
+        npz_path, meta_path = self._entry_paths(entry_id)
+
+        arrays = {f"c{i}": df.iloc[:, i].to_numpy() for i in range(df.shape[1])}
+        meta = {
+            'columns': [str(c) for c in df.columns],
+            'dtypes': [str(t) for t in df.dtypes],
+            'rows': len(df),
+            'attrs': dict(df.attrs),
+            'source': source,
+        }
+
+        # Γράφουμε σε προσωρινά αρχεία ώστε ένα crash να μην αφήνει μισό entry·
+        # ξεχωριστά ονόματα ανά διεργασία/thread για ταυτόχρονες εγγραφές.
+        # Το .npz μπαίνει τελευταίο: η ύπαρξή του σημαίνει πλήρες entry
+        tmp_npz = self._tmp_path(npz_path)
+        tmp_meta = self._tmp_path(meta_path)
+        try:
+            with open(tmp_npz, "wb") as f:
+                np.savez(f, **arrays)
+            with open(tmp_meta, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_meta, meta_path)
+            os.replace(tmp_npz, npz_path)
+        finally:
+            for tmp_path in (tmp_npz, tmp_meta):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        return os.path.getsize(npz_path) + os.path.getsize(meta_path)
+
+    @staticmethod
+    def _tmp_path(path: str) -> str:
+        """Προσωρινό αρχείο δίπλα στο path, μοναδικό ανά διεργασία και thread"""
+        return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    def _read_entry(self, entry_id: str) -> pd.DataFrame:
+        npz_path, meta_path = self._entry_paths(entry_id)
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        # allow_pickle για στήλες object (κείμενο/μικτές τιμές)· τα αρχεία
+        # γράφονται μόνο από αυτή την κλάση μέσα στον φάκελο της εφαρμογής
+        with np.load(npz_path, allow_pickle=True) as data:
+            columns = {}
+            for i, (name, dtype) in enumerate(zip(meta['columns'], meta['dtypes'])):
+                col = pd.Series(data[f"c{i}"], name=name)
+                if str(col.dtype) != dtype:
+                    col = col.astype(dtype)
+                columns[i] = col
+
+        df = pd.DataFrame(columns)
+        df.columns = meta['columns']
+        df.attrs.update(meta.get('attrs', {}))
+        return df
+
+    def _remove_entry(self, entry_id: str):
+        # Πρώτα το .npz, ώστε το entry να μη φαίνεται πλήρες χωρίς sidecar
+        for path in self._entry_paths(entry_id):
+            self._remove(path)
+
+    # ---------- EVICTION ----------
+
+    def _entries(self) -> Dict[str, tuple]:
+        """Entry id -> (bytes, τελευταία χρήση), από τα αρχεία του φακέλου"""
+        entries = {}
+        for name in self._listdir(self.cache_dir):
+            if not name.endswith(".npz"):
+                continue
+            entry_id = name[:-4]
+            npz_path, meta_path = self._entry_paths(entry_id)
+            try:
+                st = os.stat(npz_path)
+                size = st.st_size + os.path.getsize(meta_path)
+            except FileNotFoundError:
+                continue  # Μισό ή μόλις διαγραμμένο entry
+            entries[entry_id] = (size, st.st_mtime)
+        return entries
+
+    def _evict(self):
+        """Διαγράφει τα λιγότερο πρόσφατα entries μέχρι να χωράει η cache"""
+        entries = self._entries()
+        total = sum(size for size, _ in entries.values())
+
+        for entry_id in sorted(entries, key=lambda k: entries[k][1]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[entry_id][0]
+            self._remove_entry(entry_id)
+            del entries[entry_id]
+
+        # Κρατάμε μόνο τις αντιστοιχίσεις αρχείων που δείχνουν σε ζωντανά entries
+        live = {entry_id.split("-")[0] for entry_id in entries}
+        for name in self._listdir(self.files_dir):
+            record_path = os.path.join(self.files_dir, name)
+            record = self._read_json(record_path)
+            if record is not None and record.get('sha1') not in live:
+                self._remove(record_path)
+
+    # ---------- HELPERS ----------
+
+    @staticmethod
+    def _listdir(path: str) -> list:
+        try:
+            return os.listdir(path)
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _read_json(path: str) -> Optional[dict]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_json(self, path: str, data: dict):
+        tmp_path = self._tmp_path(path)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        try:
+            os.replace(tmp_path, path)
+        except PermissionError:
+            # Σε Windows αποτυγχάνει αν άλλη διεργασία διαβάζει το αρχείο·
+            # η cache είναι best effort, οπότε απλά χάνεται αυτή η ενημέρωση
+            os.remove(tmp_path)
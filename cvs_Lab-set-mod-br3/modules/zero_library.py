@@ -0,0 +1,132 @@
+"""
+Module για τη βιβλιοθήκη zero templates ανά product/όργανο
+
+Ο φάκελος ZERO_LIBRARY_PATH έχει ένα manifest.json που αντιστοιχίζει
+κλειδιά σε αρχεία zero του ίδιου φακέλου:
+
+    {
+        "templates": {
+            "AIG NEWXX": "aig_newxx.xlsx",
+            "COW RAW": "cow_raw.xlsx",
+            "COW RAW/MS-2": "cow_raw_ms2.xlsx"
+        }
+    }
+
+Το κλειδί είναι το product ή "product/όργανο" (χωρίς διάκριση πεζών/κεφαλαίων).
+Products που δεν υπάρχουν στο manifest χρησιμοποιούν το config.ZERO_PATH.
+Τα ίδια τα templates φορτώνονται όταν ζητηθούν και μένουν στη μνήμη
+(βλ. zero_manager.load_zero_template).
+"""
+import os
+import json
+from typing import Dict, Optional
+# Import config με fallback
+try:
+    from . import config
+except ImportError:
+    import config
+
+
+def template_key(product: str, instrument: str = None) -> str:
+    """Κανονικοποιημένο κλειδί manifest: "PRODUCT" ή "PRODUCT/ΟΡΓΑΝΟ" """
+    key = " ".join(str(product).split()).upper()
+    if instrument:
+        key += "/" + " ".join(str(instrument).split()).upper()
+    return key
+
+
+class ZeroLibrary:
+    """Κλάση για την επιλογή zero template από το product ενός job"""
+
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, library_path: str = None):
+        """
+        Args:
+            library_path: Φάκελος βιβλιοθήκης (αν None, config.ZERO_LIBRARY_PATH)
+        """
+        self.library_path = str(library_path or config.ZERO_LIBRARY_PATH)
+        self.manifest_path = os.path.join(self.library_path, self.MANIFEST_FILE)
+        self._stamp = None
+        self._templates = {}
+
+    def templates(self) -> Dict[str, str]:
+        """
+        Κλειδί -> διαδρομή template από το manifest
+
+        Το manifest ξαναδιαβάζεται μόνο αν άλλαξε (size/mtime)· χωρίς manifest
+        η βιβλιοθήκη είναι κενή.
+        """
+        try:
+            st = os.stat(self.manifest_path)
+        except OSError:
+            self._stamp, self._templates = None, {}
+            return self._templates
+
+        stamp = (st.st_size, st.st_mtime_ns)
+        if stamp != self._stamp:
+            with open(self.manifest_path, "r", encoding="utf-8-sig") as f:
+                manifest = json.load(f)
+
+            entries = manifest.get('templates') if isinstance(manifest, dict) else None
+            if not isinstance(entries, dict):
+                raise ValueError(f"Το {self.manifest_path} πρέπει να έχει αντικείμενο 'templates'")
+
+            self._templates = {
+                template_key(key): os.path.join(self.library_path, file_name)
+                for key, file_name in entries.items()
+            }
+            self._stamp = stamp
+        return self._templates
+
+    def lookup(self, product: str = None, instrument: str = None) -> Optional[str]:
+        """
+        Το template του product (πρώτα για product/όργανο, μετά μόνο product)
+
+        Returns:
+            Optional[str]: Διαδρομή template ή None αν το product δεν είναι στο manifest
+
+        Raises:
+            FileNotFoundError: Αν το manifest δείχνει σε αρχείο που δεν υπάρχει
+        """
+        if not product:
+            return None
+
+        templates = self.templates()
+        keys = [template_key(product, instrument)] if instrument else []
+        keys.append(template_key(product))
+        for key in keys:
+            path = templates.get(key)
+            if path is not None:
+                if not os.path.isfile(path):
+                    raise FileNotFoundError(f"Το zero template του {key} δεν βρέθηκε: {path}")
+                return path
+        return None
+
+    def resolve(self, product: str = None, instrument: str = None) -> str:
+        """Το template του product ή, αν δεν υπάρχει στο manifest, το config.ZERO_PATH"""
+        return self.lookup(product, instrument) or str(config.ZERO_PATH)
+
+
+# Βιβλιοθήκες της διεργασίας ανά φάκελο (το manifest διαβάζεται μία φορά)
+_LIBRARIES = {}
+
+
+def zero_template_path(product: str = None, instrument: str = None,
+                       library_path: str = None) -> str:
+    """
+    Wrapper function: η διαδρομή του zero template για ένα product
+
+    Args:
+        product: Product του job (αν None, config.DEFAULT_PRODUCT)
+        instrument: Όργανο (προαιρετικό)
+        library_path: Φάκελος βιβλιοθήκης (αν None, config.ZERO_LIBRARY_PATH)
+
+    Returns:
+        str: Διαδρομή template (config.ZERO_PATH αν το product δεν έχει δικό του)
+    """
+    library_path = str(library_path or config.ZERO_LIBRARY_PATH)
+    library = _LIBRARIES.get(library_path)
+    if library is None:
+        library = _LIBRARIES[library_path] = ZeroLibrary(library_path)
+    return library.resolve(product or config.DEFAULT_PRODUCT, instrument)
@@ -1,5 +1,30 @@
+"""
+Module για τη λήψη και ανανέωση του zero.xlsx από το ZERO_REMOTE_URL
+
+Οι εκτελέσεις χρησιμοποιούν πάντα το τοπικό αντίγραφο· αν πέρασε
+ZERO_REFRESH_SECONDS από τον τελευταίο επιτυχημένο έλεγχο, ένα background
+thread κάνει conditional GET (ETag / If-Modified-Since) και, αν το αρχείο
+άλλαξε, το αντικαθιστά ατομικά (προσωρινό αρχείο + os.replace) μετά από
+έλεγχο checksum. Μόνο όταν δεν υπάρχει καθόλου τοπικό αντίγραφο η λήψη είναι
+σύγχρονη.
+
+Ο έλεγχος μετρά ως έγινε μόνο μετά από απάντηση 200/304· μια προσπάθεια που
+απέτυχε ή διακόπηκε (π.χ. η διεργασία τερμάτισε) ξαναγίνεται μετά από
+ZERO_RETRY_SECONDS. Στο τέλος της διεργασίας το thread περιμένει για λίγο
+(ZERO_DOWNLOAD_TIMEOUT) και οι workers του batch δεν ξεκινούν δικό τους έλεγχο.
+"""
 import os
+import io
+import json
+import time
+import atexit
+import base64
+import hashlib
+import zipfile
+import threading
+import multiprocessing
 import requests
+from typing import Optional
 # Import config με fallback
 try:
     from . import config
@@ -7,28 +32,251 @@ except ImportError:
     import config
 
 
-def ensure_zero_file():
+class ZeroFetcher:
+    """Κλάση για conditional, ατομική λήψη του zero.xlsx με retries"""
+
+    def __init__(self, url: str = None, zero_path: str = None, meta_path: str = None,
+                 timeout: float = None, retries: int = None, backoff: float = 0.5,
+                 session: requests.Session = None):
+        """
+        Args:
+            url: Διεύθυνση του zero.xlsx (αν None, config.ZERO_REMOTE_URL)
+            zero_path: Τοπικό αρχείο (αν None, config.ZERO_PATH)
+            meta_path: ETag/Last-Modified/checksum της τελευταίας λήψης
+                (αν None, config.ZERO_META_PATH)
+            timeout: Timeout ανά αίτημα σε δευτερόλεπτα (αν None, config.ZERO_DOWNLOAD_TIMEOUT)
+            retries: Προσπάθειες ανά λήψη (αν None, config.ZERO_DOWNLOAD_RETRIES)
+            backoff: Αναμονή πριν τη 2η προσπάθεια· διπλασιάζεται σε κάθε επόμενη
+            session: requests.Session (αν None, νέο)
+        """
+        self.url = url or config.ZERO_REMOTE_URL
+        self.zero_path = str(zero_path or config.ZERO_PATH)
+        self.meta_path = str(meta_path or config.ZERO_META_PATH)
+        self.timeout = timeout if timeout is not None else config.ZERO_DOWNLOAD_TIMEOUT
+        self.retries = max(1, retries if retries is not None else config.ZERO_DOWNLOAD_RETRIES)
+        self.backoff = backoff
+        self.session = session or requests.Session()
+
+    # ---------- ΤΟΠΙΚΟ ΑΝΤΙΓΡΑΦΟ ----------
+
+    def is_valid(self) -> bool:
+        """Υπάρχει τοπικό αντίγραφο που δεν είναι κομμένο (το .xlsx είναι zip)"""
+        if not os.path.isfile(self.zero_path):
+            return False
+        return not self.zero_path.lower().endswith(".xlsx") or zipfile.is_zipfile(self.zero_path)
+
+    def needs_refresh(self, max_age: float) -> bool:
+        """
+        Πέρασαν max_age δευτερόλεπτα από τον τελευταίο επιτυχημένο έλεγχο και
+        ZERO_RETRY_SECONDS από την τελευταία προσπάθεια (επιτυχημένη ή όχι)
+        """
+        meta = self.read_meta()
+        now = time.time()
+        return (now - meta.get('checked_at', 0) >= max_age
+                and now - meta.get('attempted_at', 0) >= config.ZERO_RETRY_SECONDS)
+
+    def read_meta(self) -> dict:
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, meta: dict):
+        os.makedirs(os.path.dirname(self.meta_path) or ".", exist_ok=True)
+        tmp_path = f"{self.meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        try:
+            os.replace(tmp_path, self.meta_path)
+        except PermissionError:
+            # Σε Windows αποτυγχάνει αν άλλη διεργασία διαβάζει το αρχείο·
+            # χάνεται μόνο αυτή η ενημέρωση
+            os.remove(tmp_path)
+
+    # ---------- ΛΗΨΗ ----------
+
+    def fetch(self) -> bool:
+        """
+        Κατεβάζει το zero.xlsx αν άλλαξε από την τελευταία λήψη
+
+        Returns:
+            bool: True αν γράφτηκε νέο αρχείο, False αν ο server απάντησε 304
+
+        Raises:
+            requests.RequestException, OSError, ValueError: αν απέτυχαν όλες οι
+                προσπάθειες (το τοπικό αρχείο μένει όπως ήταν)
+        """
+        meta = self.read_meta()
+        headers = {}
+        # Conditional GET μόνο αν το τοπικό αρχείο είναι έγκυρο
+        if self.is_valid():
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        # Καταγραφή της προσπάθειας πριν το αίτημα, ώστε άλλες διεργασίες να μην
+        # την επαναλάβουν αμέσως· το checked_at γράφεται μόνο μετά από 200/304
+        meta['attempted_at'] = time.time()
+        self._write_meta(meta)
+
+        error = None
+        for attempt in range(self.retries):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                response = self.session.get(self.url, headers=headers, timeout=self.timeout)
+                if response.status_code == 304:
+                    meta['checked_at'] = time.time()
+                    meta.pop('error', None)
+                    self._write_meta(meta)
+                    return False
+                response.raise_for_status()
+
+                content = response.content
+                self._verify(response, content)
+                self._replace(content)
+
+                meta.update({
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'sha256': hashlib.sha256(content).hexdigest(),
+                    'bytes': len(content),
+                    'fetched_at': time.time(),
+                    'checked_at': time.time(),
+                })
+                meta.pop('error', None)
+                self._write_meta(meta)
+                return True
+
+            except (OSError, ValueError) as e:
+                # Τα requests.RequestException είναι OSError
+                error = e
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                if status is not None and status < 500:
+                    break  # 4xx: δεν έχει νόημα νέα προσπάθεια
+
+        meta['error'] = str(error)
+        self._write_meta(meta)
+        raise error
+
+    def _verify(self, response: requests.Response, content: bytes):
+        """Ελέγχει μέγεθος, MD5 (Content-MD5 ή ETag του storage) και ότι το .xlsx είναι zip"""
+        length = response.headers.get('Content-Length')
+        if length is not None and length.isdigit() and int(length) != len(content):
+            raise ValueError(f"Ελλιπής λήψη: {len(content)} από {length} bytes")
+
+        expected = None
+        if response.headers.get('Content-MD5'):
+            expected = base64.b64decode(response.headers['Content-MD5']).hex()
+        else:
+            etag = (response.headers.get('ETag') or "").removeprefix("W/").strip('"').lower()
+            if len(etag) == 32 and all(c in "0123456789abcdef" for c in etag):
+                expected = etag
+        if expected is not None and hashlib.md5(content).hexdigest() != expected:
+            raise ValueError("Λάθος checksum στο zero.xlsx που κατέβηκε")
+
+        if self.zero_path.lower().endswith(".xlsx") and not zipfile.is_zipfile(io.BytesIO(content)):
+            raise ValueError("Το zero.xlsx που κατέβηκε δεν είναι έγκυρο .xlsx")
+
+    def _replace(self, content: bytes):
+        """Γράφει σε προσωρινό αρχείο στον ίδιο φάκελο και το μετονομάζει ατομικά"""
+        zero_dir = os.path.dirname(self.zero_path) or "."
+        os.makedirs(zero_dir, exist_ok=True)
+        tmp_path = f"{self.zero_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.zero_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+# Ένα refresh thread ανά διεργασία
+_refresh_lock = threading.Lock()
+_refresh_thread = None
+_exit_hook = False
+
+
+def refresh_in_background(fetcher: ZeroFetcher = None,
+                          max_age: float = None) -> Optional[threading.Thread]:
     """
-    Ελέγχει αν υπάρχει το zero.xlsx.
-    Αν δεν υπάρχει → το κατεβάζει από Supabase.
+    Ξεκινά έλεγχο/λήψη του zero.xlsx σε background thread, αν χρειάζεται
+
+    Args:
+        fetcher: ZeroFetcher (αν None, με τις ρυθμίσεις του config)
+        max_age: Δευτερόλεπτα από τον τελευταίο έλεγχο (αν None,
+            config.ZERO_REFRESH_SECONDS· 0 = χωρίς ανανέωση)
+
+    Returns:
+        Optional[threading.Thread]: Το thread, ή None αν δεν χρειάζεται έλεγχος
+            (ή αν η διεργασία είναι worker· ο έλεγχος γίνεται από την κύρια)
     """
-    zero_path = config.ZERO_PATH
-    zero_dir = os.path.dirname(zero_path)
+    global _refresh_thread, _exit_hook
+    if max_age is None:
+        max_age = config.ZERO_REFRESH_SECONDS
+    if not max_age or multiprocessing.parent_process() is not None:
+        return None
 
-    # Αν υπάρχει, τελειώσαμε
-    if os.path.exists(zero_path):
-        return zero_path
+    with _refresh_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return _refresh_thread
 
-    # Αν δεν υπάρχει → download
-    os.makedirs(zero_dir, exist_ok=True)
+        fetcher = fetcher or ZeroFetcher()
+        if not fetcher.needs_refresh(max_age):
+            return None
+
+        _refresh_thread = threading.Thread(
+            target=_refresh, args=(fetcher,), name="zero-refresh", daemon=True
+        )
+        _refresh_thread.start()
+        if not _exit_hook:
+            atexit.register(_wait_for_refresh)
+            _exit_hook = True
+        return _refresh_thread
 
-    print("⬇️  Κατέβασμα zero.xlsx από Supabase...")
 
-    r = requests.get(config.ZERO_REMOTE_URL, timeout=10)
-    r.raise_for_status()
+def _wait_for_refresh():
+    """Στο τέλος της διεργασίας: περιμένει το refresh thread για λίγο (όχι επ' αόριστον)"""
+    thread = _refresh_thread
+    if thread is not None and thread.is_alive():
+        thread.join(timeout=config.ZERO_DOWNLOAD_TIMEOUT)
 
-    with open(zero_path, "wb") as f:
-        f.write(r.content)
 
+def _refresh(fetcher: ZeroFetcher):
+    try:
+        fetcher.fetch()
+    except Exception:
+        # Το σφάλμα καταγράφεται στο meta· οι εκτελέσεις συνεχίζουν με το τοπικό αντίγραφο
+        pass
+
+
+def ensure_zero_file(zero_path: str = None, refresh: bool = True) -> str:
+    """
+    Επιστρέφει το τοπικό zero.xlsx χωρίς αναμονή για το δίκτυο
+
+    Αν υπάρχει έγκυρο αντίγραφο επιστρέφεται αμέσως και (αν refresh) ελέγχεται
+    στο παρασκήνιο για νεότερη έκδοση. Αν δεν υπάρχει (ή είναι κομμένο), το
+    κατεβάζει από Supabase πριν επιστρέψει.
+
+    Args:
+        zero_path: Τοπικό αρχείο (αν None, config.ZERO_PATH)
+        refresh: Έλεγχος για νεότερη έκδοση στο παρασκήνιο
+
+    Returns:
+        str: Διαδρομή του zero.xlsx
+    """
+    fetcher = ZeroFetcher(zero_path=zero_path)
+    if fetcher.is_valid():
+        if refresh:
+            refresh_in_background(fetcher)
+        return fetcher.zero_path
+
+    print("⬇️  Κατέβασμα zero.xlsx από Supabase...")
+    fetcher.fetch()
     print("✅ zero.xlsx αποθηκεύτηκε")
-    return zero_path
+    return fetcher.zero_path
@@ -2,25 +2,150 @@
 Module για τη διαχείριση zero calibration data
 """
 import os
+import re
 import pandas as pd
-from typing import List
+from typing import List, Sequence
 # Import config με fallback
 try:
     from . import config
     from .zero_loader import ensure_zero_file
+    from .workbook_cache import WorkbookCache
+    from .zero_library import zero_template_path
 except ImportError:
     import config
     from modules.zero_loader import ensure_zero_file
+    from modules.workbook_cache import WorkbookCache
+    from modules.zero_library import zero_template_path
 
 
+# Zero templates της διεργασίας: path -> ((size, mtime_ns), DataFrame χωρίς ημερομηνία)
+_TEMPLATES = {}
+
+
+def load_zero_template(zero_path: str, use_cache: bool = None) -> pd.DataFrame:
+    """
+    Το zero template όπως διαβάζεται από το zero.xlsx, πριν μπει ημερομηνία
+
+    Κρατιέται στη μνήμη της διεργασίας όσο δεν αλλάζουν size/mtime του
+    αρχείου· αλλιώς διαβάζεται από τη WorkbookCache (κλειδί το hash του
+    περιεχομένου), οπότε το Excel γίνεται parse μόνο την πρώτη φορά.
+
+    Args:
+        zero_path: Διαδρομή του zero.xlsx
+        use_cache: Χρήση της on-disk cache (αν None, config.USE_WORKBOOK_CACHE)
+
+    Returns:
+        pd.DataFrame: Αντίγραφο του template (μπορεί να τροποποιηθεί)
+    """
+    abs_path = os.path.abspath(zero_path)
+    st = os.stat(abs_path)
+    stamp = (st.st_size, st.st_mtime_ns)
+
+    cached = _TEMPLATES.get(abs_path)
+    if cached is None or cached[0] != stamp:
+        if use_cache is None:
+            use_cache = getattr(config, 'USE_WORKBOOK_CACHE', True)
+        raw = WorkbookCache().load(abs_path) if use_cache else pd.read_excel(abs_path)
+
+        # Καθαρισμός (ίδιος για κάθε ημερομηνία)
+        template = raw.fillna("")
+        # Αφαίρεση τελευταίας στήλης αν χρειάζεται
+        template = template.dropna(axis=1, how="all")
+        template['Date'] = template['Date'].astype(str)
+
+        cached = _TEMPLATES[abs_path] = (stamp, template)
+
+    return cached[1].copy()
+
+
+class ZeroBlockTemplate:
+    """
+    Ένα zero block ως κείμενο CSV με θέσεις για την ημερομηνία και τους χρόνους
+
+    Το template γίνεται to_csv μία φορά με σημάδια στα κελιά Date (όσα δεν
+    είναι κενά) και Time (γραμμές ZERO_ROW_INDEX)· κάθε block παράγεται με
+    αντικατάσταση των σημαδιών, χωρίς DataFrame και χωρίς to_csv.
+    """
+
+    _SLOT = re.compile(r"\x00(D|T\d+)\x00")
+
+    def __init__(self, template: pd.DataFrame):
+        """
+        Args:
+            template: Το zero template (βλ. load_zero_template), χωρίς ημερομηνία
+        """
+        marked = template.copy()
+        marked.loc[marked['Date'].str.strip() != '', 'Date'] = "\x00D\x00"
+        marked.loc[config.ZERO_ROW_INDEX, 'Time'] = [
+            f"\x00T{i}\x00" for i in range(len(config.ZERO_ROW_INDEX))
+        ]
+        text = marked.to_csv(header=False, index=False, lineterminator="\n")
+
+        # Εναλλάξ σταθερό κείμενο και όνομα θέσης: [κείμενο, θέση, κείμενο, ...]
+        pieces = self._SLOT.split(text)
+        self.literals = pieces[0::2]
+        self.slots = [None if slot == "D" else int(slot[1:]) for slot in pieces[1::2]]
+
+    def render(self, date: str, times: Sequence[str]) -> str:
+        """
+        Το CSV ενός zero block (χωρίς header)
+
+        Args:
+            date: Ημερομηνία ανάλυσης
+            times: Οι ZERO_BLOCK_ROWS χρόνοι του block (για τις γραμμές ZERO_ROW_INDEX)
+        """
+        out = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            out.append(date if slot is None else times[slot])
+            out.append(literal)
+        return "".join(out)
+
+
+class ZeroBlocks(Sequence):
+    """
+    Τα zero blocks ενός αρχείου ως κείμενο CSV, που παράγεται όταν ζητηθεί
+
+    Στη θέση της λίστας DataFrames του create_zero_copies/update_zero_times·
+    το block i παίρνει τους χρόνους zero_times[i * ZERO_BLOCK_ROWS:(i + 1) * ZERO_BLOCK_ROWS].
+    """
+
+    def __init__(self, template: ZeroBlockTemplate, date: str, zero_times: Sequence[str],
+                 count: int):
+        self.template = template
+        self.date = date
+        self.zero_times = zero_times
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, block):
+        if isinstance(block, slice):
+            return [self[i] for i in range(*block.indices(self.count))]
+        block = range(self.count)[block]  # IndexError εκτός ορίων
+        start = block * config.ZERO_BLOCK_ROWS
+        return self.template.render(self.date, self.zero_times[start:start + config.ZERO_BLOCK_ROWS])
+
 
 class ZeroDataManager:
     """Κλάση για τη διαχείριση zero calibration data"""
     
     def __init__(self, zero_path: str = None):
         self.zero_path = zero_path or config.ZERO_PATH
+        self.template = None
         self.zero_df = None
         self.zero_copies = []
+
+    @classmethod
+    def for_product(cls, product: str = None, instrument: str = None) -> "ZeroDataManager":
+        """
+        ZeroDataManager με το zero template του product (βλ. zero_library)
+
+        Args:
+            product: Product του job (αν None, config.DEFAULT_PRODUCT)
+            instrument: Όργανο (προαιρετικό)
+        """
+        return cls(zero_template_path(product, instrument))
     
     def load_zero_data(self, date: str) -> pd.DataFrame:
         """
@@ -32,19 +157,19 @@ class ZeroDataManager:
         Returns:
             pd.DataFrame: Zero DataFrame
         """
-        if not os.path.exists(self.zero_path):
+        if os.path.abspath(self.zero_path) == os.path.abspath(config.ZERO_PATH):
+            # Το τοπικό αντίγραφο αμέσως· νεότερη έκδοση ελέγχεται στο παρασκήνιο
+            self.zero_path = ensure_zero_file()
+        elif not os.path.exists(self.zero_path):
             print(f"Το αρχείο zero δεν βρέθηκε: {self.zero_path}")
             print("Αυτόματη λήψη....")
             self.zero_path = ensure_zero_file()
 
-        # Φόρτωση και καθαρισμός
-        self.zero_df = pd.read_excel(self.zero_path).fillna("")
-        
-        # Αφαίρεση τελευταίας στήλης αν χρειάζεται
-        self.zero_df = self.zero_df.dropna(axis=1, how="all")
+        # Καθαρισμένο template από cache (Excel parsing μόνο την πρώτη φορά)
+        self.template = load_zero_template(self.zero_path)
 
         # Ενημέρωση ημερομηνίας
-        self.zero_df['Date'] = self.zero_df['Date'].astype(str)
+        self.zero_df = self.template.copy()
         self.zero_df.loc[self.zero_df['Date'].str.strip() != '', 'Date'] = date
         
         print(f"✅ Φορτώθηκε zero DataFrame με {len(self.zero_df)} γραμμές")
@@ -67,12 +192,13 @@ class ZeroDataManager:
         print(f"✅ Δημιουργήθηκαν {len(self.zero_copies)} zero DataFrames")
         return self.zero_copies
     
-    def update_zero_times(self, zero_times: List[str]) -> List[pd.DataFrame]:
+    def update_zero_times(self, zero_times: Sequence[str]) -> List[pd.DataFrame]:
         """
         Ενημερώνει τους χρόνους σε όλα τα zero DataFrames
         
         Args:
-            zero_times: Λίστα με χρόνους για όλα τα zero blocks
+            zero_times: Χρόνοι για όλα τα zero blocks (λίστα ή Schedule.zeros,
+                οπότε υπολογίζονται μόνο οι χρόνοι κάθε block)
             
         Returns:
             List[pd.DataFrame]: Ενημερωμένα zero DataFrames
@@ -94,6 +220,29 @@ class ZeroDataManager:
         print(f"✅ Ενημερώθηκαν χρόνοι σε {len(self.zero_copies)} zero blocks")
         return self.zero_copies
     
+    def block_template(self) -> ZeroBlockTemplate:
+        """Το zero block ως CSV template (μετά το load_zero_data)"""
+        if self.template is None:
+            raise ValueError("Πρέπει να φορτώσετε πρώτα το zero data με load_zero_data()")
+        return ZeroBlockTemplate(self.template)
+
+    def create_zero_blocks(self, num_blocks: int, date: str,
+                           zero_times: Sequence[str]) -> ZeroBlocks:
+        """
+        Τα zero blocks ως κείμενο CSV από ένα template (χωρίς αντίγραφα DataFrame)
+
+        Args:
+            num_blocks: Πλήθος zero blocks
+            date: Ημερομηνία ανάλυσης
+            zero_times: Χρόνοι για όλα τα zero blocks (λίστα ή Schedule.zeros)
+
+        Returns:
+            ZeroBlocks: Το CSV κάθε block, όταν ζητηθεί
+        """
+        blocks = ZeroBlocks(self.block_template(), date, zero_times, num_blocks)
+        print(f"✅ Zero block template για {num_blocks} zero blocks")
+        return blocks
+
     def get_zero_copies(self) -> List[pd.DataFrame]:
         """Επιστρέφει τα zero DataFrames"""
         return self.zero_copies
@@ -124,41 +273,46 @@ class ZeroDataManager:
         
         return info
     
-    def save_zero_csv(self, output_dir: str):
+    def save_zero_csv(self, output_dir: str = None):
+        output_dir = output_dir or config.CSV_PATH
         os.makedirs(output_dir, exist_ok=True)
 
         output_path = os.path.join(output_dir, "zero.csv")
-        self.zero_df.to_csv(output_path, headers=True, index=False)
+        self.zero_df.to_csv(output_path, header=True, index=False)
         print(f"✅ Αποθηκεύτηκε zero CSV: {output_path}")
 
 
 def prepare_zero_data(total_samples: int, date: str, 
-                     zero_times: List[str]) -> List[pd.DataFrame]:
+                     zero_times: Sequence[str], output_dir: str = None,
+                     product: str = None, instrument: str = None) -> ZeroBlocks:
     """
     Wrapper function για πλήρη προετοιμασία zero data
     
     Args:
         total_samples: Συνολικός αριθμός δειγμάτων
         date: Ημερομηνία ανάλυσης
-        zero_times: Λίστα με χρόνους για zero blocks
+        zero_times: Χρόνοι για zero blocks (λίστα ή Schedule.zeros)
+        output_dir: Φάκελος για το zero.csv (αν None, config.CSV_PATH)
+        product: Product για την επιλογή zero template (αν None, config.DEFAULT_PRODUCT)
+        instrument: Όργανο για την επιλογή zero template (προαιρετικό)
         
     Returns:
-        List[pd.DataFrame]: Λίστα με ενημερωμένα zero DataFrames
+        ZeroBlocks: Το CSV κάθε zero block (για το FinalOutputAssembler)
     """
-    manager = ZeroDataManager()
+    manager = ZeroDataManager.for_product(product, instrument)
     
     # Υπολογισμός πόσα zero blocks χρειάζονται
     zero_info = manager.calculate_zero_count(total_samples)
     
     # Φόρτωση και προετοιμασία
     manager.load_zero_data(date)
-    manager.create_zero_copies(zero_info['zero_count'])
-    manager.update_zero_times(zero_times)
+    # Αρχεία με λιγότερα από BATCH_SIZE δείγματα δεν έχουν zero blocks
+    blocks = manager.create_zero_blocks(zero_info['zero_count'], date, zero_times)
     
     # Αποθήκευση zero CSV
-    manager.save_zero_csv()
+    manager.save_zero_csv(output_dir)
     
-    return manager.get_zero_copies()
+    return blocks
 
 
 if __name__ == "__main__":
@@ -12,14 +12,15 @@ import subprocess
 import random
 import re
 from pathlib import Path
-import glob
 
 # Προσθήκη του parent directory στο path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import modules
 from modules.data_loader import DataLoader
-from modules.data_processor import process_data
+from modules.background_loader import BackgroundExcelLoader
+from modules.header_validator import InvalidWorkbookError, format_verdict
+from modules.data_processor import process_data, write_decimal_report, write_duplicate_report
 from modules.time_handler import TimeHandler, MetadataGenerator
 from modules.zero_manager import prepare_zero_data
 from modules.output_generator import generate_output
@@ -55,10 +56,16 @@ class CSVLabGUI:
         self.csv_first_4 = None
         self.dash_part = None
         self.processed_df = None
+        self.decimal_report_path = None
+        self.duplicate_report_path = None
         self.processing_start_time = None
 
         self._setup_ui()
 
+        # Φόρτωση Excel εκτός main thread
+        self.background_loader = BackgroundExcelLoader(self.root)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
         # Log initial message
         self._log("✅ CSV Lab εκκίνησε επιτυχώς!")
         self.excel_file_path = None
@@ -186,9 +193,20 @@ class CSVLabGUI:
         )
         self.selected_file_label.grid(row=0, column=1, padx=10, pady=5, sticky=tk.W)
 
-        ttk.Button(file_frame, text="🔍 Αναζήτηση", command=self._browse_file).grid(
-            row=0, column=2, padx=5
+        self.browse_btn = ttk.Button(file_frame, text="🔍 Αναζήτηση", command=self._browse_file)
+        self.browse_btn.grid(row=0, column=2, padx=5)
+
+        # Πρόοδος φόρτωσης
+        self.load_progress = ttk.Progressbar(file_frame, mode='determinate', maximum=100)
+        self.load_progress.grid(row=1, column=0, columnspan=2, sticky=tk.EW, pady=(10, 0))
+
+        self.cancel_load_btn = ttk.Button(
+            file_frame, text="✖ Ακύρωση", command=self._cancel_load, state=tk.DISABLED
         )
+        self.cancel_load_btn.grid(row=1, column=2, padx=5, pady=(10, 0))
+
+        self.load_status_label = ttk.Label(file_frame, text="", font=("Segoe UI", 9))
+        self.load_status_label.grid(row=2, column=0, columnspan=3, sticky=tk.W)
 
         file_frame.grid_columnconfigure(1, weight=1)
 
@@ -325,13 +343,12 @@ class CSVLabGUI:
 
         try:
             loader = DataLoader()
-            excel_file = os.path.join(loader.base_path, f"{protocol}.xlsx")
+            excel_file = loader.find_protocol_file(protocol)
 
-            if not os.path.exists(excel_file):
-                messagebox.showerror("Σφάλμα", f"Αρχείο δεν βρέθηκε: {excel_file}")
+            if excel_file is None:
+                messagebox.showerror("Σφάλμα", f"Αρχείο δεν βρέθηκε: {protocol}")
                 return
 
-            import pandas as pd
             import re
 
             dash_regx = r"(-\d+)"
@@ -341,33 +358,40 @@ class CSVLabGUI:
                 messagebox.showerror("Σφάλμα", "Μη έγκυρος αριθμός")
                 return
 
-            self.excel_df = pd.read_excel(excel_file)
-            self.csv_first_4 = protocol[:4]
-            self.dash_part = result.group()
-            ok = self._fill_missing_aa_in_df()
-            if not ok:
-                messagebox.showinfo("Ακύρωση", "Ακυρώθηκε η συμπλήρωση των missing a/a. Δεν έγινε φόρτωση.")
-                self.excel_df = None
-                return
-
-            info = f"""
-                        Αρχείο: {protocol}.xls
-                        Γραμμές: {len(self.excel_df)}
-                        Στήλες: {', '.join(self.excel_df.columns.tolist())}
-                     """
-
-            self.file_info_text.config(state=tk.NORMAL)
-            self.file_info_text.delete(1.0, tk.END)
-            self.file_info_text.insert(1.0, info)
-            self.file_info_text.config(state=tk.DISABLED)
-
-            self._log(f"✅ Φορτώθηκε: {protocol}.xls ({len(self.excel_df)} γραμμές)")
-            messagebox.showinfo("Επιτυχία", f"Φορτώθηκε: {len(self.excel_df)} γραμμές")
+            self._start_background_load(
+                excel_file,
+                lambda df: self._on_protocol_loaded(df, protocol, result.group())
+            )
 
         except Exception as e:
             messagebox.showerror("Σφάλμα", str(e))
             self._log(f"❌ {str(e)}")
 
+    def _on_protocol_loaded(self, df, protocol, dash_part):
+        """Ολοκλήρωση του _load_file όταν τελειώσει η φόρτωση (main thread)"""
+        self.excel_df = df
+        self.csv_first_4 = protocol[:4]
+        self.dash_part = dash_part
+        ok = self._fill_missing_aa_in_df()
+        if not ok:
+            messagebox.showinfo("Ακύρωση", "Ακυρώθηκε η συμπλήρωση των missing a/a. Δεν έγινε φόρτωση.")
+            self.excel_df = None
+            return
+
+        info = f"""
+                    Αρχείο: {protocol}.xls
+                    Γραμμές: {len(self.excel_df)}
+                    Στήλες: {', '.join(self.excel_df.columns.tolist())}
+                 """
+
+        self.file_info_text.config(state=tk.NORMAL)
+        self.file_info_text.delete(1.0, tk.END)
+        self.file_info_text.insert(1.0, info)
+        self.file_info_text.config(state=tk.DISABLED)
+
+        self._log(f"✅ Φορτώθηκε: {protocol}.xls ({len(self.excel_df)} γραμμές)")
+        messagebox.showinfo("Επιτυχία", f"Φορτώθηκε: {len(self.excel_df)} γραμμές")
+
     def _browse_file(self):
         filename = filedialog.askopenfilename(
             title="Επιλογή Αρχείου",
@@ -376,7 +400,6 @@ class CSVLabGUI:
         if not filename:
             return
 
-        self.excel_file_path = filename
         protocol = Path(filename).stem
 
         dash_regx = r"(-\d+)"
@@ -386,14 +409,20 @@ class CSVLabGUI:
             messagebox.showerror("Σφάλμα", "Μη έγκυρο όνομα αρχείου (π.χ. 1010xxxx-12.xlsx)")
             return
 
+        self._start_background_load(
+            filename,
+            lambda df: self._on_browsed_file_loaded(df, filename, protocol, result.group())
+        )
+
+    def _on_browsed_file_loaded(self, df, filename, protocol, dash_part):
+        """Ολοκλήρωση του _browse_file όταν τελειώσει η φόρτωση (main thread)"""
         try:
-            loader = DataLoader()
-            self.excel_df = loader.load_excel(filename)
+            self.excel_df = df
+            self.excel_file_path = filename
 
             self.csv_first_4 = protocol[:4]
-            self.dash_part = result.group()
+            self.dash_part = dash_part
 
-            # missing aa
             # missing aa
             ok = self._fill_missing_aa_in_df()
             if not ok:
@@ -402,21 +431,12 @@ class CSVLabGUI:
                     "Ακυρώθηκε η συμπλήρωση των missing a/a.\n\nΘες να συνεχίσουμε με το αρχικό αρχείο;"
                 )
                 if not go_on:
-                    self.excel_df = None
-                    self.excel_file_path = None
-                    self.csv_first_4 = None
-                    self.dash_part = None
-                    self.selected_file_label.config(text="(κανένα)")
-
-                    self.file_info_text.config(state=tk.NORMAL)
-                    self.file_info_text.delete("1.0", tk.END)
-                    self.file_info_text.config(state=tk.DISABLED)
+                    self._reset()
                     return
 
                 # αν πατήσει Ναι -> συνεχίζουμε κανονικά, χωρίς insert missing rows
                 self._log("⚠️ Συνεχίζω χωρίς συμπλήρωση missing a/a (user επέλεξε Ναι).")
 
-
             # ενημέρωση label
             self.selected_file_label.config(text=os.path.basename(filename))
 
@@ -444,12 +464,79 @@ class CSVLabGUI:
 
             self._log(f"✅ Φορτώθηκε: {protocol} ({len(self.excel_df)} γραμμές)")
 
-            # προαιρετικά: κόψε το popup (αφού τα βλέπεις όλα ήδη)
-            # messagebox.showinfo("Επιτυχία", f"Φορτώθηκε: {protocol} ({len(self.excel_df)} γραμμές)")
-
         except Exception as e:
             messagebox.showerror("Σφάλμα", str(e))
 
+    # ---------- BACKGROUND LOADING ----------
+
+    def _start_background_load(self, file_path, on_loaded):
+        """
+        Ξεκινά τη φόρτωση στο background· το on_loaded καλείται με το DataFrame
+
+        Ο γρήγορος έλεγχος header (VALIDATE_BEFORE_PARSE) γίνεται κι αυτός στο
+        worker thread· τα χαλασμένα αρχεία απορρίπτονται πριν το parsing.
+        """
+        self.browse_btn.config(state=tk.DISABLED)
+        self.cancel_load_btn.config(state=tk.NORMAL)
+        self.load_progress.config(mode='determinate', value=0)
+        self.load_status_label.config(text=f"⏳ Φόρτωση {os.path.basename(file_path)}...")
+        self._log(f"⏳ Φόρτωση: {os.path.basename(file_path)}")
+
+        def on_done(df):
+            self._finish_background_load(f"✅ {len(df)} γραμμές")
+            on_loaded(df)
+
+        def on_verdict(verdict):
+            for warning in verdict['warnings']:
+                self._log(f"⚠️ {warning}")
+
+        def on_error(error):
+            if isinstance(error, InvalidWorkbookError):
+                self._finish_background_load("❌ Μη έγκυρο αρχείο")
+                messagebox.showerror("Μη έγκυρο αρχείο", format_verdict(error.verdict))
+                self._log(f"❌ Μη έγκυρο αρχείο: {error}")
+                return
+            self._finish_background_load("❌ Σφάλμα φόρτωσης")
+            messagebox.showerror("Σφάλμα", str(error))
+            self._log(f"❌ {error}")
+
+        def on_cancel():
+            self._finish_background_load("✖ Ακυρώθηκε")
+            self._log("✖ Η φόρτωση ακυρώθηκε")
+
+        self.background_loader.start(
+            file_path, on_done, on_error,
+            on_progress=self._on_load_progress, on_cancel=on_cancel,
+            on_verdict=on_verdict
+        )
+
+    def _on_load_progress(self, done, total):
+        if total:
+            if str(self.load_progress.cget('mode')) != 'determinate':
+                self.load_progress.stop()
+                self.load_progress.config(mode='determinate')
+            self.load_progress.config(value=min(100.0, 100.0 * done / total))
+            self.load_status_label.config(text=f"⏳ {done}/{total} γραμμές")
+        else:
+            # Άγνωστο σύνολο γραμμών (π.χ. xlsx χωρίς διαστάσεις φύλλου)
+            if str(self.load_progress.cget('mode')) != 'indeterminate':
+                self.load_progress.config(mode='indeterminate')
+                self.load_progress.start()
+            self.load_status_label.config(text=f"⏳ {done} γραμμές")
+
+    def _finish_background_load(self, status):
+        self.load_progress.stop()
+        self.load_progress.config(mode='determinate', value=100 if status.startswith("✅") else 0)
+        self.load_status_label.config(text=status)
+        self.browse_btn.config(state=tk.NORMAL)
+        self.cancel_load_btn.config(state=tk.DISABLED)
+
+    def _cancel_load(self):
+        self.background_loader.cancel()
+
+    def _on_close(self):
+        self.background_loader.shutdown()
+        self.root.destroy()
 
     def _set_analysis_day(self):
         if not self.csv_first_4 or len(self.csv_first_4) < 4:
@@ -495,24 +582,14 @@ class CSVLabGUI:
 
 
 
-    #HELPER    
-    def cleanup_parts(self,parts_dir: str):
-        if not parts_dir or not os.path.exists(parts_dir):
-            return
-        for fp in glob.glob(os.path.join(parts_dir, "p*.csv")):
-            try:
-                os.remove(fp)
-            except Exception as e:
-                print(f"⚠️ Δεν μπόρεσα να διαγράψω {fp}: {e}")
-
-
-
     def _process_data(self):
         """Επεξεργασία"""
         try:
             self._log("⚡ Έναρξη...")
 
-            self.processed_df = process_data(self.excel_df)
+            decimal_reports, duplicate_reports = [], []
+            self.processed_df = process_data(self.excel_df, decimal_reports,
+                                             duplicate_reports=duplicate_reports)
 
             time_handler = TimeHandler(len(self.processed_df))
             date = self.date_entry.get().strip()
@@ -522,14 +599,14 @@ class CSVLabGUI:
             formatted_date = parsed_date.replace(year=datetime.now().year).strftime("%d/%m/%Y")
 
             sample_ids = time_handler.generate_sample_ids(self.csv_first_4, self.dash_part)
-            sample_times, zero_times = time_handler.generate_sample_times(initial_time)
+            schedule = time_handler.schedule(initial_time)
 
             metadata = MetadataGenerator.generate_metadata(len(self.processed_df), formatted_date)
             metadata['sample_ids'] = sample_ids
-            metadata['sample_times'] = sample_times
-            metadata['zero_times'] = zero_times
+            metadata['sample_times'] = schedule.samples
+            metadata['zero_times'] = schedule.zeros
 
-            zero_dfs = prepare_zero_data(len(self.processed_df), formatted_date, zero_times)
+            zero_dfs = prepare_zero_data(len(self.processed_df), formatted_date, schedule.zeros)
             
             final_path = generate_output(
                 self.processed_df,
@@ -537,10 +614,20 @@ class CSVLabGUI:
                 zero_dfs,
                 drop_zero_nutrients=self.drop_zero_var.get()              
             )
-            
-            # ✅ cleanup ΜΟΝΟ σε success
-            self.cleanup_parts(config.PARTS_PATH)
-            self._log("🧹 Καθαρίστηκαν τα parts (p*.csv)")
+
+            self.decimal_report_path = write_decimal_report(
+                decimal_reports, os.path.dirname(final_path)
+            )
+            if self.decimal_report_path:
+                errors = sum(len(r) for r in decimal_reports)
+                self._log(f"⚠️ {errors} σφάλματα δεκαδικών → {self.decimal_report_path}")
+
+            self.duplicate_report_path = write_duplicate_report(
+                duplicate_reports, os.path.dirname(final_path)
+            )
+            if self.duplicate_report_path:
+                count = sum(len(r) for r in duplicate_reports)
+                self._log(f"⚠️ {count} διπλές γραμμές / διπλά a/a → {self.duplicate_report_path}")
 
             # Calculate duration
             duration = (datetime.now() - self.processing_start_time).total_seconds()
@@ -568,6 +655,10 @@ class CSVLabGUI:
 📄 Αρχείο: {final_path}
 📊 Δείγματα: {len(self.processed_df)}
         """
+        if self.decimal_report_path:
+            results += f"⚠️ Σφάλματα δεκαδικών: {self.decimal_report_path}\n"
+        if self.duplicate_report_path:
+            results += f"⚠️ Διπλές γραμμές / διπλά a/a: {self.duplicate_report_path}\n"
 
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
@@ -589,6 +680,7 @@ class CSVLabGUI:
             os.startfile(config.FINAL_OUTPUT_PATH)
 
     def _reset(self):
+        self.background_loader.cancel()
         self.excel_df = None
         self.excel_file_path = None
         self.csv_first_4 = None